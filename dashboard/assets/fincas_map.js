@@ -0,0 +1,22 @@
+/* Funciones de estilo del mapa de fincas (dash-leaflet).
+ *
+ * Se referencian desde Python como {"variable": "agriMap.fincas.style"}.
+ * Los colores y la finca resaltada llegan por la prop `hideout` del
+ * dl.GeoJSON, de modo que un cambio visual solo envía ese diccionario
+ * pequeño y no vuelve a serializar las geometrías.
+ */
+window.agriMap = Object.assign({}, window.agriMap, {
+    fincas: {
+        style: function (feature, context) {
+            var h = (context && context.hideout) || {};
+            var selected = h.selected != null && feature.id === h.selected;
+            var color = selected ? h.selectedColor : h.color;
+            return {
+                color: color,
+                fillColor: color,
+                weight: selected ? h.weight + 1 : h.weight,
+                fillOpacity: selected ? h.fillOpacity * 2 : h.fillOpacity
+            };
+        }
+    }
+});
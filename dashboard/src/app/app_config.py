@@ -3,6 +3,7 @@ Configuración centralizada de la aplicación Dash
 Separación de responsabilidades para mejor mantenimiento
 """
 
+import sys
 import dash
 import dash_bootstrap_components as dbc
 from pathlib import Path
@@ -53,6 +54,66 @@ AGRI_THEME = {
     }
 }
 
+# Servidores de teselas que piden las capas base activas al cargar los mapas
+# (satélite de Esri y calles de CARTO, subdominio "a" de {s}); destino de los
+# resource hints de INDEX_STRING
+TILE_HOSTS = {
+    'satellite': "https://server.arcgisonline.com",
+    'streets': "https://a.basemaps.cartocdn.com",
+}
+
+# Capas base servidas por CDN (HTTP/2, sin la limitación de tile.openstreetmap.org)
+MAP_TILES = {
+    'streets': {
+        'url': "https://{s}.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}{r}.png",
+        'attribution': "© OpenStreetMap contributors © CARTO",
+    },
+    'satellite': {
+        'url': f"{TILE_HOSTS['satellite']}/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}",
+        'attribution': "Tiles © Esri — Source: Esri, Maxar, Earthstar Geographics",
+    },
+}
+
+# Opciones de TileLayer que limitan las peticiones de teselas al desplazar el mapa
+TILE_LAYER_OPTIONS = {
+    'maxNativeZoom': 19,
+    'maxZoom': 22,
+    'updateWhenIdle': True,
+    'keepBuffer': 2,
+}
+# Tesela satelital (zoom 12) del centro por defecto de los mapas de fincas y
+# detecciones, [37.2387, -3.6712]: zona de Granada, al oeste de Benalúa
+CENTRAL_SATELLITE_TILE = (
+    f"{TILE_HOSTS['satellite']}/ArcGIS/rest/services/World_Imagery/MapServer/tile/12/1590/2006"
+)
+
+# Plantilla HTML con resource hints para que el navegador abra la conexión
+# con los servidores de teselas en paralelo a la carga inicial de la página.
+# Sin crossorigin: Leaflet pide las teselas como <img> sin CORS y solo
+# reutiliza conexiones abiertas en ese mismo modo
+INDEX_STRING = f"""<!DOCTYPE html>
+<html>
+    <head>
+        {{%metas%}}
+        <title>{{%title%}}</title>
+        {{%favicon%}}
+        <link rel="preconnect" href="{TILE_HOSTS['satellite']}">
+        <link rel="dns-prefetch" href="{TILE_HOSTS['satellite']}">
+        <link rel="preconnect" href="{TILE_HOSTS['streets']}">
+        <link rel="dns-prefetch" href="{TILE_HOSTS['streets']}">
+        <link rel="preload" as="image" href="{CENTRAL_SATELLITE_TILE}">
+        {{%css%}}
+    </head>
+    <body>
+        {{%app_entry%}}
+        <footer>
+            {{%config%}}
+            {{%scripts%}}
+            {{%renderer%}}
+        </footer>
+    </body>
+</html>"""
+
 # Configuración de las tabs del dashboard
 DASHBOARD_TABS = [
     {
@@ -105,6 +166,39 @@ def create_dash_app():
     
     return app
 
+# Registro de estilos canónicos compartidos entre componentes
+_STYLE_INTERN = {}
+
+def intern_style(style):
+    """
+    Devuelve la instancia canónica de un diccionario de estilos
+    
+    Los layouts repiten los mismos estilos en decenas de componentes; al
+    compartir una única instancia por contenido se reduce la memoria de los
+    árboles de componentes cacheados. Dash no muta las props, por lo que
+    compartir el diccionario es seguro.
+    
+    Args:
+        style: Diccionario de estilos CSS (valores hashables)
+    
+    Returns:
+        dict: Instancia compartida con el mismo contenido
+    """
+    key = frozenset(style.items())
+    return _STYLE_INTERN.setdefault(key, style)
+
+def intern_class(class_name):
+    """
+    Interna una cadena className para compartirla entre componentes
+    
+    Args:
+        class_name: Clases CSS separadas por espacios
+    
+    Returns:
+        str: Cadena internada
+    """
+    return sys.intern(class_name)
+
 def get_tab_style():
     """
     Obtiene estilos consistentes para las tabs con diseño moderno
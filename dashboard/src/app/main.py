@@ -9,13 +9,16 @@ Fichero: src.app.main.py
 # Imports
 import os
 import sys
+import json
+import hashlib
 import logging
 from pathlib import Path
-from flask import send_from_directory
+from flask import Response, request, send_from_directory
 import dash
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
+from plotly.utils import PlotlyJSONEncoder
 
 
 # Añadir directorio raíz al path para imports
@@ -47,6 +50,14 @@ from src.app.data_loader import load_data, load_kml
 from src.integrations.telegram_sync import TelegramDataSync
 
 from src.layouts.app_layout import create_main_layout
+from src.app.app_config import INDEX_STRING
+
+# Compresión gzip de las respuestas (dependencia opcional: dash[compress])
+try:
+    import flask_compress  # noqa: F401
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 
 
 def initialize_data():
@@ -82,6 +93,36 @@ def initialize_data():
         logger.error(f"❌ Error cargando datos: {e}")
         return None, {}
 
+def install_preserialized_layout(app, layout_factory):
+    """
+    Sirve /_dash-layout desde un JSON pre-serializado
+    
+    El layout principal solo depende de datos cargados al arrancar, así que
+    se construye y serializa una vez en lugar de recorrer el árbol de
+    componentes en cada visita. La respuesta lleva un ETag con el hash del
+    JSON: el navegador la revalida y, si no ha cambiado, recibe un 304 sin
+    cuerpo.
+    
+    Args:
+        app: Aplicación Dash ya creada
+        layout_factory: Callable sin argumentos que devuelve el layout
+    """
+    cache = {}
+
+    def serve_layout():
+        if "json" not in cache:
+            body = json.dumps(layout_factory(), cls=PlotlyJSONEncoder).encode("utf-8")
+            cache["json"] = body
+            cache["etag"] = hashlib.sha1(body).hexdigest()
+        response = Response(cache["json"], mimetype="application/json")
+        response.set_etag(cache["etag"])
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    endpoint = app.config.routes_pathname_prefix + "_dash-layout"
+    app.server.view_functions[endpoint] = serve_layout
+
+
 def create_dashboard():
     """
     Crea y configura completamente el dashboard refactorizado
@@ -100,11 +141,20 @@ def create_dashboard():
         __name__,
         external_stylesheets=[dbc.themes.FLATLY],
         suppress_callback_exceptions=True,
-        assets_folder=str(ASSETS_PATH)
+        assets_folder=str(ASSETS_PATH),
+        compress=COMPRESS_AVAILABLE
     )
     
     app.title = "Dashboard Agricultura"
     
+    # Plantilla con preconnect/preload de teselas para acelerar el primer mapa
+    app.index_string = INDEX_STRING
+    
+    if COMPRESS_AVAILABLE:
+        logger.info("✅ Compresión gzip activada para layout y callbacks")
+    else:
+        logger.warning("⚠️ flask-compress no instalado: respuestas sin comprimir")
+    
     # Configurar servido estático para overlays satelitales
     dynamic_map_dir = os.path.abspath("dynamic_map")
     os.makedirs(dynamic_map_dir, exist_ok=True)
@@ -115,8 +165,9 @@ def create_dashboard():
     
     logger.info(f"✅ Servido estático configurado para /dynamic_map/ -> {dynamic_map_dir}")
     
-    # Layout principal usando create_main_layout
+    # Layout principal usando create_main_layout (servido pre-serializado)
     app.layout = lambda: create_main_layout(df, kml_geojson)
+    install_preserialized_layout(app, app.layout)
     logger.info("✅ Layout principal configurado usando create_main_layout")
 
     # Registrar callbacks de forma explícita y forzando reload (evita imports rancios)
@@ -35,13 +35,20 @@ import json
 
 # Framework Dash
 import dash
-from dash import Input, Output, State, ctx, no_update, html, dcc
+from dash import Input, Output, State, Patch, ctx, no_update, html, dcc
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 
+# Configuración de la aplicación
+from src.app.app_config import MAP_TILES
+
+# Componentes compartidos con el layout
+from src.layouts.layout_fincas_improved import EMPTY_FINCAS_MSG
+
 # Utilidades específicas del proyecto
 from src.utils.finca_store import (
     add_finca, list_fincas, get_finca, update_finca, delete_finca,
-    calculate_polygon_area_hectares
+    calculate_polygon_area_hectares, get_store_version
 )
 
 # Configuración de logging
@@ -51,9 +58,9 @@ logger = logging.getLogger(__name__)
 #                            CONFIGURACIÓN DE MAPAS
 # ===============================================================================
 
-# URLs de servicios de mapas base
-OSM_URL = "https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png"  # OpenStreetMap - Vista de calles
-ESRI_URL = "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}"  # ESRI - Vista satelital
+# URLs de servicios de mapas base (compartidas con el layout de fincas)
+OSM_URL = MAP_TILES['streets']['url']     # OpenStreetMap (CDN de CARTO) - Vista de calles
+ESRI_URL = MAP_TILES['satellite']['url']  # ESRI - Vista satelital
 
 
 
@@ -110,6 +117,84 @@ def _center_zoom_from_polygon(geometry):
         return [37.2387, -3.6712], 12
 
 
+def _feature_bbox(geometry):
+    """
+    Calcula la caja envolvente (lon/lat) de una geometría Polygon o MultiPolygon.
+    
+    Args:
+        geometry (dict): Geometría GeoJSON
+        
+    Returns:
+        tuple|None: (min_lon, min_lat, max_lon, max_lat) o None si no es válida
+    """
+    if not geometry:
+        return None
+    
+    geom_type = geometry.get("type")
+    coords = geometry.get("coordinates") or []
+    
+    if geom_type == "Polygon":
+        rings = coords[:1]
+    elif geom_type == "MultiPolygon":
+        rings = [polygon[0] for polygon in coords if polygon]
+    else:
+        return None
+    
+    points = [point for ring in rings for point in ring]
+    if not points:
+        return None
+    
+    lons = [p[0] for p in points]
+    lats = [p[1] for p in points]
+    return min(lons), min(lats), max(lons), max(lats)
+
+
+def _cull_features_to_bounds(features, bounds):
+    """
+    Filtra las fincas cuya caja envolvente intersecta la vista actual del mapa.
+    
+    Reduce el GeoJSON enviado al navegador (y los polígonos que Leaflet
+    tiene que dibujar) a las fincas visibles.
+    
+    Args:
+        features (list): Features GeoJSON de las fincas
+        bounds (list): Límites del mapa [[sur, oeste], [norte, este]]
+        
+    Returns:
+        list: Features visibles (todas si los límites no son válidos)
+    """
+    try:
+        (south, west), (north, east) = bounds
+    except (TypeError, ValueError):
+        return features
+    
+    visible = []
+    for feature in features:
+        bbox = _feature_bbox(feature.get("geometry"))
+        if bbox is None:
+            continue
+        min_lon, min_lat, max_lon, max_lat = bbox
+        if min_lon <= east and max_lon >= west and min_lat <= north and max_lat >= south:
+            visible.append(feature)
+    return visible
+
+
+def _ui_patch(key, value):
+    """
+    Crea una actualización parcial de store-fincas-ui que solo toca una clave.
+
+    Args:
+        key (str): Clave del estado de UI ('geometria', 'edit_target', 'delete_target')
+        value: Nuevo valor (None para limpiar)
+
+    Returns:
+        Patch: Parche aplicable como salida del store
+    """
+    ui_patch = Patch()
+    ui_patch[key] = value
+    return ui_patch
+
+
 # ===============================================================================
 #                        FUNCIÓN PRINCIPAL DE REGISTRO
 # ===============================================================================
@@ -141,7 +226,19 @@ def register_callbacks(app):
     #                          TOGGLE DE VISTA DE MAPA
     # ===============================================================================
     
-    @app.callback(
+    # Alterna entre vista de calles y satelital directamente en el navegador:
+    # es un cambio puramente visual y no necesita ida y vuelta al servidor.
+    app.clientside_callback(
+        f"""
+        function(nCalles, nSatelite) {{
+            const triggered = dash_clientside.callback_context.triggered;
+            const propId = triggered.length ? triggered[0].prop_id : "";
+            if (propId.startsWith("btn-vista-satelite")) {{
+                return [{json.dumps(ESRI_URL)}, "outline-primary", "primary"];
+            }}
+            return [{json.dumps(OSM_URL)}, "primary", "outline-primary"];
+        }}
+        """,
         [
             Output("capa-base", "url"),
             Output("btn-vista-calles", "color"),
@@ -153,25 +250,6 @@ def register_callbacks(app):
         ],
         prevent_initial_call=True
     )
-    def toggle_map_view(n_calles, n_satelite):
-        """
-        Alterna entre vista de calles y vista satelital del mapa base.
-        
-        Args:
-            n_calles (int): Número de clics en botón de vista de calles
-            n_satelite (int): Número de clics en botón de vista satelital
-            
-        Returns:
-            tuple: (url_mapa, color_btn_calles, color_btn_satelite)
-        """
-        triggered_button = ctx.triggered_id
-        
-        if triggered_button == "btn-vista-satelite":
-            # Activar vista satelital
-            return ESRI_URL, "outline-primary", "primary"
-        else:
-            # Activar vista de calles (por defecto)
-            return OSM_URL, "primary", "outline-primary"
 
     # ===============================================================================
     #                       CAPTURA DE DIBUJO Y VALIDACIÓN
@@ -179,14 +257,15 @@ def register_callbacks(app):
     
     @app.callback(
         [
-            Output("store-geometria-actual", "data"),
+            Output("store-fincas-ui", "data"),
             Output("btn-guardar-finca", "disabled"),
         ],
         [
             Input("finca-draw-control", "geojson"),
             Input("input-nombre-finca", "value"),
         ],
-        prevent_initial_call=False
+        # El botón nace deshabilitado y sin geometría: nada que validar al montar
+        prevent_initial_call=True
     )
     def on_draw_or_name_change(geojson, nombre):
         """
@@ -203,7 +282,7 @@ def register_callbacks(app):
             nombre (str): Nombre ingresado para la finca
             
         Returns:
-            tuple: (geometria_almacenada, boton_deshabilitado)
+            tuple: (parche de store-fincas-ui con la geometría, boton_deshabilitado)
         """
         geom_store = None
         
@@ -231,7 +310,7 @@ def register_callbacks(app):
         # Validar completitud: geometría Y nombre requeridos
         disabled = not (geom_store and nombre and str(nombre).strip())
         
-        return geom_store, disabled
+        return _ui_patch("geometria", geom_store), disabled
 
     # ===============================================================================
     #                            GUARDADO DE FINCA
@@ -241,18 +320,18 @@ def register_callbacks(app):
         [
             Output("store-fincas-data", "data", allow_duplicate=True),
             Output("input-nombre-finca", "value", allow_duplicate=True),
-            Output("store-geometria-actual", "data", allow_duplicate=True),
+            Output("store-fincas-ui", "data", allow_duplicate=True),
             Output("finca-draw-control", "geojson", allow_duplicate=True),
             Output("finca-feedback", "children", allow_duplicate=True),
         ],
         Input("btn-guardar-finca", "n_clicks"),
         [
-            State("store-geometria-actual", "data"),
+            State("store-fincas-ui", "data"),
             State("input-nombre-finca", "value"),
         ],
         prevent_initial_call=True
     )
-    def guardar_finca(n, geom, nombre):
+    def guardar_finca(n, ui_state, nombre):
         """
         Procesa el guardado de una nueva finca con validaciones completas.
         
@@ -265,7 +344,7 @@ def register_callbacks(app):
         
         Args:
             n (int): Número de clics en botón guardar
-            geom (dict): Geometría almacenada temporalmente
+            ui_state (dict): Estado de UI con la geometría dibujada ('geometria')
             nombre (str): Nombre de la finca a guardar
             
         Returns:
@@ -275,6 +354,8 @@ def register_callbacks(app):
         if not n:
             return no_update, no_update, no_update, no_update, no_update
         
+        geom = (ui_state or {}).get("geometria")
+        
         # Validar geometría
         if not geom or not geom.get("geometry"):
             warn = dbc.Alert(
@@ -296,7 +377,10 @@ def register_callbacks(app):
             nueva_finca = add_finca(name=nombre.strip(), geometry=geom["geometry"])
             
             # Preparar estado post-guardado
-            timestamp_update = {"ts": datetime.datetime.now().isoformat()}
+            timestamp_update = {
+                "ts": datetime.datetime.now().isoformat(),
+                "version": get_store_version()
+            }
             empty_geojson = {"type": "FeatureCollection", "features": []}
             success_alert = dbc.Alert(
                 f"✅ Finca '{nombre.strip()}' guardada correctamente.", 
@@ -304,7 +388,7 @@ def register_callbacks(app):
             )
             
             # Limpiar formulario y actualizar vistas
-            return timestamp_update, "", None, empty_geojson, success_alert
+            return timestamp_update, "", _ui_patch("geometria", None), empty_geojson, success_alert
 
         except Exception as e:
             logger.exception("Error crítico guardando finca")
@@ -314,6 +398,71 @@ def register_callbacks(app):
             )
             return no_update, no_update, no_update, no_update, error_alert
 
+    # ===============================================================================
+    #                  DETECCIÓN DE CAMBIOS EN EL ALMACENAMIENTO
+    # ===============================================================================
+
+    # El sondeo solo corre mientras la pestaña está visible: al montar la
+    # vista se registra un listener de visibilitychange que activa o desactiva
+    # el intervalo, y que se retira solo cuando la vista de fincas ya no está
+    # en el DOM (lista-fincas-gestion sirve de marca de montaje).
+    app.clientside_callback(
+        """
+        function(_id) {
+            if (window._fincasVisibilityListener) {
+                document.removeEventListener("visibilitychange", window._fincasVisibilityListener);
+            }
+            const listener = function() {
+                if (!document.getElementById("lista-fincas-gestion")) {
+                    document.removeEventListener("visibilitychange", listener);
+                    window._fincasVisibilityListener = null;
+                    return;
+                }
+                dash_clientside.set_props("interval-fincas-update", {
+                    disabled: document.visibilityState !== "visible"
+                });
+            };
+            window._fincasVisibilityListener = listener;
+            document.addEventListener("visibilitychange", listener);
+            return document.visibilityState !== "visible";
+        }
+        """,
+        Output("interval-fincas-update", "disabled"),
+        Input("interval-fincas-update", "id")
+    )
+
+    @app.callback(
+        Output("store-fincas-data", "data", allow_duplicate=True),
+        Input("interval-fincas-update", "n_intervals"),
+        State("store-fincas-data", "data"),
+        prevent_initial_call=True
+    )
+    def comprobar_cambios_fincas(_n, current_stamp):
+        """
+        Propaga un refresco solo cuando el almacenamiento de fincas ha cambiado.
+        
+        El intervalo de sondeo ya no dispara directamente la capa, las
+        métricas y los listados: este callback compara la versión del
+        archivo de fincas con la última enviada al cliente y solo actualiza
+        store-fincas-data (el único disparador de las vistas) si difiere.
+        
+        Args:
+            _n (int): Intervalos transcurridos (no utilizado directamente)
+            current_stamp (dict): Último estado enviado al cliente
+            
+        Returns:
+            dict: Nuevo timestamp y versión del almacenamiento
+            
+        Raises:
+            PreventUpdate: Si las fincas no han cambiado desde el último refresco
+        """
+        version = get_store_version()
+        
+        if current_stamp and current_stamp.get("version") == version:
+            raise PreventUpdate
+        
+        return {"ts": datetime.datetime.now().isoformat(), "version": version}
+
     # ===============================================================================
     #                     ACTUALIZACIÓN DE CAPA Y MÉTRICAS
     # ===============================================================================
@@ -325,11 +474,12 @@ def register_callbacks(app):
         ],
         [
             Input("store-fincas-data", "data"),
-            Input("interval-fincas-update", "n_intervals"),
+            Input("mapa-fincas", "bounds"),
         ],
+        # Arranque en frío intencionado: primera carga de la capa y las métricas
         prevent_initial_call=False
     )
-    def actualizar_capa_y_metricas(_stamp, _n):
+    def actualizar_capa_y_metricas(_stamp, bounds):
         """
         Actualiza la capa GeoJSON del mapa y las métricas de resumen.
         
@@ -337,11 +487,11 @@ def register_callbacks(app):
         • Número total de fincas registradas
         • Superficie total en hectáreas
         • Superficie de la finca más grande
-        • Preparación de features para visualización
+        • Preparación de features visibles en la vista actual del mapa
         
         Args:
             _stamp (dict): Timestamp de actualización (no utilizado directamente)
-            _n (int): Intervalos transcurridos (no utilizado directamente)
+            bounds (list): Límites visibles del mapa [[sur, oeste], [norte, este]]
             
         Returns:
             tuple: (geojson_collection, metricas_html)
@@ -350,8 +500,16 @@ def register_callbacks(app):
             # Cargar todas las fincas desde almacenamiento
             fincas = list_fincas()
             
-            # Preparar features para capa GeoJSON
-            features = list(fincas)
+            # Enviar solo las fincas visibles en la vista actual
+            features = _cull_features_to_bounds(fincas, bounds)
+            geojson_collection = {
+                "type": "FeatureCollection", 
+                "features": features
+            }
+            
+            # Un desplazamiento del mapa no cambia las métricas globales
+            if ctx.triggered_id == "mapa-fincas":
+                return geojson_collection, no_update
             
             # Calcular métricas agregadas
             total_area = 0.0
@@ -403,11 +561,6 @@ def register_callbacks(app):
             ], className="mb-3")
 
             # Retornar colección GeoJSON y métricas
-            geojson_collection = {
-                "type": "FeatureCollection", 
-                "features": features
-            }
-            
             return geojson_collection, metrics
 
         except Exception as e:
@@ -428,13 +581,11 @@ def register_callbacks(app):
     
     @app.callback(
         Output("lista-fincas-gestion", "children"),
-        [
-            Input("store-fincas-data", "data"),
-            Input("interval-fincas-update", "n_intervals"),
-        ],
+        Input("store-fincas-data", "data"),
+        # Arranque en frío intencionado: primera carga de la lista
         prevent_initial_call=False
     )
-    def refrescar_lista(_stamp, _n):
+    def refrescar_lista(_stamp):
         """
         Genera lista interactiva de fincas con opciones de gestión.
         
@@ -446,7 +597,6 @@ def register_callbacks(app):
         
         Args:
             _stamp (dict): Timestamp de actualización (no utilizado directamente)
-            _n (int): Intervalos transcurridos (no utilizado directamente)
             
         Returns:
             list|Alert: Lista de tarjetas o alerta si no hay datos
@@ -457,10 +607,7 @@ def register_callbacks(app):
             
             # Estado vacío - mostrar mensaje informativo
             if not fincas:
-                return dbc.Alert(
-                    "No hay fincas registradas. Dibuja y guarda tu primera finca.", 
-                    color="info"
-                )
+                return EMPTY_FINCAS_MSG
 
             # Construir tarjetas para cada finca
             items = []
@@ -528,13 +675,11 @@ def register_callbacks(app):
     
     @app.callback(
         Output("tabla-fincas-registradas", "children"),
-        [
-            Input("store-fincas-data", "data"),
-            Input("interval-fincas-update", "n_intervals"),
-        ],
+        Input("store-fincas-data", "data"),
+        # Arranque en frío intencionado (solo si el layout incluye la tabla)
         prevent_initial_call=False
     )
-    def refrescar_tabla(_stamp, _n):
+    def refrescar_tabla(_stamp):
         """
         Genera tabla simple de fincas para compatibilidad con layouts antiguos.
         
@@ -545,7 +690,6 @@ def register_callbacks(app):
         
         Args:
             _stamp (dict): Timestamp de actualización (no utilizado directamente)
-            _n (int): Intervalos transcurridos (no utilizado directamente)
             
         Returns:
             ListGroup|Alert: Lista de elementos o alerta si no hay datos
@@ -597,6 +741,7 @@ def register_callbacks(app):
         [
             Output("mapa-fincas", "center"),
             Output("mapa-fincas", "zoom"),
+            Output("fincas-existentes-layer", "hideout"),
         ],
         Input({"type": "btn-ir-finca", "index": dash.ALL}, "n_clicks"),
         prevent_initial_call=True
@@ -609,16 +754,17 @@ def register_callbacks(app):
         • Calcular centro geométrico de la finca
         • Determinar nivel de zoom óptimo
         • Ajustar vista para mostrar toda la geometría
+        • Resaltar la finca vía `hideout` (sin reenviar el GeoJSON)
         
         Args:
             n_clicks_list (list): Lista de clics en botones "Ver en mapa"
             
         Returns:
-            tuple: (centro, zoom) o no_update si no hay acción
+            tuple: (centro, zoom, parche de hideout) o no_update si no hay acción
         """
         # Verificar si hay clics válidos
         if not n_clicks_list or not any(n_clicks_list):
-            return no_update, no_update
+            return no_update, no_update, no_update
             
         # Identificar botón activado
         triggered_button = ctx.triggered_id
@@ -633,9 +779,12 @@ def register_callbacks(app):
                 # Calcular centro y zoom óptimos
                 center, zoom = _center_zoom_from_polygon(finca["geometry"])
                 logger.debug(f"Centrando mapa en finca {finca_id}: {center}, zoom {zoom}")
-                return center, zoom
+                
+                hideout = Patch()
+                hideout["selected"] = finca_id
+                return center, zoom, hideout
         
-        return no_update, no_update
+        return no_update, no_update, no_update
 
     # ===============================================================================
     #                          MODAL DE EDICIÓN
@@ -645,16 +794,15 @@ def register_callbacks(app):
         [
             Output("modal-editar-finca", "is_open"),
             Output("input-nuevo-nombre-finca", "value"),
-            Output("store-edit-target", "data"),
+            Output("store-fincas-ui", "data", allow_duplicate=True),
         ],
         [
             Input({"type": "btn-editar-finca", "index": dash.ALL}, "n_clicks"),
             Input("modal-editar-cancelar", "n_clicks"),
         ],
-        State("store-edit-target", "data"),
         prevent_initial_call=True
     )
-    def abrir_modal_editar(n_clicks_list, cancelar, current_target):
+    def abrir_modal_editar(n_clicks_list, cancelar):
         """
         Controla la apertura y cierre del modal de edición de fincas.
         
@@ -667,10 +815,9 @@ def register_callbacks(app):
         Args:
             n_clicks_list (list): Lista de clics en botones "Editar"
             cancelar (int): Clics en botón cancelar
-            current_target (dict): Datos de finca actualmente en edición
             
         Returns:
-            tuple: (modal_abierto, nombre_actual, datos_objetivo)
+            tuple: (modal_abierto, nombre_actual, parche con 'edit_target')
         """
         triggered_button = ctx.triggered_id
         
@@ -680,7 +827,7 @@ def register_callbacks(app):
             
         # Cancelar edición - cerrar modal y limpiar
         if triggered_button == "modal-editar-cancelar":
-            return False, "", None
+            return False, "", _ui_patch("edit_target", None)
 
         # Procesar clic en botón editar
         if (isinstance(triggered_button, dict) and 
@@ -709,7 +856,7 @@ def register_callbacks(app):
                     "nombre_original": nombre_actual
                 }
                 
-                return True, nombre_actual, target_data
+                return True, nombre_actual, _ui_patch("edit_target", target_data)
                 
             except Exception as e:
                 logger.exception(f"Error abriendo modal de edición para finca {finca_id}")
@@ -722,16 +869,16 @@ def register_callbacks(app):
             Output("finca-feedback", "children", allow_duplicate=True),
             Output("modal-editar-finca", "is_open", allow_duplicate=True),
             Output("store-fincas-data", "data", allow_duplicate=True),
-            Output("store-edit-target", "data", allow_duplicate=True),
+            Output("store-fincas-ui", "data", allow_duplicate=True),
         ],
         Input("modal-editar-confirmar", "n_clicks"),
         [
             State("input-nuevo-nombre-finca", "value"),
-            State("store-edit-target", "data"),
+            State("store-fincas-ui", "data"),
         ],
         prevent_initial_call=True
     )
-    def confirmar_edicion(n, nuevo_nombre, target):
+    def confirmar_edicion(n, nuevo_nombre, ui_state):
         """
         Procesa la confirmación de edición de una finca.
         
@@ -745,11 +892,13 @@ def register_callbacks(app):
         Args:
             n (int): Número de clics en confirmar
             nuevo_nombre (str): Nuevo nombre para la finca
-            target (dict): Datos de la finca objetivo
+            ui_state (dict): Estado de UI con la finca objetivo ('edit_target')
             
         Returns:
-            tuple: Estados actualizados para feedback, modal, store y target
+            tuple: Estados actualizados para feedback, modal, store y estado de UI
         """
+        target = (ui_state or {}).get("edit_target")
+        
         # Validar precondiciones
         if not n or not target or not target.get("id"):
             return no_update, no_update, no_update, no_update
@@ -773,7 +922,7 @@ def register_callbacks(app):
                 "ℹ️ No se realizaron cambios.", 
                 color="info", duration=2500
             )
-            return info_alert, False, no_update, None
+            return info_alert, False, no_update, _ui_patch("edit_target", None)
 
         try:
             # Cargar finca actual desde almacenamiento
@@ -783,7 +932,7 @@ def register_callbacks(app):
                     "❌ No se encontró la finca.", 
                     color="danger", duration=3500
                 )
-                return error_alert, False, no_update, None
+                return error_alert, False, no_update, _ui_patch("edit_target", None)
                 
             # Aplicar actualización de nombre y timestamp
             finca["properties"]["name"] = nuevo_nombre
@@ -799,9 +948,12 @@ def register_callbacks(app):
                 f"✅ Finca renombrada de '{nombre_original}' a '{nuevo_nombre}'.", 
                 color="success", duration=4000
             )
-            timestamp_update = {"ts": datetime.datetime.now().isoformat()}
+            timestamp_update = {
+                "ts": datetime.datetime.now().isoformat(),
+                "version": get_store_version()
+            }
             
-            return success_alert, False, timestamp_update, None
+            return success_alert, False, timestamp_update, _ui_patch("edit_target", None)
             
         except Exception as e:
             logger.exception(f"Error crítico actualizando finca {finca_id}")
@@ -819,16 +971,15 @@ def register_callbacks(app):
         [
             Output("modal-confirmacion-eliminar", "is_open"),
             Output("modal-confirmacion-contenido", "children"),
-            Output("store-delete-target", "data"),
+            Output("store-fincas-ui", "data", allow_duplicate=True),
         ],
         [
             Input({"type": "btn-eliminar-finca", "index": dash.ALL}, "n_clicks"),
             Input("modal-cancelar", "n_clicks"),
         ],
-        State("store-delete-target", "data"),
         prevent_initial_call=True
     )
-    def abrir_modal_eliminar(n_clicks_list, cancelar, current_target):
+    def abrir_modal_eliminar(n_clicks_list, cancelar):
         """
         Controla el modal de confirmación para eliminación de fincas.
         
@@ -841,10 +992,9 @@ def register_callbacks(app):
         Args:
             n_clicks_list (list): Lista de clics en botones "Eliminar"
             cancelar (int): Clics en botón cancelar
-            current_target (dict): Datos de finca actualmente seleccionada
             
         Returns:
-            tuple: (modal_abierto, contenido_modal, datos_objetivo)
+            tuple: (modal_abierto, contenido_modal, parche con 'delete_target')
         """
         triggered_button = ctx.triggered_id
         
@@ -854,7 +1004,7 @@ def register_callbacks(app):
             
         # Cancelar eliminación - cerrar modal y limpiar
         if triggered_button == "modal-cancelar":
-            return False, no_update, None
+            return False, no_update, _ui_patch("delete_target", None)
 
         # Procesar clic en botón eliminar
         if (isinstance(triggered_button, dict) and 
@@ -889,7 +1039,7 @@ def register_callbacks(app):
                 
                 target_data = {"id": finca_id}
                 
-                return True, contenido, target_data
+                return True, contenido, _ui_patch("delete_target", target_data)
                 
             except Exception as e:
                 logger.exception(f"Error abriendo modal de eliminación para finca {finca_id}")
@@ -902,13 +1052,13 @@ def register_callbacks(app):
             Output("finca-feedback", "children", allow_duplicate=True),
             Output("modal-confirmacion-eliminar", "is_open", allow_duplicate=True),
             Output("store-fincas-data", "data", allow_duplicate=True),
-            Output("store-delete-target", "data", allow_duplicate=True),
+            Output("store-fincas-ui", "data", allow_duplicate=True),
         ],
         Input("modal-confirmar-eliminar", "n_clicks"),
-        State("store-delete-target", "data"),
+        State("store-fincas-ui", "data"),
         prevent_initial_call=True
     )
-    def confirmar_eliminacion(n, target):
+    def confirmar_eliminacion(n, ui_state):
         """
         Ejecuta la eliminación confirmada de una finca.
         
@@ -921,11 +1071,13 @@ def register_callbacks(app):
         
         Args:
             n (int): Número de clics en confirmar eliminación
-            target (dict): Datos de la finca a eliminar
+            ui_state (dict): Estado de UI con la finca objetivo ('delete_target')
             
         Returns:
-            tuple: Estados actualizados para feedback, modal, store y target
+            tuple: Estados actualizados para feedback, modal, store y estado de UI
         """
+        target = (ui_state or {}).get("delete_target")
+        
         # Validar precondiciones
         if not n or not target or not target.get("id"):
             return no_update, no_update, no_update, no_update
@@ -950,9 +1102,12 @@ def register_callbacks(app):
                 f"🗑️ Finca '{nombre}' eliminada correctamente.", 
                 color="success", duration=3500
             )
-            timestamp_update = {"ts": datetime.datetime.now().isoformat()}
+            timestamp_update = {
+                "ts": datetime.datetime.now().isoformat(),
+                "version": get_store_version()
+            }
             
-            return success_alert, False, timestamp_update, None
+            return success_alert, False, timestamp_update, _ui_patch("delete_target", None)
             
         except Exception as e:
             logger.exception(f"Error crítico eliminando finca {target.get('id')}")
@@ -28,15 +28,18 @@ Fichero: src.callbacks_refactored.historico.py
 # ===============================================================================
 
 # Librerías estándar
+import base64
 import logging
+from functools import lru_cache
 import os
 from datetime import datetime, timedelta
 
 # Análisis de datos
+import numpy as np
 import pandas as pd
 
 # Framework Dash
-from dash import callback, Input, Output, State, html, no_update
+from dash import callback, ctx, Input, Output, State, Patch, html, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 
@@ -44,10 +47,12 @@ import plotly.graph_objects as go
 from src.utils.simplified_plots import (
     create_precipitation_humidity_chart,
     create_temperature_chart,
-    create_empty_chart
+    create_empty_chart,
+    MAX_POINTS_PER_TRACE
 )
 from src.utils.repilo_analysis import analyze_repilo_risk
 from src.components.ui_components_improved import create_metric_card, create_alert_card
+from src.layouts.layout_historico import create_main_charts, create_alerts_section, MONITOR_CARDS
 
 # Configuración de logging
 logger = logging.getLogger(__name__)
@@ -59,6 +64,38 @@ logger = logging.getLogger(__name__)
 # Ruta al archivo de datos meteorológicos históricos
 DATA_FILE_PATH = os.path.join("data", "raw", "merged_output.csv")
 
+# Caché de load_weather_payload(): (firma del CSV, contenido del Store)
+_WEATHER_PAYLOAD_CACHE = (None, {})
+
+# Agregaciones por variable meteorológica: columna resultante -> (origen, función)
+_AGGREGATION_RULES = {
+    'Air_Temp_min': ('Air_Temp', 'min'),      # Temperatura: rango completo
+    'Air_Temp_mean': ('Air_Temp', 'mean'),
+    'Air_Temp_max': ('Air_Temp', 'max'),
+    'Air_Relat_Hum': ('Air_Relat_Hum', 'mean'),  # Humedad: promedio
+    'Rain': ('Rain', 'sum'),                  # Precipitación: acumulada
+    'Wind_Speed': ('Wind_Speed', 'mean'),     # Viento: promedio
+    'Wind_Dir': ('Wind_Dir', 'mean'),         # Dirección: promedio circular aproximado
+    'Solar_Rad': ('Solar_Rad', 'mean'),       # Radiación: promedio
+}
+
+# Agregaciones ya calculadas: (firma, agrupación, tramo) -> DataFrame agrupado
+_AGGREGATION_CACHE = {}
+_AGGREGATION_CACHE_SIZE = 32
+
+# Clase del badge de estado de las tarjetas de monitoreo según su semáforo
+_STATUS_BADGE_CLASS = {
+    "🟢": "badge bg-success",
+    "🟡": "badge bg-warning",
+    "⚪": "badge bg-secondary"
+}
+# Texto de cada tarjeta de monitoreo mientras no hay datos
+_WAITING_TEXTS = {
+    "temp": "Esperando datos de temperatura",
+    "hum": "Esperando datos de humedad",
+    "rain": "Esperando datos de precipitación"
+}
+
 # ===============================================================================
 #                       FUNCIONES DE CARGA DE DATOS
 # ===============================================================================
@@ -114,6 +151,118 @@ def load_weather_data() -> pd.DataFrame:
         logger.error(f"❌ Error crítico cargando datos meteorológicos: {e}")
         return pd.DataFrame()
 
+def _data_file_signature():
+    """Firma (mtime, tamaño) del CSV; None si no existe."""
+    try:
+        stat = os.stat(DATA_FILE_PATH)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _b64(array: np.ndarray) -> str:
+    """Codifica un array como texto base64 de sus bytes."""
+    return base64.b64encode(array.tobytes()).decode('ascii')
+
+def _from_b64(text: str, dtype: str) -> np.ndarray:
+    """Decodifica un array codificado con _b64."""
+    return np.frombuffer(base64.b64decode(text), dtype=dtype)
+
+def encode_weather_store(df: pd.DataFrame) -> dict:
+    """
+    Codifica los datos meteorológicos en formato columnar compacto.
+    
+    Las fechas viajan como int64 (ms desde epoch) y cada columna numérica
+    como float32, ambos little-endian en base64: ~4 veces menos que la lista
+    de registros JSON y sin parsear número a número en el navegador.
+    
+    Args:
+        df (pd.DataFrame): Datos con columna 'Dates' y columnas numéricas
+        
+    Returns:
+        dict: {'dates': str, 'columns': {nombre: str}}
+    """
+    numeric = df.drop(columns='Dates').select_dtypes('number')
+    return {
+        "dates": _b64(df['Dates'].to_numpy(dtype='datetime64[ms]').astype('<i8')),
+        "columns": {
+            column: _b64(numeric[column].to_numpy(dtype='<f4'))
+            for column in numeric.columns
+        }
+    }
+
+def weather_frame_from_store(data: dict) -> pd.DataFrame:
+    """
+    Reconstruye el DataFrame meteorológico desde weather-data-store.
+    
+    Args:
+        data (dict): Contenido generado por encode_weather_store
+        
+    Returns:
+        pd.DataFrame: 'Dates' como datetime64[ns] ordenado cronológicamente
+        y columnas numéricas en float32 (la precisión de los sensores es de
+        décimas; Plotly envía los arrays float32 con la mitad de bytes)
+    """
+    dates = _from_b64(data["dates"], '<i8')
+    # Los filtros por fecha (searchsorted) y los gráficos asumen el eje
+    # ordenado; solo se reordena si el Store no lo está
+    order = None
+    if dates.size > 1 and not np.all(dates[1:] >= dates[:-1]):
+        order = np.argsort(dates, kind='stable')
+        dates = dates[order]
+    
+    frame = {"Dates": dates.astype('datetime64[ms]').astype('datetime64[ns]')}
+    for column, encoded in data["columns"].items():
+        values = _from_b64(encoded, '<f4')
+        frame[column] = values if order is None else values[order]
+    return pd.DataFrame(frame)
+
+def load_weather_payload() -> dict:
+    """
+    Devuelve los datos meteorológicos codificados para weather-data-store.
+    
+    El resultado se cachea por la firma del CSV: mientras el archivo no
+    cambie (la sincronización con Telegram lo reescribe), pulsar
+    "Actualizar" no vuelve a leer, parsear y codificar todo el histórico.
+    
+    Returns:
+        dict: Ver encode_weather_store; vacío si no hay datos.
+        Tratar como solo lectura.
+    """
+    global _WEATHER_PAYLOAD_CACHE
+    signature = _data_file_signature()
+    cached_signature, cached_payload = _WEATHER_PAYLOAD_CACHE
+    if signature is None or signature != cached_signature:
+        df = load_weather_data()
+        cached_payload = encode_weather_store(df) if not df.empty else {}
+        if cached_payload:
+            _WEATHER_PAYLOAD_CACHE = (signature, cached_payload)
+    return cached_payload
+
+def _slice_by_dates(df: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    """
+    Recorta df al intervalo [start, end] de 'Dates' mediante búsqueda binaria.
+    
+    Con las fechas ordenadas (como las deja load_weather_data) basta con
+    searchsorted y un iloc, sin construir máscaras booleanas de todo el
+    histórico en cada cambio de filtro.
+    
+    Args:
+        df (pd.DataFrame): Datos con columna 'Dates'
+        start: Límite inferior inclusivo (None = sin límite)
+        end: Límite superior inclusivo (None = sin límite)
+        
+    Returns:
+        pd.DataFrame: Filas dentro del intervalo
+    """
+    dates = df['Dates']
+    if not dates.is_monotonic_increasing:
+        df = df.sort_values('Dates')
+        dates = df['Dates']
+    
+    i0 = 0 if start is None else dates.searchsorted(start, side='left')
+    i1 = len(df) if end is None else dates.searchsorted(end, side='right')
+    return df.iloc[i0:i1]
+
 def filter_data_by_period(df: pd.DataFrame, period: str, start_date: str = None, end_date: str = None) -> pd.DataFrame:
     """
     Filtra datos meteorológicos según período temporal especificado.
@@ -147,7 +296,7 @@ def filter_data_by_period(df: pd.DataFrame, period: str, start_date: str = None,
             # Incluir todo el día final (hasta 23:59:59)
             end_dt = pd.to_datetime(end_date) + timedelta(hours=23, minutes=59, seconds=59)
             
-            filtered_df = df[(df['Dates'] >= start_dt) & (df['Dates'] <= end_dt)]
+            filtered_df = _slice_by_dates(df, start_dt, end_dt)
             logger.debug(f"📅 Filtrado personalizado: {len(filtered_df)} registros entre {start_date} y {end_date}")
             return filtered_df
             
@@ -158,19 +307,19 @@ def filter_data_by_period(df: pd.DataFrame, period: str, start_date: str = None,
     # Períodos predefinidos relativos al momento actual
     elif period == "24h":
         cutoff = now - timedelta(hours=24)
-        filtered_df = df[df['Dates'] >= cutoff]
+        filtered_df = _slice_by_dates(df, cutoff)
         logger.debug(f"🕐 Filtrado 24h: {len(filtered_df)} registros desde {cutoff}")
         return filtered_df
         
     elif period == "7d":
         cutoff = now - timedelta(days=7)
-        filtered_df = df[df['Dates'] >= cutoff]
+        filtered_df = _slice_by_dates(df, cutoff)
         logger.debug(f"📆 Filtrado 7d: {len(filtered_df)} registros desde {cutoff.date()}")
         return filtered_df
         
     elif period == "30d":
         cutoff = now - timedelta(days=30)
-        filtered_df = df[df['Dates'] >= cutoff]
+        filtered_df = _slice_by_dates(df, cutoff)
         logger.debug(f"📊 Filtrado 30d: {len(filtered_df)} registros desde {cutoff.date()}")
         return filtered_df
     
@@ -206,43 +355,47 @@ def aggregate_data(df: pd.DataFrame, grouping: str) -> tuple[pd.DataFrame, bool]
         return df, False
     
     try:
-        # Mapeo de frecuencias de resample
+        # Mapeo de frecuencias de resample (alias de fin de período de pandas ≥2.2)
         freq_map = {
             "D": "D",     # Diario
             "W": "W",     # Semanal (domingo a sábado)
-            "M": "M",     # Mensual (fin de mes)
-            "Q": "Q"      # Trimestral (fin de trimestre)
+            "M": "ME",    # Mensual (fin de mes)
+            "Q": "QE"     # Trimestral (fin de trimestre)
         }
         
         freq = freq_map.get(grouping, "D")
         logger.debug(f"📈 Iniciando agregación con frecuencia: {freq}")
         
-        # Configurar agregaciones por variable meteorológica
+        # Agregaciones con nombre de las columnas presentes: una sola pasada
+        # por los grupos y columnas ya planas, sin índice multinivel
         aggregation_rules = {
-            'Air_Temp': ['min', 'mean', 'max'],  # Temperatura: rango completo
-            'Air_Relat_Hum': 'mean',             # Humedad: promedio
-            'Rain': 'sum',                       # Precipitación: acumulada
-            'Wind_Speed': 'mean',                # Viento: promedio
-            'Wind_Dir': 'mean',                  # Dirección: promedio circular aproximado
-            'Solar_Rad': 'mean'                  # Radiación: promedio
+            name: rule for name, rule in _AGGREGATION_RULES.items()
+            if rule[0] in df.columns
         }
         
+        # El resample sobre fechas con zona horaria es varias veces más lento
+        # que sobre fechas naive: se agrupa en hora local sin tz y se
+        # restaura la zona en el resultado
+        tz = df['Dates'].dt.tz
+        if tz is not None:
+            df = df.assign(Dates=df['Dates'].dt.tz_localize(None))
+        
         # Aplicar agrupación con índice temporal
         df_grouped = (
             df.set_index('Dates')
             .resample(freq)
-            .agg(aggregation_rules)
+            .agg(**aggregation_rules)
             .reset_index()
         )
         
-        # Aplanar estructura de columnas multinivel
-        df_grouped.columns = [
-            'Dates', 'Air_Temp_min', 'Air_Temp_mean', 'Air_Temp_max',
-            'Air_Relat_Hum', 'Rain', 'Wind_Speed', 'Wind_Dir', 'Solar_Rad'
-        ]
-        
         # Crear alias para compatibilidad con gráficos existentes
-        df_grouped['Air_Temp'] = df_grouped['Air_Temp_mean']
+        if 'Air_Temp_mean' in df_grouped:
+            df_grouped['Air_Temp'] = df_grouped['Air_Temp_mean']
+        
+        if tz is not None:
+            df_grouped['Dates'] = df_grouped['Dates'].dt.tz_localize(
+                tz, ambiguous=True, nonexistent='shift_forward'
+            )
         
         logger.info(f"✅ Agregación completada ({grouping}): {len(df_grouped)} puntos de {len(df)} originales")
         return df_grouped, True
@@ -251,6 +404,178 @@ def aggregate_data(df: pd.DataFrame, grouping: str) -> tuple[pd.DataFrame, bool]
         logger.error(f"❌ Error durante agregación de datos: {e}")
         return df, False
 
+def store_signature(data: dict):
+    """
+    Firma del CSV del que procede el contenido de weather-data-store.
+    
+    Args:
+        data (dict): Contenido recibido del Store
+        
+    Returns:
+        tuple | None: Firma de _data_file_signature si el Store coincide con
+        el payload servido actualmente; None si no se puede garantizar
+    """
+    signature, payload = _WEATHER_PAYLOAD_CACHE
+    if signature is not None and data == payload:
+        return signature
+    return None
+
+def aggregate_data_cached(df: pd.DataFrame, grouping: str, signature=None) -> tuple[pd.DataFrame, bool]:
+    """
+    aggregate_data con memoria de los resultados por tramo de datos.
+    
+    El histórico solo cambia cuando se reescribe el CSV, así que la
+    agregación de un mismo tramo (primer y último registro, nº de filas) con
+    la misma agrupación se reutiliza entre callbacks y sesiones en vez de
+    repetir el resample. Sin firma fiable se agrega siempre.
+    
+    Args:
+        df (pd.DataFrame): Tramo filtrado y ordenado del histórico
+        grouping (str): Frecuencia de agrupación ('D', 'W', 'M', 'Q', 'none')
+        signature: Firma devuelta por store_signature
+        
+    Returns:
+        tuple[pd.DataFrame, bool]: Como aggregate_data; tratar como solo lectura
+    """
+    if signature is None or df.empty or grouping == "none":
+        return aggregate_data(df, grouping)
+    
+    dates = df['Dates']
+    key = (signature, grouping, dates.iloc[0], dates.iloc[-1], len(df))
+    cached = _AGGREGATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    result = aggregate_data(df, grouping)
+    if result[1]:
+        if len(_AGGREGATION_CACHE) >= _AGGREGATION_CACHE_SIZE:
+            # Descartar la entrada más antigua (orden de inserción)
+            _AGGREGATION_CACHE.pop(next(iter(_AGGREGATION_CACHE)))
+        _AGGREGATION_CACHE[key] = result
+    return result
+
+def _status_badge_class(status: str) -> str:
+    """Clase del badge para un estado con semáforo (🟢/🟡/🔴)."""
+    return _STATUS_BADGE_CLASS.get(status[:1], "badge bg-danger")
+
+@lru_cache(maxsize=64)
+def _build_monitor_card(kind, icon, title, text, status, idle=False):
+    """
+    Tarjeta de monitoreo del centro de alertas (columna md=4)
+    
+    Args:
+        kind: Sufijo de la clase agri-alert-* ('temp', 'hum', 'rain')
+        icon: Nombre del icono agri-icon-*
+        title: Título de la tarjeta
+        text: Lectura o descripción mostrada bajo el título
+        status: Estado con semáforo (🟢/🟡/🔴/⚪)
+        idle: Tarjeta atenuada por falta de datos
+        
+    Returns:
+        dbc.Col: Columna con la tarjeta; memoizada, tratar como solo lectura
+    """
+    return dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.Div([
+                    html.I(className=f"agri-icon agri-icon-{icon} mb-2 agri-alert-tile-icon"),
+                    html.H6(title, className="fw-bold mb-2 text-muted" if idle else "fw-bold mb-2"),
+                    html.P(text, className="small text-muted mb-2"),
+                    html.Div([
+                        html.Span("Estado: ", className="fw-bold"),
+                        html.Span(status, className=_status_badge_class(status))
+                    ])
+                ], className="text-center")
+            ], className="p-3")
+        ], className=f"agri-alert-tile agri-alert-{'idle' if idle else kind}")
+    ], md=4)
+
+@lru_cache(maxsize=1)
+def _waiting_alerts_panel():
+    """
+    Centro de alertas en espera (sin datos meteorológicos)
+    
+    Es contenido fijo: se construye una sola vez y se reutiliza en cada
+    respuesta. Los estilos son las clases agri-alert-* de
+    assets/historico_styles.css.
+    """
+    return html.Div([
+        # Panel principal cuando no hay datos
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.Div([
+                            html.Div([
+                                html.I(className="agri-icon agri-icon-exclamation-triangle agri-alert-icon"),
+                            ], className="me-3"),
+                            html.Div([
+                                html.H6("Sistema de Monitoreo en Espera", className="fw-bold mb-2"),
+                                html.P("No hay datos meteorológicos disponibles para el análisis de riesgos.", 
+                                      className="mb-2 text-muted"),
+                                html.Div([
+                                    html.I(className="agri-icon agri-icon-info-circle me-1 agri-alert-muted-icon"),
+                                    html.Small("Esperando datos del sistema meteorológico", className="text-muted")
+                                ])
+                            ], className="flex-grow-1")
+                        ], className="d-flex align-items-start")
+                    ], className="p-3")
+                ], className="agri-alert-waiting")
+            ], md=12, className="mb-4")
+        ]),
+        # Tarjetas de monitoreo en estado inactivo
+        dbc.Row([
+            _build_monitor_card(kind, icon, title, _WAITING_TEXTS[kind], "⚪ Sin datos", idle=True)
+            for kind, icon, title in MONITOR_CARDS
+        ])
+    ])
+
+def _relayout_window(relayout: dict):
+    """
+    Ventana del eje X resultante de un evento relayout de Plotly.
+    
+    Args:
+        relayout (dict): relayoutData del gráfico
+        
+    Returns:
+        tuple | None: (inicio, fin) tras un zoom/desplazamiento, (None, None)
+        al volver a la vista completa y None si el evento no cambia el eje X
+    """
+    if not relayout:
+        return None
+    if relayout.get("xaxis.autorange"):
+        return None, None
+    if "xaxis.range[0]" in relayout and "xaxis.range[1]" in relayout:
+        start, end = relayout["xaxis.range[0]"], relayout["xaxis.range[1]"]
+    elif "xaxis.range" in relayout:
+        start, end = relayout["xaxis.range"]
+    else:
+        return None
+    try:
+        return pd.to_datetime(start), pd.to_datetime(end)
+    except (TypeError, ValueError):
+        return None
+
+def _chart_mode_patch(mode: str) -> Patch:
+    """Patch de historico-chart-state que solo actualiza 'chart_mode'."""
+    patch = Patch()
+    patch["chart_mode"] = mode
+    return patch
+
+def _traces_patch(fig: go.Figure) -> Patch:
+    """
+    Crea un Patch que sustituye solo las trazas de una figura ya montada.
+    
+    Args:
+        fig (go.Figure): Figura completa recién generada
+        
+    Returns:
+        Patch: Actualización parcial con el nuevo array 'data'
+    """
+    patch = Patch()
+    patch["data"] = fig.to_plotly_json()["data"]
+    return patch
+
 # ===============================================================================
 #                        FUNCIÓN PRINCIPAL DE REGISTRO
 # ===============================================================================
@@ -274,6 +599,35 @@ def register_callbacks(app):
     """
     logger.info("📈 Registrando callbacks del layout histórico...")
     
+    # ===============================================================================
+    #                     CARGA DIFERIDA DE GRÁFICOS Y ALERTAS
+    # ===============================================================================
+    
+    @app.callback(
+        [
+            Output("historico-charts-slot", "children"),
+            Output("historico-alerts-slot", "children")
+        ],
+        Input("historico-defer-load", "n_intervals"),
+        prevent_initial_call=True
+    )
+    def fill_deferred_sections(n_intervals):
+        """
+        Monta las secciones pesadas tras el primer pintado de la pestaña.
+        
+        El layout inicial solo lleva los huecos vacíos, de modo que cabecera,
+        métricas y controles aparecen antes. Los callbacks de gráficos y
+        alertas se disparan solos cuando sus componentes entran en el árbol.
+        
+        Args:
+            n_intervals (int): Disparos del intervalo (máximo uno)
+            
+        Returns:
+            tuple: (sección_gráficos, sección_alertas)
+        """
+        # Ambas secciones están memoizadas en el módulo de layout
+        return create_main_charts(), create_alerts_section()
+    
     # ===============================================================================
     #                        CALLBACK DE CARGA DE DATOS
     # ===============================================================================
@@ -288,30 +642,28 @@ def register_callbacks(app):
         Carga datos meteorológicos desde archivo CSV al almacenamiento reactivo.
         
         Proceso:
-        • Lectura desde merged_output.csv
+        • Lectura desde merged_output.csv (cacheada por firma del archivo)
         • Preprocesamiento y limpieza
-        • Conversión a formato dict para Store
+        • Codificación columnar compacta para Store (encode_weather_store)
         • Logging de estadísticas de carga
         
         Args:
             n_clicks (int): Número de clics en botón actualizar
             
         Returns:
-            dict: Datos meteorológicos en formato de registros
+            dict: Datos meteorológicos en formato columnar codificado
         """
         try:
-            # Cargar y procesar datos desde archivo
-            df = load_weather_data()
+            # Cargar datos codificados (cacheados mientras el CSV no cambie)
+            payload = load_weather_payload()
             
-            if df.empty:
+            if not payload:
                 logger.warning("🚨 No se obtuvieron datos meteorológicos")
                 return {}
             
-            # Convertir DataFrame a dict para almacenamiento en Store
-            data_records = df.to_dict('records')
-            logger.debug(f"💾 Datos convertidos para almacenamiento: {len(data_records)} registros")
+            logger.debug(f"💾 Datos listos para almacenamiento: {len(payload['columns'])} columnas")
             
-            return data_records
+            return payload
             
         except Exception as e:
             logger.error(f"❌ Error crítico en callback de carga de datos: {e}")
@@ -321,55 +673,55 @@ def register_callbacks(app):
     #                     CALLBACK DE CONTROL DE FILTROS
     # ===============================================================================
     
-    @app.callback(
+    # Mostrar/ocultar el rango personalizado es un cambio puramente visual:
+    # se resuelve en el navegador sin ida y vuelta al servidor.
+    app.clientside_callback(
+        """
+        function(period) {
+            if (period === "custom") {
+                return [{display: "block"}, {color: "#2c3e50", display: "block"}];
+            }
+            return [{display: "none"}, {display: "none"}];
+        }
+        """,
         [
             Output("custom-date-container", "style"),
-            Output("custom-date-label", "style"),
-            Output("current-filters-store", "data")
+            Output("custom-date-label", "style")
         ],
+        Input("period-selector", "value"),
+        prevent_initial_call=True
+    )
+    
+    @app.callback(
+        Output("historico-state", "data"),
         [
             Input("period-selector", "value"),
             Input("start-date-picker", "date"),
             Input("end-date-picker", "date"),
             Input("grouping-selector", "value")
         ],
-        State("current-filters-store", "data")
+        # El layout ya nace con los filtros por defecto
+        prevent_initial_call=True
     )
-    def update_filters(period, start_date, end_date, grouping, current_filters):
+    def update_filters(period, start_date, end_date, grouping):
         """
-        Gestiona la visibilidad y estado de los controles de filtrado temporal.
+        Sincroniza los controles de filtrado temporal con historico-state.
         
-        Funcionalidades:
-        • Mostrar/ocultar selector de fecha personalizada
-        • Actualizar configuración de filtros activos
-        • Sincronizar estado entre componentes
-        • Validación de parámetros de entrada
+        La visibilidad del rango personalizado se gestiona en el navegador
+        (callback clientside anterior); aquí solo se actualizan los filtros.
         
         Args:
             period (str): Período seleccionado ('24h', '7d', '30d', 'custom')
             start_date (str): Fecha inicio para período personalizado
             end_date (str): Fecha fin para período personalizado
             grouping (str): Frecuencia de agrupación ('D', 'W', 'M', 'Q', 'none')
-            current_filters (dict): Estado actual de filtros
             
         Returns:
-            tuple: (estilos_selector_fecha, nueva_configuracion_filtros)
+            Patch: Actualización de la clave 'filters' de historico-state
         """
-        # Configurar visibilidad del selector de fecha personalizada
-        if period == "custom":
-            # Mostrar selector personalizado
-            container_style = {'display': 'block'}
-            label_style = {
-                'color': '#2c3e50',  # AGRI_THEME['colors']['text_primary']
-                'display': 'block'
-            }
-        else:
-            # Ocultar selector para períodos predefinidos
-            container_style = {'display': 'none'}
-            label_style = {'display': 'none'}
-        
-        # Actualizar configuración de filtros
-        new_filters = {
+        # Actualizar configuración de filtros (solo esa clave del estado)
+        state_patch = Patch()
+        state_patch["filters"] = {
             "period": period,
             "grouping": grouping,
             "start_date": start_date,
@@ -378,7 +730,40 @@ def register_callbacks(app):
         
         logger.debug(f"🔍 Filtros actualizados: período={period}, agrupación={grouping}")
         
-        return container_style, label_style, new_filters
+        return state_patch
+    
+    # ===============================================================================
+    #                  FECHAS POR DEFECTO DEL RANGO PERSONALIZADO
+    # ===============================================================================
+    
+    # Las fechas por defecto (última semana) se calculan en el navegador al
+    # elegir "personalizado": el layout no depende así del día en que se
+    # construyó y puede servirse desde caché sin quedar desfasado.
+    app.clientside_callback(
+        """
+        function(period, startDate, endDate) {
+            if (period !== "custom" || (startDate && endDate)) {
+                return [dash_clientside.no_update, dash_clientside.no_update];
+            }
+            const today = new Date();
+            const weekAgo = new Date(today);
+            weekAgo.setDate(today.getDate() - 7);
+            // Fecha local del usuario (toISOString daría el día en UTC)
+            const pad = n => String(n).padStart(2, "0");
+            const iso = d => d.getFullYear() + "-" + pad(d.getMonth() + 1) + "-" + pad(d.getDate());
+            return [startDate || iso(weekAgo), endDate || iso(today)];
+        }
+        """,
+        [
+            Output("start-date-picker", "date"),
+            Output("end-date-picker", "date")
+        ],
+        Input("period-selector", "value"),
+        [
+            State("start-date-picker", "date"),
+            State("end-date-picker", "date")
+        ]
+    )
     
     # ===============================================================================
     #                    CALLBACK DE MÉTRICAS METEOROLÓGICAS
@@ -401,7 +786,7 @@ def register_callbacks(app):
         • Intensidad de radiación solar
         
         Args:
-            weather_data (list): Registros meteorológicos desde Store
+            weather_data (dict): Datos meteorológicos codificados desde Store
             
         Returns:
             dbc.Row|Alert: Tarjetas de métricas o alerta si no hay datos
@@ -415,9 +800,8 @@ def register_callbacks(app):
                     title="Sin Datos"
                 )
             
-            # Convertir a DataFrame y procesar fechas
-            df = pd.DataFrame(weather_data)
-            df['Dates'] = pd.to_datetime(df['Dates'], format='mixed', errors='coerce')
+            # Reconstruir DataFrame desde el Store columnar
+            df = weather_frame_from_store(weather_data)
             
             # Obtener registro más reciente
             latest = df.iloc[-1]
@@ -431,7 +815,7 @@ def register_callbacks(app):
                         title="Última Actualización",
                         value=latest['Dates'].strftime("%d/%m/%Y"),
                         unit="",
-                        icon="fas fa-calendar-alt",
+                        icon="agri-icon agri-icon-calendar-alt",
                         color="primary",
                         description=latest['Dates'].strftime("%H:%M hrs")
                     )
@@ -443,7 +827,7 @@ def register_callbacks(app):
                         title="Temperatura",
                         value=f"{latest['Air_Temp']:.1f}",
                         unit="°C",
-                        icon="fas fa-thermometer-half",
+                        icon="agri-icon agri-icon-thermometer-half",
                         color="danger" if 15 <= latest['Air_Temp'] <= 20 else "info",
                         description="Riesgo Alto" if 15 <= latest['Air_Temp'] <= 20 else "Normal"
                     )
@@ -455,7 +839,7 @@ def register_callbacks(app):
                         title="Humedad Relativa",
                         value=f"{latest['Air_Relat_Hum']:.1f}",
                         unit="%",
-                        icon="fas fa-tint",
+                        icon="agri-icon agri-icon-tint",
                         color="danger" if latest['Air_Relat_Hum'] > 95 else "success",
                         description="Crítica" if latest['Air_Relat_Hum'] > 95 else "Normal"
                     )
@@ -467,7 +851,7 @@ def register_callbacks(app):
                         title="Precipitación",
                         value=f"{latest['Rain']:.1f}",
                         unit="mm",
-                        icon="fas fa-cloud-rain",
+                        icon="agri-icon agri-icon-cloud-rain",
                         color="info",
                         description="Acumulada"
                     )
@@ -479,7 +863,7 @@ def register_callbacks(app):
                         title="Viento",
                         value=f"{latest['Wind_Speed']:.1f}",
                         unit="m/s",
-                        icon="fas fa-wind",
+                        icon="agri-icon agri-icon-wind",
                         color="info",
                         description=f"Dir: {int(latest['Wind_Dir'])}°"
                     )
@@ -491,7 +875,7 @@ def register_callbacks(app):
                         title="Rad. Solar",
                         value=f"{latest['Solar_Rad']:.0f}",
                         unit="W/m²",
-                        icon="fas fa-sun",
+                        icon="agri-icon agri-icon-sun",
                         color="warning",
                         description="Intensidad"
                     )
@@ -514,14 +898,22 @@ def register_callbacks(app):
     @app.callback(
         [
             Output("precipitation-humidity-chart", "figure"),
-            Output("temperature-chart", "figure")
+            Output("temperature-chart", "figure"),
+            Output("historico-chart-state", "data")
         ],
         [
             Input("weather-data-store", "data"),
-            Input("current-filters-store", "data")
+            Input("historico-state", "data")
+        ],
+        State("historico-chart-state", "data"),
+        # Mientras se filtra/agrega se bloquean los controles que volverían a
+        # disparar el cálculo, para no encolar peticiones sobre el histórico
+        running=[
+            (Output("update-charts-btn", "disabled"), True, False),
+            (Output("grouping-selector", "disabled"), True, False)
         ]
     )
-    def update_charts(weather_data, filters):
+    def update_charts(weather_data, state, chart_state):
         """
         Actualiza los gráficos especializados de datos meteorológicos.
         
@@ -531,23 +923,30 @@ def register_callbacks(app):
         • Aplicación de filtros temporales y agrupación
         • Manejo de estados vacíos y errores
         
+        Si los gráficos ya muestran datos, solo se envían las trazas nuevas
+        (dash.Patch): el layout de ambas figuras es fijo y no se retransmite.
+        
         Args:
-            weather_data (list): Datos meteorológicos desde Store
-            filters (dict): Configuración de filtros activos
+            weather_data (dict): Datos meteorológicos codificados desde Store
+            state (dict): historico-state con los filtros activos ('filters')
+            chart_state (dict): historico-chart-state con 'chart_mode'
+                ('data'/'empty', contenido actual de los gráficos)
             
         Returns:
-            tuple: (figura_precipitacion_humedad, figura_temperatura)
+            tuple: (figura_precipitacion_humedad, figura_temperatura,
+                    Patch de 'chart_mode' o no_update)
         """
+        filters = (state or {}).get("filters")
+        chart_mode = (chart_state or {}).get("chart_mode")
         try:
             # Validar datos de entrada
             if not weather_data or not filters:
                 logger.warning("🚨 Datos o filtros no disponibles para gráficos")
                 empty_fig = create_empty_chart("No hay datos disponibles")
-                return empty_fig, empty_fig
+                return empty_fig, empty_fig, _chart_mode_patch("empty")
             
-            # Convertir y procesar datos
-            df = pd.DataFrame(weather_data)
-            df['Dates'] = pd.to_datetime(df['Dates'], format='mixed', errors='coerce')
+            # Reconstruir DataFrame desde el Store columnar
+            df = weather_frame_from_store(weather_data)
             
             # Limpiar registros con fechas inválidas
             initial_count = len(df)
@@ -568,15 +967,17 @@ def register_callbacks(app):
             if df_filtered.empty:
                 logger.warning("🔍 No hay datos en el período seleccionado")
                 empty_fig = create_empty_chart("No hay datos en el período seleccionado")
-                return empty_fig, empty_fig
+                return empty_fig, empty_fig, _chart_mode_patch("empty")
             
             # Aplicar agrupación temporal si se especifica
-            df_final, is_aggregated = aggregate_data(df_filtered, filters['grouping'])
+            df_final, is_aggregated = aggregate_data_cached(
+                df_filtered, filters['grouping'], store_signature(weather_data)
+            )
             
             if df_final.empty:
                 logger.error("❌ Error durante procesamiento de datos")
                 empty_fig = create_empty_chart("Error procesando los datos")
-                return empty_fig, empty_fig
+                return empty_fig, empty_fig, _chart_mode_patch("empty")
             
             # Generar gráficos especializados
             logger.debug(f"📊 Generando gráficos con {len(df_final)} puntos de datos")
@@ -584,12 +985,83 @@ def register_callbacks(app):
             fig_precip_hum = create_precipitation_humidity_chart(df_final)
             fig_temp = create_temperature_chart(df_final, is_aggregated)
             
-            return fig_precip_hum, fig_temp
+            if chart_mode == "data":
+                return _traces_patch(fig_precip_hum), _traces_patch(fig_temp), no_update
+            return fig_precip_hum, fig_temp, _chart_mode_patch("data")
             
         except Exception as e:
             logger.error(f"❌ Error crítico actualizando gráficos: {e}")
             error_fig = create_empty_chart(f"Error: {str(e)}")
-            return error_fig, error_fig
+            return error_fig, error_fig, _chart_mode_patch("empty")
+    
+    # Al hacer zoom sobre datos sin agrupar que se redujeron en el servidor
+    # (más de MAX_POINTS_PER_TRACE registros), se vuelven a reducir solo los
+    # del tramo visible y se envían únicamente sus trazas (Patch de 'data'),
+    # de modo que el detalle aparece al acercarse sin retransmitir la figura.
+    @app.callback(
+        [
+            Output("precipitation-humidity-chart", "figure", allow_duplicate=True),
+            Output("temperature-chart", "figure", allow_duplicate=True)
+        ],
+        [
+            Input("precipitation-humidity-chart", "relayoutData"),
+            Input("temperature-chart", "relayoutData")
+        ],
+        [
+            State("historico-state", "data"),
+            State("historico-chart-state", "data")
+        ],
+        prevent_initial_call=True
+    )
+    def refine_zoomed_traces(relayout_precip_hum, relayout_temp, state, chart_state):
+        """
+        Recalcula las trazas del gráfico ampliado para el tramo visible.
+        
+        Los datos se toman del payload cacheado en el servidor
+        (load_weather_payload), no del Store, para no subir el histórico
+        completo en cada zoom.
+        
+        Args:
+            relayout_precip_hum (dict): relayoutData del gráfico de precipitación
+            relayout_temp (dict): relayoutData del gráfico de temperatura
+            state (dict): historico-state con los filtros activos ('filters')
+            chart_state (dict): historico-chart-state con 'chart_mode'
+            
+        Returns:
+            tuple: (Patch o no_update, Patch o no_update) para cada gráfico
+        """
+        is_precip_hum = ctx.triggered_id == "precipitation-humidity-chart"
+        window = _relayout_window(relayout_precip_hum if is_precip_hum else relayout_temp)
+        filters = (state or {}).get("filters")
+        if (window is None or not filters or filters.get("grouping") != "none"
+                or (chart_state or {}).get("chart_mode") != "data"):
+            return no_update, no_update
+        
+        try:
+            payload = load_weather_payload()
+            if not payload:
+                return no_update, no_update
+            df = filter_data_by_period(
+                weather_frame_from_store(payload),
+                filters['period'],
+                filters.get('start_date'),
+                filters.get('end_date')
+            )
+            # Sin reducción en servidor la figura ya tiene todos los puntos
+            if len(df) <= MAX_POINTS_PER_TRACE:
+                return no_update, no_update
+            
+            visible = _slice_by_dates(df, *window)
+            if visible.empty:
+                return no_update, no_update
+            
+            if is_precip_hum:
+                return _traces_patch(create_precipitation_humidity_chart(visible)), no_update
+            return no_update, _traces_patch(create_temperature_chart(visible, False))
+            
+        except Exception as e:
+            logger.error(f"❌ Error refinando el tramo ampliado: {e}")
+            return no_update, no_update
     
     # ===============================================================================
     #                       CALLBACK DE ALERTAS DE ENFERMEDAD
@@ -609,7 +1081,7 @@ def register_callbacks(app):
         • Gestión hídrica (necesidades de riego)
         
         Args:
-            weather_data (list): Datos meteorológicos desde Store
+            weather_data (dict): Datos meteorológicos codificados desde Store
             
         Returns:
             html.Div: Sistema de alertas mejorado con tarjetas especializadas
@@ -617,113 +1089,10 @@ def register_callbacks(app):
         try:
             # Validar disponibilidad de datos
             if not weather_data:
-                return html.Div([
-                    # Panel principal cuando no hay datos
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.Div([
-                                            html.I(className="fas fa-exclamation-triangle", 
-                                                  style={
-                                                      'fontSize': '2.5rem', 
-                                                      'color': '#ffc107',
-                                                      'background': 'linear-gradient(135deg, #fff3cd 0%, #ffc107 100%)',
-                                                      'WebkitBackgroundClip': 'text',
-                                                      'WebkitTextFillColor': 'transparent'
-                                                  }),
-                                        ], className="me-3"),
-                                        html.Div([
-                                            html.H6("Sistema de Monitoreo en Espera", className="fw-bold mb-2"),
-                                            html.P("No hay datos meteorológicos disponibles para el análisis de riesgos.", 
-                                                  className="mb-2 text-muted"),
-                                            html.Div([
-                                                html.I(className="fas fa-info-circle me-1", style={'color': '#6c757d'}),
-                                                html.Small("Esperando datos del sistema meteorológico", className="text-muted")
-                                            ])
-                                        ], className="flex-grow-1")
-                                    ], className="d-flex align-items-start")
-                                ], className="p-3")
-                            ], style={
-                                'background': 'linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%)',
-                                'border': '2px solid #ffc107',
-                                'borderRadius': '12px',
-                                'boxShadow': '0 4px 15px rgba(255, 193, 7, 0.1)'
-                            })
-                        ], md=12, className="mb-4")
-                    ]),
-                    # Tarjetas de monitoreo en estado inactivo
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.I(className="fas fa-thermometer-half mb-2", 
-                                              style={'fontSize': '1.8rem', 'color': '#6c757d'}),
-                                        html.H6("Control Térmico", className="fw-bold mb-2 text-muted"),
-                                        html.P("Esperando datos de temperatura", className="small text-muted mb-2"),
-                                        html.Div([
-                                            html.Span("Estado: ", className="fw-bold"),
-                                            html.Span("⚪ Sin datos", className="badge bg-secondary")
-                                        ])
-                                    ], className="text-center")
-                                ], className="p-3")
-                            ], style={
-                                'background': '#f8f9fa',
-                                'border': '1px solid #dee2e6',
-                                'borderRadius': '10px',
-                                'opacity': '0.7'
-                            })
-                        ], md=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.I(className="fas fa-tint mb-2", 
-                                              style={'fontSize': '1.8rem', 'color': '#6c757d'}),
-                                        html.H6("Control de Humedad", className="fw-bold mb-2 text-muted"),
-                                        html.P("Esperando datos de humedad", className="small text-muted mb-2"),
-                                        html.Div([
-                                            html.Span("Estado: ", className="fw-bold"),
-                                            html.Span("⚪ Sin datos", className="badge bg-secondary")
-                                        ])
-                                    ], className="text-center")
-                                ], className="p-3")
-                            ], style={
-                                'background': '#f8f9fa',
-                                'border': '1px solid #dee2e6',
-                                'borderRadius': '10px',
-                                'opacity': '0.7'
-                            })
-                        ], md=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.I(className="fas fa-cloud-rain mb-2", 
-                                              style={'fontSize': '1.8rem', 'color': '#6c757d'}),
-                                        html.H6("Control de Precipitaciones", className="fw-bold mb-2 text-muted"),
-                                        html.P("Esperando datos de precipitación", className="small text-muted mb-2"),
-                                        html.Div([
-                                            html.Span("Estado: ", className="fw-bold"),
-                                            html.Span("⚪ Sin datos", className="badge bg-secondary")
-                                        ])
-                                    ], className="text-center")
-                                ], className="p-3")
-                            ], style={
-                                'background': '#f8f9fa',
-                                'border': '1px solid #dee2e6',
-                                'borderRadius': '10px',
-                                'opacity': '0.7'
-                            })
-                        ], md=4)
-                    ])
-                ])
+                return _waiting_alerts_panel()
             
-            # Convertir y procesar datos temporales
-            df = pd.DataFrame(weather_data)
-            df['Dates'] = pd.to_datetime(df['Dates'], format='mixed', errors='coerce')
+            # Reconstruir DataFrame desde el Store columnar
+            df = weather_frame_from_store(weather_data)
             
             # Ejecutar análisis de riesgo de repilo (últimas 48 horas)
             logger.debug("🦠 Ejecutando análisis de riesgo de repilo...")
@@ -741,6 +1110,13 @@ def register_callbacks(app):
             humidity_status = "🟢 Óptimo" if humidity < 80 else "🟡 Vigilancia" if humidity < 95 else "🔴 Alto riesgo"
             rain_status = "🟢 Óptimo" if rain == 0 else "🟡 Moderado" if rain < 10 else "🔴 Intenso"
             
+            readings = {
+                "temp": f"Temp. actual: {temp:g}°C",
+                "hum": f"Humedad: {humidity:g}%",
+                "rain": f"Lluvia: {rain:g} mm"
+            }
+            statuses = {"temp": temp_status, "hum": humidity_status, "rain": rain_status}
+            
             # Generar el panel de alertas mejorado con datos reales
             return html.Div([
                 # Panel de alertas principal
@@ -750,108 +1126,27 @@ def register_callbacks(app):
                             dbc.CardBody([
                                 html.Div([
                                     html.Div([
-                                        html.I(className="fas fa-shield-alt", 
-                                              style={
-                                                  'fontSize': '2.5rem', 
-                                                  'color': '#17a2b8',
-                                                  'background': 'linear-gradient(135deg, #5bc0de 0%, #17a2b8 100%)',
-                                                  'WebkitBackgroundClip': 'text',
-                                                  'WebkitTextFillColor': 'transparent'
-                                              }),
+                                        html.I(className="agri-icon agri-icon-shield-alt agri-alert-icon"),
                                     ], className="me-3"),
                                     html.Div([
                                         html.H6("Sistema de Monitoreo Activo", className="fw-bold mb-2"),
                                         html.P(f"Análisis en tiempo real completado. Riesgo de repilo: {risk_level.upper()}. Condiciones monitoreadas para prevenir riesgos en el cultivo.", 
                                               className="mb-2 text-muted"),
                                         html.Div([
-                                            html.I(className="fas fa-clock me-1", style={'color': '#6c757d'}),
+                                            html.I(className="agri-icon agri-icon-clock me-1 agri-alert-muted-icon"),
                                             html.Small("Actualizado hace 5 minutos", className="text-muted")
                                         ])
                                     ], className="flex-grow-1")
                                 ], className="d-flex align-items-start")
                             ], className="p-3")
-                        ], style={
-                            'background': 'linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%)',
-                            'border': '2px solid #17a2b8',
-                            'borderRadius': '12px',
-                            'boxShadow': '0 4px 15px rgba(23, 162, 184, 0.1)'
-                        })
+                        ], className="agri-alert-main")
                     ], md=12, className="mb-4")
                 ]),
                 
                 # Tarjetas de monitoreo específico con datos reales
                 dbc.Row([
-                    # Temperatura
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.Div([
-                                    html.I(className="fas fa-thermometer-half mb-2", 
-                                          style={'fontSize': '1.8rem', 'color': '#dc3545'}),
-                                    html.H6("Control Térmico", className="fw-bold mb-2"),
-                                    html.P(f"Temp. actual: {temp}°C", className="small text-muted mb-2"),
-                                    html.Div([
-                                        html.Span("Estado: ", className="fw-bold"),
-                                        html.Span(temp_status, className="badge bg-success" if "🟢" in temp_status else "badge bg-warning" if "🟡" in temp_status else "badge bg-danger")
-                                    ])
-                                ], className="text-center")
-                            ], className="p-3")
-                        ], style={
-                            'background': 'linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%)',
-                            'border': '1px solid #dc3545',
-                            'borderRadius': '10px',
-                            'boxShadow': '0 3px 10px rgba(220, 53, 69, 0.1)',
-                            'transition': 'transform 0.2s ease'
-                        })
-                    ], md=4),
-                    
-                    # Humedad
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.Div([
-                                    html.I(className="fas fa-tint mb-2", 
-                                          style={'fontSize': '1.8rem', 'color': '#007bff'}),
-                                    html.H6("Control de Humedad", className="fw-bold mb-2"),
-                                    html.P(f"Humedad: {humidity}%", className="small text-muted mb-2"),
-                                    html.Div([
-                                        html.Span("Estado: ", className="fw-bold"),
-                                        html.Span(humidity_status, className="badge bg-success" if "🟢" in humidity_status else "badge bg-warning" if "🟡" in humidity_status else "badge bg-danger")
-                                    ])
-                                ], className="text-center")
-                            ], className="p-3")
-                        ], style={
-                            'background': 'linear-gradient(135deg, #cce5ff 0%, #b8daff 100%)',
-                            'border': '1px solid #007bff',
-                            'borderRadius': '10px',
-                            'boxShadow': '0 3px 10px rgba(0, 123, 255, 0.1)',
-                            'transition': 'transform 0.2s ease'
-                        })
-                    ], md=4),
-                    
-                    # Precipitación
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.Div([
-                                    html.I(className="fas fa-cloud-rain mb-2", 
-                                          style={'fontSize': '1.8rem', 'color': '#28a745'}),
-                                    html.H6("Control de Precipitaciones", className="fw-bold mb-2"),
-                                    html.P(f"Lluvia: {rain} mm", className="small text-muted mb-2"),
-                                    html.Div([
-                                        html.Span("Estado: ", className="fw-bold"),
-                                        html.Span(rain_status, className="badge bg-success" if "🟢" in rain_status else "badge bg-warning" if "🟡" in rain_status else "badge bg-danger")
-                                    ])
-                                ], className="text-center")
-                            ], className="p-3")
-                        ], style={
-                            'background': 'linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%)',
-                            'border': '1px solid #28a745',
-                            'borderRadius': '10px',
-                            'boxShadow': '0 3px 10px rgba(40, 167, 69, 0.1)',
-                            'transition': 'transform 0.2s ease'
-                        })
-                    ], md=4)
+                    _build_monitor_card(kind, icon, title, readings[kind], statuses[kind])
+                    for kind, icon, title in MONITOR_CARDS
                 ])
             ])
             
@@ -32,6 +32,7 @@ Fichero: src.callbacks_refactored.prediccion.py
 import logging
 import json
 import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -40,7 +41,8 @@ import pandas as pd
 import numpy as np
 
 # Framework Dash
-from dash import callback, Input, Output, State, html, no_update
+from dash import callback, Input, Output, State, Patch, html, no_update
+import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 
 # Utilidades específicas del proyecto
@@ -58,6 +60,11 @@ from src.utils.weather_utils import (
 )
 
 from src.components.ui_components_improved import create_metric_card, create_alert_card
+from src.layouts.layout_prediccion_improved import (
+    create_48h_forecast_section,
+    create_risk_guide_tab_body,
+    create_weekly_forecast_section,
+)
 
 # Configuración de logging
 logger = logging.getLogger(__name__)
@@ -70,6 +77,11 @@ logger = logging.getLogger(__name__)
 BENALUA_CACHE_FILE = "cache/benalua_forecast_premium.json"
 CACHE_DURATION_MINUTES = 30  # Actualización frecuente para datos críticos
 
+# Predicciones reales de AEMET ya construidas, compartidas entre sesiones:
+# municipio en minúsculas -> (instante de caducidad en time.monotonic, payload)
+_FORECAST_PAYLOAD_CACHE = {}
+_FORECAST_PAYLOAD_CACHE_SIZE = 64
+
 # ===============================================================================
 #                       FUNCIONES DE GESTIÓN DE CACHÉ
 # ===============================================================================
@@ -234,6 +246,23 @@ def is_cache_valid(timestamp_str):
         logger.warning(f"⚠️ Error validando caché: {e}")
         return False
 
+def _cache_remaining_seconds(timestamp_str):
+    """
+    Segundos de validez que le quedan a una entrada del caché en disco.
+    
+    Args:
+        timestamp_str (str): Timestamp ISO con el que se guardó la entrada
+        
+    Returns:
+        float: Segundos hasta que expire (0 si ya expiró o no es legible)
+    """
+    try:
+        normalized_timestamp = timestamp_str.replace('Z', '+00:00').replace('+00:00', '')
+        age_seconds = (datetime.now() - datetime.fromisoformat(normalized_timestamp)).total_seconds()
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+    return max(0.0, CACHE_DURATION_MINUTES * 60 - age_seconds)
+
 def _parse_daily_aemet(data):
     """Parsea la predicción diaria de AEMET a DataFrame estandarizado."""
     try:
@@ -466,6 +495,28 @@ def _riesgo_repilo_dia(tmin, tmax, hummin, hummax) -> tuple[str, str]:
     # Por defecto: riesgo bajo (enfoque conservador científico)
     return ("Bajo", "success")
 
+def _chart_mode_patch(mode: str) -> Patch:
+    """Patch de forecast-48h-state que solo actualiza 'chart_mode'."""
+    patch = Patch()
+    patch["chart_mode"] = mode
+    return patch
+
+def _forecast_48h_patch(fig: go.Figure) -> Patch:
+    """
+    Crea un Patch que sustituye solo lo que depende de los datos en el
+    gráfico 48h ya montado: las trazas y la escala de precipitación.
+    
+    Args:
+        fig (go.Figure): Figura completa recién generada
+        
+    Returns:
+        Patch: Actualización parcial con 'data' y el rango de 'yaxis3'
+    """
+    patch = Patch()
+    patch["data"] = fig.to_plotly_json()["data"]
+    patch["layout"]["yaxis3"]["range"] = list(fig.layout.yaxis3.range)
+    return patch
+
 # ===============================================================================
 #                       FUNCIONES DE VISUALIZACIÓN
 # ===============================================================================
@@ -910,6 +961,98 @@ def generate_mock_hourly_data(municipality: str = "Benalua") -> pd.DataFrame:
         logger.error(f"Error generando datos horarios con zonas de riesgo: {e}")
         return pd.DataFrame()
 
+def _load_forecast_payload(municipio):
+    """
+    Construye el contenido de forecast-data-store para un municipio.
+    
+    Benalúa usa además el caché premium en disco; el resto de municipios se
+    consultan directamente a AEMET (con datos simulados como respaldo). Los
+    datos simulados no se guardan en disco: la siguiente consulta vuelve a
+    intentar AEMET.
+    
+    Args:
+        municipio (str): Municipio seleccionado
+        
+    Returns:
+        tuple: (payload, usa_simulados, validez_en_segundos). payload es la
+        predicción semanal/horaria con metadatos; usa_simulados indica si
+        alguna parte viene del respaldo simulado
+    """
+    logger.info(f"🎯 Cargando predicción para municipio: {municipio}")
+    max_age = CACHE_DURATION_MINUTES * 60
+    
+    # Sistema de caché especial para Benalúa (datos más frecuentes)
+    if municipio.lower() in ['benalúa', 'benalua']:
+        logger.info("🏠 Municipio prioritario detectado - usando caché optimizado")
+        
+        # Intentar cargar desde caché primero
+        cached_data = get_benalua_cached_forecast()
+        if cached_data and is_cache_valid(cached_data.get('timestamp')):
+            logger.info("📂 Usando datos de Benalúa desde caché (válido)")
+            # Solo le queda la validez restante de la entrada en disco
+            return cached_data['data'], False, _cache_remaining_seconds(cached_data.get('timestamp'))
+        
+        # Si no hay caché válido, generar nuevos datos
+        logger.info("🔄 Generando nuevos datos desde AEMET para Benalúa")
+        quality, cache_enabled = 'premium', True  # Marca de calidad premium para Benalúa
+    else:
+        # Para otros municipios usar datos estándar
+        logger.info("📍 Municipio estándar - obteniendo datos desde AEMET")
+        quality, cache_enabled = 'standard', False
+    
+    forecast_data, hourly_data = fetch_aemet_forecast(municipio)
+    used_mock = forecast_data.empty or hourly_data.empty
+    if forecast_data.empty:
+        forecast_data = generate_enhanced_mock_forecast_data(municipio)
+    if hourly_data.empty:
+        hourly_data = generate_mock_hourly_data(municipio)
+    
+    data = {
+        'weekly': forecast_data.to_dict('records') if not forecast_data.empty else [],
+        'hourly': hourly_data.to_dict('records') if not hourly_data.empty else [],
+        'municipality': municipio,
+        'last_updated': datetime.now().isoformat(),
+        'data_quality': quality,
+        'cache_enabled': cache_enabled
+    }
+    
+    # Guardar en caché para próximas consultas (solo datos reales de AEMET)
+    if cache_enabled and not used_mock:
+        save_benalua_forecast_cache(data)
+    
+    return data, used_mock, max_age
+
+def get_forecast_payload(municipio):
+    """
+    Predicción del municipio compartida entre sesiones del mismo servidor.
+    
+    Las sesiones que consultan el mismo municipio reciben el mismo payload,
+    sin volver a leer el caché en disco ni llamar a AEMET, mientras siga
+    vigente (CACHE_DURATION_MINUTES, o lo que le quede a la entrada en disco
+    de Benalúa). Los payloads con datos simulados no se guardan: cada
+    consulta vuelve a intentar AEMET.
+    
+    Args:
+        municipio (str): Municipio seleccionado
+        
+    Returns:
+        dict: Ver _load_forecast_payload. Tratar como solo lectura.
+    """
+    key = municipio.lower()
+    now = time.monotonic()
+    cached = _FORECAST_PAYLOAD_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    payload, used_mock, max_age = _load_forecast_payload(municipio)
+    _FORECAST_PAYLOAD_CACHE.pop(key, None)
+    if not used_mock and max_age > 0:
+        if len(_FORECAST_PAYLOAD_CACHE) >= _FORECAST_PAYLOAD_CACHE_SIZE:
+            # Descartar la entrada más antigua (orden de inserción)
+            _FORECAST_PAYLOAD_CACHE.pop(next(iter(_FORECAST_PAYLOAD_CACHE)))
+        _FORECAST_PAYLOAD_CACHE[key] = (now + max_age, payload)
+    return payload
+
 def register_callbacks(app):
     """
     Registra todos los callbacks de predicción
@@ -926,62 +1069,13 @@ def register_callbacks(app):
     def update_forecast_data(municipio):
         """
         Actualiza los datos de predicción con sistema de caché inteligente para Benalúa
+        (ver get_forecast_payload)
         """
         try:
             if not municipio:
                 return {}, ""
             
-            logger.info(f"🎯 Cargando predicción para municipio: {municipio}")
-            
-            # Sistema de caché especial para Benalúa (datos más frecuentes)
-            if municipio.lower() in ['benalúa', 'benalua']:
-                logger.info("🏠 Municipio prioritario detectado - usando caché optimizado")
-                
-                # Intentar cargar desde caché primero
-                cached_data = get_benalua_cached_forecast()
-                if cached_data and is_cache_valid(cached_data.get('timestamp')):
-                    logger.info("📂 Usando datos de Benalúa desde caché (válido)")
-                    return cached_data['data'], municipio
-                
-                # Si no hay caché válido, generar nuevos datos
-                logger.info("🔄 Generando nuevos datos desde AEMET para Benalúa")
-                forecast_data, hourly_data = fetch_aemet_forecast(municipio)
-                if forecast_data.empty:
-                    forecast_data = generate_enhanced_mock_forecast_data(municipio)
-                if hourly_data.empty:
-                    hourly_data = generate_mock_hourly_data(municipio)
-                
-                # Preparar datos mejorados para Benalúa
-                data = {
-                    'weekly': forecast_data.to_dict('records') if not forecast_data.empty else [],
-                    'hourly': hourly_data.to_dict('records') if not hourly_data.empty else [],
-                    'municipality': municipio,
-                    'last_updated': datetime.now().isoformat(),
-                    'data_quality': 'premium',  # Marca de calidad premium para Benalúa
-                    'cache_enabled': True
-                }
-                
-                # Guardar en caché para próximas consultas
-                save_benalua_forecast_cache(data)
-                
-            else:
-                # Para otros municipios usar datos estándar
-                logger.info("📍 Municipio estándar - obteniendo datos desde AEMET")
-                forecast_data, hourly_data = fetch_aemet_forecast(municipio)
-                if forecast_data.empty:
-                    forecast_data = generate_enhanced_mock_forecast_data(municipio)
-                if hourly_data.empty:
-                    hourly_data = generate_mock_hourly_data(municipio)
-                
-                data = {
-                    'weekly': forecast_data.to_dict('records') if not forecast_data.empty else [],
-                    'hourly': hourly_data.to_dict('records') if not hourly_data.empty else [],
-                    'municipality': municipio,
-                    'last_updated': datetime.now().isoformat(),
-                    'data_quality': 'standard',
-                    'cache_enabled': False
-                }
-            
+            data = get_forecast_payload(municipio)
             return data, municipio
             
         except Exception as e:
@@ -1172,10 +1266,12 @@ def register_callbacks(app):
             return create_empty_forecast_chart(f"Error generando gráfico: {str(e)}")
     
     @app.callback(
-        Output("forecast-48h-chart", "figure"),
-        Input("forecast-data-store", "data")
+        [Output("forecast-48h-chart", "figure"),
+         Output("forecast-48h-state", "data")],
+        Input("forecast-data-store", "data"),
+        State("forecast-48h-state", "data")
     )
-    def update_48h_chart(forecast_data):
+    def update_48h_chart(forecast_data, state):
         """
         Actualiza el gráfico de predicción 48h con zonas de riesgo de repilo.
         
@@ -1185,11 +1281,15 @@ def register_callbacks(app):
         • Línea de humedad crítica >95% con marcadores especiales
         • Barras de precipitación que favorecen la dispersión de esporas
         • Marcadores especiales para condiciones críticas combinadas
+        
+        Si el gráfico montado ya muestra datos, solo se envían las trazas y la
+        escala de precipitación (el layout no cambia entre actualizaciones).
         """
+        chart_mode = (state or {}).get("chart_mode")
         try:
             if not forecast_data or not forecast_data.get('hourly'):
                 logger.warning("📅 No hay datos horarios disponibles para el gráfico 48h")
-                return create_48h_forecast_chart(pd.DataFrame())
+                return create_48h_forecast_chart(pd.DataFrame()), _chart_mode_patch("empty")
             
             # Convertir datos del store a DataFrame con validación
             df = pd.DataFrame(forecast_data['hourly'])
@@ -1221,11 +1321,15 @@ def register_callbacks(app):
             logger.info(f"  • Períodos con precipitación: {rain_periods}/{len(df)}")
             
             # Generar gráfico con zonas de riesgo resaltadas
-            return create_48h_forecast_chart(df)
+            fig = create_48h_forecast_chart(df)
+            
+            if chart_mode == "data":
+                return _forecast_48h_patch(fig), no_update
+            return fig, _chart_mode_patch("data")
             
         except Exception as e:
             logger.error(f"❌ Error crítico actualizando gráfico 48h con zonas de riesgo: {e}")
-            return create_48h_forecast_chart(pd.DataFrame())
+            return create_48h_forecast_chart(pd.DataFrame()), _chart_mode_patch("empty")
     
     @app.callback(
         Output("disease-risk-alerts", "children"),
@@ -1328,22 +1432,35 @@ def register_callbacks(app):
     # ===============================================================================
     
     @app.callback(
-        [Output("weekly-content", "style"),
-         Output("hourly-content", "style")],
-        Input("forecast-tabs", "active_tab")
+        Output("forecast-tab-content", "children"),
+        Input("forecast-tabs", "active_tab"),
+        prevent_initial_call=True
+    )
+    def render_forecast_tab(active_tab):
+        """
+        Muestra solo la sección de la tab activa (semanal por defecto).
+        
+        La sección oculta no se envía al navegador; al montarse, sus
+        callbacks de datos se ejecutan con el forecast-data-store actual.
+        """
+        if active_tab == "hourly-tab":
+            return create_48h_forecast_section()
+        return create_weekly_forecast_section()
+    
+    @app.callback(
+        Output("risk-guide-tab-body", "children"),
+        [Input("risk-guide-tabs", "active_tab"),
+         Input("risk-guide-modal", "is_open")],
+        prevent_initial_call=True
     )
-    def toggle_forecast_tabs(active_tab):
+    def render_risk_guide_tab(active_tab, is_open):
         """
-        Controla la visibilidad de las secciones de predicción según la tab activa.
-        Esto evita que se pierda el contenido al cambiar entre tabs.
+        Renderiza solo la pestaña activa de la guía de repilo, y solo con el
+        modal abierto: las demás no se envían ni se montan en el navegador.
         """
-        if active_tab == "weekly-tab":
-            return {'display': 'block'}, {'display': 'none'}
-        elif active_tab == "hourly-tab":
-            return {'display': 'none'}, {'display': 'block'}
-        else:
-            # Por defecto mostrar la predicción semanal
-            return {'display': 'block'}, {'display': 'none'}
+        if not is_open:
+            return no_update
+        return create_risk_guide_tab_body(active_tab)
     
     # ===============================================================================
     #                     CALLBACKS PARA ESTADOS DE RIESGO POR PERÍODO
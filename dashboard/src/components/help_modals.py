@@ -39,10 +39,19 @@ Curso: 2024-2025
 ===============================================================================
 """
 
+from functools import lru_cache
+
 import dash_bootstrap_components as dbc
-from dash import html, Input, Output, State
+from dash import html, Input, Output, State, no_update
+
+
+# Caché de modales ya construidos: (modal_id, title, id(secciones), size, lazy)
+# -> (secciones, modal). Se guarda la propia lista de secciones para que su id
+# no pueda reutilizarse mientras la entrada siga en caché.
+_INFO_MODAL_CACHE = {}
 
 
+@lru_cache(maxsize=None)
 def create_help_button(modal_id: str, button_text: str = "Ayuda", button_color: str = "outline-primary", button_size: str = "sm") -> dbc.Button:
     """
     Crea un botón de ayuda profesional y elegante que abrirá un modal informativo.
@@ -66,6 +75,10 @@ def create_help_button(modal_id: str, button_text: str = "Ayuda", button_color:
         • Integración con tema del dashboard
         • Accesibilidad mejorada
         • Responsive design
+    
+    Nota:
+        El resultado se memoiza por argumentos: los layouts que se reconstruyen
+        en cada cambio de pestaña reutilizan la misma instancia del botón.
     """
     return dbc.Button([
         html.I(className="fas fa-question-circle me-2", style={'fontSize': '0.9rem'}),
@@ -85,33 +98,16 @@ def create_help_button(modal_id: str, button_text: str = "Ayuda", button_color:
     )
 
 
-def create_info_modal(modal_id: str, title: str, content_sections: list, size: str = "xl") -> dbc.Modal:
+def _build_modal_sections(content_sections: list) -> list:
     """
-    Crea un modal informativo profesional con múltiples secciones organizadas.
-    
-    Diseñado para proporcionar información técnica y práctica de manera estructurada
-    y visualmente atractiva. Incluye iconografía profesional, navegación clara y
-    contenido adaptado para usuarios agrícolas con diferentes niveles técnicos.
+    Construye el contenido del cuerpo de un modal a partir de sus secciones.
     
     Args:
-        modal_id: ID único para el modal (usado para callbacks)
-        title: Título descriptivo del modal
-        content_sections: Lista de secciones con estructura:
-                         [{'title': str, 'content': html.Div, 'icon': str}]
-        size: Tamaño del modal ('xl' por defecto para mejor legibilidad)
+        content_sections: Lista de secciones {'title', 'content', 'icon'}
     
     Returns:
-        dbc.Modal: Componente Modal de Dash Bootstrap completamente estilizado
-        
-    Features:
-        • Design responsivo y profesional
-        • Iconografía consistente
-        • Navegación intuitiva
-        • Contenido estructurado
-        • Z-index optimizado
-        • Animaciones suaves
+        list: Componentes (cabeceras, contenidos y separadores) del cuerpo
     """
-    
     modal_body_content = []
     
     # Crear contenido organizado por secciones
@@ -147,6 +143,68 @@ def create_info_modal(modal_id: str, title: str, content_sections: list, size: s
         
         modal_body_content.extend([section_header, section_content])
     
+    return modal_body_content
+
+
+def create_info_modal(modal_id: str, title: str, content_sections: list, size: str = "xl", lazy: bool = False) -> dbc.Modal:
+    """
+    Crea un modal informativo profesional con múltiples secciones organizadas.
+    
+    Diseñado para proporcionar información técnica y práctica de manera estructurada
+    y visualmente atractiva. Incluye iconografía profesional, navegación clara y
+    contenido adaptado para usuarios agrícolas con diferentes niveles técnicos.
+    
+    Args:
+        modal_id: ID único para el modal (usado para callbacks)
+        title: Título descriptivo del modal
+        content_sections: Lista de secciones con estructura:
+                         [{'title': str, 'content': html.Div, 'icon': str}]
+        size: Tamaño del modal ('xl' por defecto para mejor legibilidad)
+        lazy: Si es True, el cuerpo se envía vacío y se rellena la primera vez
+              que se abre el modal (ver register_modal_callbacks), reduciendo
+              el tamaño del layout inicial
+    
+    Returns:
+        dbc.Modal: Componente Modal de Dash Bootstrap completamente estilizado
+        
+    Features:
+        • Design responsivo y profesional
+        • Iconografía consistente
+        • Navegación intuitiva
+        • Contenido estructurado
+        • Z-index optimizado
+        • Animaciones suaves
+    
+    Nota:
+        El modal se memoiza por (modal_id, title, content_sections, size, lazy);
+        content_sections se compara por identidad, como las tuplas de
+        MODAL_CONTENTS, que no cambian durante la vida del proceso.
+    """
+    cache_key = (modal_id, title, id(content_sections), size, lazy)
+    cached = _INFO_MODAL_CACHE.get(cache_key)
+    if cached is not None and cached[0] is content_sections:
+        return cached[1]
+    
+    modal = _build_info_modal(modal_id, title, content_sections, size, lazy)
+    _INFO_MODAL_CACHE[cache_key] = (content_sections, modal)
+    return modal
+
+
+def _build_info_modal(modal_id: str, title: str, content_sections: list, size: str, lazy: bool) -> dbc.Modal:
+    """
+    Construye el modal informativo (sin caché); ver create_info_modal.
+    
+    Returns:
+        dbc.Modal: Modal con cabecera, cuerpo y pie
+    """
+    if lazy:
+        # Cuerpo vacío: se rellena al abrir el modal por primera vez
+        body_kwargs = {'id': f"{modal_id}-body"}
+        modal_body_content = []
+    else:
+        body_kwargs = {}
+        modal_body_content = _build_modal_sections(content_sections)
+    
     return dbc.Modal([
         # Header mejorado con diseño profesional
         dbc.ModalHeader([
@@ -188,7 +246,8 @@ def create_info_modal(modal_id: str, title: str, content_sections: list, size: s
                 'overflowY': 'auto',
                 'padding': '1.5rem',
                 'backgroundColor': '#FFFFFF'
-            }
+            },
+            **body_kwargs
         ),
         
         # Footer con acciones adicionales
@@ -1568,6 +1627,12 @@ MODAL_CONTENTS = {
     }
 }
 
+# Secciones inmutables: create_info_modal memoiza cada modal por la identidad
+# de su tupla de secciones, que así no puede cambiar tras construirlo
+for _modal_content in MODAL_CONTENTS.values():
+    _modal_content['sections'] = tuple(_modal_content['sections'])
+del _modal_content
+
 
 def create_chart_help_section(chart_type: str, title: str = None) -> html.Div:
     """
@@ -1664,11 +1729,13 @@ def register_modal_callbacks(app):
         'alertas-detecciones': 'detecciones-alertas',
     }
 
-    # Construir lista de IDs base de modales
+    # Construir lista de IDs base de modales (y su contenido asociado)
     modal_bases = []
+    sections_by_base = {}
     for modal_key in MODAL_CONTENTS.keys():
         base = modal_id_map.get(modal_key, modal_key.replace('_', '-'))
         modal_bases.append(base)
+        sections_by_base.setdefault(base, MODAL_CONTENTS[modal_key]['sections'])
 
     # Eliminar duplicados preservando el orden
     all_modals = list(dict.fromkeys(modal_bases))
@@ -1709,6 +1776,29 @@ def register_modal_callbacks(app):
                     return not is_open
                 
                 return is_open
+            
+            # Relleno diferido del cuerpo para modales creados con lazy=True
+            # (si el layout no usa el modo diferido, el callback nunca se dispara)
+            @app.callback(
+                Output(f"{modal_id}-body", "children"),
+                Input(modal_id, "is_open"),
+                State(f"{modal_id}-body", "children"),
+                prevent_initial_call=True
+            )
+            def fill_lazy_body(is_open, current_children, _sections=sections_by_base[modal_base]):
+                """
+                Construye el contenido del modal la primera vez que se abre.
+                
+                Args:
+                    is_open: Estado actual del modal
+                    current_children: Contenido ya renderizado del cuerpo
+                    
+                Returns:
+                    list: Secciones del modal, o no_update si ya estaba relleno
+                """
+                if not is_open or current_children:
+                    return no_update
+                return _build_modal_sections(_sections)
                 
         except Exception as e:
             # Log del error sin interrumpir la carga de otros callbacks
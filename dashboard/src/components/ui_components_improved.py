@@ -3,10 +3,22 @@ Componentes de UI mejorados para Dashboard Agrícola
 Diseño profesional orientado a agricultores
 """
 
+from functools import lru_cache
+
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from src.app.app_config import AGRI_THEME, get_card_style, get_button_style
 
+# Tipos de argumento que permiten memoizar una factoría (inmutables y hashables).
+# Las cachés usan typed=True para que 1, 1.0 y True no compartan entrada
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _cacheable(*args):
+    """True si todos los argumentos son escalares inmutables."""
+    return all(isinstance(arg, _CACHEABLE_TYPES) for arg in args)
+
+
 def create_metric_card(title, value, unit="", icon=None, color="primary", change=None, description=None):
     """
     Crea una tarjeta de métrica profesional y clara
@@ -119,6 +131,11 @@ def create_alert_card(message, alert_type="info", title=None, dismissable=False)
     """
     Crea una tarjeta de alerta profesional
     
+    Las alertas con argumentos escalares se memoizan: los avisos fijos
+    ("Cargando datos...", "Sin Datos") se repiten en cada layout y callback,
+    y Dash solo serializa el árbol, sin mutarlo. Los llamadores no deben
+    modificar el componente devuelto.
+    
     Args:
         message: Mensaje de la alerta
         alert_type: Tipo ('success', 'warning', 'danger', 'info')
@@ -128,6 +145,19 @@ def create_alert_card(message, alert_type="info", title=None, dismissable=False)
     Returns:
         dbc.Alert: Componente de alerta
     """
+    if _cacheable(message, alert_type, title, dismissable):
+        return _cached_alert_card(message, alert_type, title, dismissable)
+    return _build_alert_card(message, alert_type, title, dismissable)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _cached_alert_card(message, alert_type, title, dismissable):
+    """Versión memoizada de _build_alert_card."""
+    return _build_alert_card(message, alert_type, title, dismissable)
+
+
+def _build_alert_card(message, alert_type, title, dismissable):
+    """Construye la alerta (ver create_alert_card)."""
     icon_map = {
         'success': 'fas fa-check-circle',
         'warning': 'fas fa-exclamation-triangle',
@@ -174,6 +204,9 @@ def create_section_header(title, subtitle=None, icon=None, actions=None):
     """
     Crea un header de sección consistente
     
+    Los headers sin acciones se memoizan por (title, subtitle, icon): son
+    texto estático y se repiten en cada reconstrucción de los layouts.
+    
     Args:
         title: Título de la sección
         subtitle: Subtítulo opcional
@@ -183,6 +216,19 @@ def create_section_header(title, subtitle=None, icon=None, actions=None):
     Returns:
         html.Div: Header de sección
     """
+    if actions is None and _cacheable(title, subtitle, icon):
+        return _cached_section_header(title, subtitle, icon)
+    return _build_section_header(title, subtitle, icon, actions)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _cached_section_header(title, subtitle, icon):
+    """Versión memoizada de _build_section_header para headers sin acciones."""
+    return _build_section_header(title, subtitle, icon, None)
+
+
+def _build_section_header(title, subtitle, icon, actions):
+    """Construye el header de sección (sin caché); ver create_section_header."""
     header_content = []
     
     # Icono y título
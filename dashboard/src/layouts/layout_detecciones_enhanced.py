@@ -10,41 +10,66 @@ import dash_bootstrap_components as dbc
 from dash import html, dcc
 import dash_leaflet as dl
 
-from src.app.app_config import AGRI_THEME, get_card_style, get_button_style
+from src.app.app_config import AGRI_THEME, get_card_style, get_button_style, intern_style, intern_class
 from src.components.help_modals import (
     create_help_button,
     create_info_modal,
     MODAL_CONTENTS,
 )
 
+# ---------- Estilos y clases compartidos ----------
+
+_CENTER_MUTED = intern_class("text-center text-muted")
+_HEADER_ROW = intern_class("d-flex justify-content-between align-items-center mb-3")
+_HEADER_ROW_SM = intern_class("d-flex justify-content-between align-items-center mb-2")
+_FILTER_LABEL_STYLE = intern_style({'fontWeight': 600, 'marginBottom': '0.35rem'})
+_METRIC_ENHANCED = intern_style({
+    **get_card_style('metric'),
+    'border': 'none',
+    'boxShadow': '0 4px 20px rgba(46, 125, 50, 0.08)',
+    'transition': 'all 0.3s ease',
+    'borderRadius': '12px'
+})
+
+# Texto estático del pie informativo: un único nodo en lugar de un subárbol
+_SISTEMA_INFO_MD = (
+    f'<i class="fas fa-info-circle me-2" style="color: {AGRI_THEME["colors"]["primary"]}"></i>'
+    '<span class="text-muted small">Sistema de Detección de Repilo - '
+    '<strong>Monitoreo en Tiempo Real</strong>'
+    ' | Datos sincronizados con Bot de Telegram</span>'
+)
+
 # ---------- Pequeños helpers UI ----------
 
+def _severity_chip_style(background):
+    return intern_style({
+        'padding': '0 8px', 'borderRadius': '999px',
+        'border': f'1px solid {AGRI_THEME["colors"]["border_light"]}', 'background': background
+    })
+
+
+def _agri_card(children, variant='', style=None):
+    """Tarjeta plana: un único <section> estilado por .agri-card en lugar de Card > CardBody"""
+    class_name = f"agri-card {variant}" if variant else "agri-card"
+    if style is None:
+        return html.Section(children, className=class_name)
+    return html.Section(children, className=class_name, style=style)
+
+
 def _card_metric(title, value_id, icon_class, color_key):
     color = AGRI_THEME['colors'][color_key]
-    enhanced_style = get_card_style('metric').copy()
-    enhanced_style.update({
-        'border': 'none',
-        'boxShadow': '0 4px 20px rgba(46, 125, 50, 0.08)',
-        'transition': 'all 0.3s ease',
-        'borderRadius': '12px'
-    })
-    
-    return dbc.Card(
-        dbc.CardBody([
-            html.Div([html.I(className=icon_class)], className="text-center mb-2",
-                     style={'fontSize': '2rem', 'color': color}),
-            html.H2(id=value_id, children="—", className="text-center",
-                    style={'color': color, 'fontWeight': 800, 'margin': 0}),
-            html.Div(title, className="text-center text-muted", style={'marginTop': '0.35rem'})
-        ]),
-        style=enhanced_style,
-        className="severity-metric-card"
-    )
+    return _agri_card([
+        html.Div([html.I(className=icon_class)], className="text-center mb-2",
+                 style=intern_style({'fontSize': '2rem', 'color': color})),
+        html.H2(id=value_id, children="—", className="text-center",
+                style=intern_style({'color': color, 'fontWeight': 800, 'margin': 0})),
+        html.Div(title, className=_CENTER_MUTED, style=intern_style({'marginTop': '0.35rem'}))
+    ], variant="severity-metric-card", style=_METRIC_ENHANCED)
 
 
 def _filters_bar():
     """Barra de filtros con los IDs que usa detecciones.py"""
-    btn_style = get_button_style('filter', 'sm')
+    btn_style = intern_style(get_button_style('filter', 'sm'))
     return dbc.Card([
         dbc.CardHeader([
             html.H6("Controles de visualización", className="mb-0"),
@@ -59,27 +84,27 @@ def _filters_bar():
             dbc.Row([
                 # Botones de período
                 dbc.Col([
-                    html.Div("Período", className="text-muted", style={'fontWeight': 600, 'marginBottom': '0.35rem'}),
+                    html.Div("Período", className="text-muted", style=_FILTER_LABEL_STYLE),
                     dbc.ButtonGroup([
                         dbc.Button("Últ. semana", id="btn-week", style=btn_style),
                         dbc.Button("Últ. mes", id="btn-month", style=btn_style),
                         dbc.Button("Todo", id="btn-all", style=btn_style),
                         dbc.Button([html.I(className="fas fa-sync-alt me-1"), "Actualizar"], id="btn-refresh",
-                                   style=get_button_style('outline', 'sm'))
+                                   style=intern_style(get_button_style('outline', 'sm')))
                     ])
                 ], md=8),
 
                 # Checklist Severidad
                 dbc.Col([
-                    html.Div("Filtrar por severidad", className="text-muted", style={'fontWeight': 600, 'marginBottom': '0.35rem'}),
+                    html.Div("Filtrar por severidad", className="text-muted", style=_FILTER_LABEL_STYLE),
                     dcc.Checklist(
                         id="severity-filter",
                         options=[
-                            {'label': html.Span("1", style={'padding': '0 8px', 'borderRadius': '999px', 'border': f'1px solid {AGRI_THEME["colors"]["border_light"]}', 'background': '#E8F5E9'}), 'value': 1},
-                            {'label': html.Span("2", style={'padding': '0 8px', 'borderRadius': '999px', 'border': f'1px solid {AGRI_THEME["colors"]["border_light"]}', 'background': '#FFFDE7'}), 'value': 2},
-                            {'label': html.Span("3", style={'padding': '0 8px', 'borderRadius': '999px', 'border': f'1px solid {AGRI_THEME["colors"]["border_light"]}', 'background': '#FFF3E0'}), 'value': 3},
-                            {'label': html.Span("4", style={'padding': '0 8px', 'borderRadius': '999px', 'border': f'1px solid {AGRI_THEME["colors"]["border_light"]}', 'background': '#FFEBEE'}), 'value': 4},
-                            {'label': html.Span("5", style={'padding': '0 8px', 'borderRadius': '999px', 'border': f'1px solid {AGRI_THEME["colors"]["border_light"]}', 'background': '#F3E5F5'}), 'value': 5},
+                            {'label': html.Span("1", style=_severity_chip_style('#E8F5E9')), 'value': 1},
+                            {'label': html.Span("2", style=_severity_chip_style('#FFFDE7')), 'value': 2},
+                            {'label': html.Span("3", style=_severity_chip_style('#FFF3E0')), 'value': 3},
+                            {'label': html.Span("4", style=_severity_chip_style('#FFEBEE')), 'value': 4},
+                            {'label': html.Span("5", style=_severity_chip_style('#F3E5F5')), 'value': 5},
                         ],
                         value=[1, 2, 3, 4, 5],
                         inputStyle={'marginRight': '6px'},
@@ -88,7 +113,7 @@ def _filters_bar():
                 ], md=4)
             ], className="g-2")
         ])
-    ], style=get_card_style())
+    ], style=intern_style(get_card_style()))
 
 
 
@@ -112,12 +137,12 @@ def _header():
                     content_sections=MODAL_CONTENTS['detecciones']['sections'],
                 ),
             ], className="ms-auto"),
-        ], className="d-flex justify-content-between align-items-center mb-2"),
+        ], className=_HEADER_ROW_SM),
         html.P(
             "Monitoreo de imágenes de campo recibidas por Telegram: ubicación, fecha y severidad.",
             className="text-muted mb-3"
         )
-    ], style=get_card_style())
+    ], style=intern_style(get_card_style()))
 
 
 def _metrics_row():
@@ -129,7 +154,7 @@ def _metrics_row():
             title=MODAL_CONTENTS['metricas-detecciones']['title'],
             content_sections=MODAL_CONTENTS['metricas-detecciones']['sections'],
         ),
-    ], className="d-flex justify-content-between align-items-center mb-3")
+    ], className=_HEADER_ROW)
 
     row = dbc.Row([
         dbc.Col(_card_metric("Total histórico", "total-detections", "fas fa-database", "info"), lg=2, md=6, className="mb-3"),
@@ -146,142 +171,130 @@ def _metrics_row():
 
 def _severity_distribution_card():
     """Tarjeta de distribución de severidad con gráfico circular"""
-    return dbc.Card(
-        dbc.CardBody([
-            html.Div([
-                html.H6(
-                    [html.I(className="fas fa-chart-pie me-2"), "Distribución por Severidad"],
-                    className="mb-0",
-                    style={'color': AGRI_THEME['colors']['primary']}
-                ),
-                create_help_button("modal-detecciones-distribucion", button_color="outline-primary"),
-                create_info_modal(
-                    modal_id="modal-detecciones-distribucion",
-                    title=MODAL_CONTENTS['distribucion-detecciones']['title'],
-                    content_sections=MODAL_CONTENTS['distribucion-detecciones']['sections'],
-                ),
-            ], className="d-flex justify-content-between align-items-center mb-2"),
-            dcc.Loading(
-                dcc.Graph(id="severity-distribution", style={'height': '200px'},
-                          config={'displayModeBar': False}),
-                type="circle", color=AGRI_THEME['colors']['primary']
-            )
-        ]),
-        style=get_card_style()
-    )
+    return _agri_card([
+        html.Div([
+            html.H6(
+                [html.I(className="fas fa-chart-pie me-2"), "Distribución por Severidad"],
+                className="mb-0",
+                style=intern_style({'color': AGRI_THEME['colors']['primary']})
+            ),
+            create_help_button("modal-detecciones-distribucion", button_color="outline-primary"),
+            create_info_modal(
+                modal_id="modal-detecciones-distribucion",
+                title=MODAL_CONTENTS['distribucion-detecciones']['title'],
+                content_sections=MODAL_CONTENTS['distribucion-detecciones']['sections'],
+            ),
+        ], className=_HEADER_ROW_SM),
+        dcc.Loading(
+            dcc.Graph(id="severity-distribution", style={'height': '200px'},
+                      config={'displayModeBar': False}),
+            type="circle", color=AGRI_THEME['colors']['primary']
+        )
+    ])
 
 def _alert_status_card():
     """Tarjeta de estado de alertas"""
-    return dbc.Card(
-        dbc.CardBody([
+    return _agri_card([
+        html.Div([
+            html.H6(
+                [html.I(className="fas fa-shield-alt me-2"), "Estado de Alertas"],
+                className="mb-0",
+                style=intern_style({'color': AGRI_THEME['colors']['danger']})
+            ),
+            create_help_button("modal-detecciones-alertas", button_color="outline-primary"),
+            create_info_modal(
+                modal_id="modal-detecciones-alertas",
+                title=MODAL_CONTENTS['alertas-detecciones']['title'],
+                content_sections=MODAL_CONTENTS['alertas-detecciones']['sections'],
+            ),
+        ], className=_HEADER_ROW),
+        html.Div(id="alert-status-content", children=[
             html.Div([
-                html.H6(
-                    [html.I(className="fas fa-shield-alt me-2"), "Estado de Alertas"],
-                    className="mb-0",
-                    style={'color': AGRI_THEME['colors']['danger']}
-                ),
-                create_help_button("modal-detecciones-alertas", button_color="outline-primary"),
-                create_info_modal(
-                    modal_id="modal-detecciones-alertas",
-                    title=MODAL_CONTENTS['alertas-detecciones']['title'],
-                    content_sections=MODAL_CONTENTS['alertas-detecciones']['sections'],
-                ),
-            ], className="d-flex justify-content-between align-items-center mb-3"),
-            html.Div(id="alert-status-content", children=[
-                html.Div([
-                    html.I(className="fas fa-spinner fa-spin me-2"),
-                    "Calculando..."
-                ], className="text-muted text-center")
-            ])
-        ]),
-        style=get_card_style()
-    )
+                html.I(className="fas fa-spinner fa-spin me-2"),
+                "Calculando..."
+            ], className="text-muted text-center")
+        ])
+    ])
 
 def _map_block():
     """Mapa satélite + capas por severidad + overlay de carga"""
-    return dbc.Card(
-        dbc.CardBody([
-            html.Div([
-                html.H6(
-                    [html.I(className="fas fa-map-marked-alt me-2"), "Mapa de detecciones"],
-                    className="mb-0",
-                    style={'color': AGRI_THEME['colors']['primary']}
-                ),
-                create_help_button("modal-detecciones-mapa", button_color="outline-primary"),
-                create_info_modal(
-                    modal_id="modal-detecciones-mapa",
-                    title=MODAL_CONTENTS['mapa-detecciones']['title'],
-                    content_sections=MODAL_CONTENTS['mapa-detecciones']['sections'],
-                ),
-                dbc.Button([html.I(className="fas fa-expand-arrows-alt me-2"), "Ajustar vista"],
-                           id="btn-fit-bounds", size="sm", color="secondary", className="ms-auto")
-            ], className="d-flex align-items-center mb-2"),
+    return _agri_card([
+        html.Div([
+            html.H6(
+                [html.I(className="fas fa-map-marked-alt me-2"), "Mapa de detecciones"],
+                className="mb-0",
+                style=intern_style({'color': AGRI_THEME['colors']['primary']})
+            ),
+            create_help_button("modal-detecciones-mapa", button_color="outline-primary"),
+            create_info_modal(
+                modal_id="modal-detecciones-mapa",
+                title=MODAL_CONTENTS['mapa-detecciones']['title'],
+                content_sections=MODAL_CONTENTS['mapa-detecciones']['sections'],
+            ),
+            dbc.Button([html.I(className="fas fa-expand-arrows-alt me-2"), "Ajustar vista"],
+                       id="btn-fit-bounds", size="sm", color="secondary", className="ms-auto")
+        ], className="d-flex align-items-center mb-2"),
 
-            html.Div([
-                dl.Map(
-                    id="detections-map",
-                    center=[37.2387, -3.6712], zoom=12,
-                    style={"width": "100%", "height": "560px", "borderRadius": "12px",
-                           "border": f'1px solid {AGRI_THEME["colors"]["border_light"]}'},
-                    children=[
-                        dl.TileLayer(
-                            url="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
-                            attribution="Tiles © Esri — Source: Esri, Maxar, Earthstar Geographics"
-                        ),
-                        dl.LayersControl(position="topright", children=[
-                            dl.Overlay(dl.LayerGroup(id="severity-1-group"), name="🟢 Severidad 1", checked=True),
-                            dl.Overlay(dl.LayerGroup(id="severity-2-group"), name="🟡 Severidad 2", checked=True),
-                            dl.Overlay(dl.LayerGroup(id="severity-3-group"), name="🟠 Severidad 3", checked=True),
-                            dl.Overlay(dl.LayerGroup(id="severity-4-group"), name="🔴 Severidad 4", checked=True),
-                            dl.Overlay(dl.LayerGroup(id="severity-5-group"), name="🟣 Severidad 5", checked=True),
-                            dl.Overlay(
-                                dl.GeoJSON(id="detections-kml", data=None,
-                                           options=dict(style=dict(weight=2, color="#FF5722", fillOpacity=0.3)),
-                                           zoomToBoundsOnClick=True),
-                                name="📊 Datos KML", checked=False
-                            )
-                        ]),
-                    ]
-                ),
-                # Overlay de carga (lo alterna detecciones.py)
-                html.Div(
-                    id="map-loading-overlay",
-                    children=html.Div([dbc.Spinner(size="lg", color="success"),
-                                       html.Div("Actualizando mapa…", className="mt-2 text-muted")],
-                                      className="text-center p-3"),
-                    style={'display': 'none', 'position': 'absolute', 'inset': 0,
-                           'background': 'rgba(255,255,255,0.7)', 'borderRadius': '12px'}
-                ),
-            ], style={'position': 'relative'})
-        ]),
-        style=get_card_style()
-    )
+        html.Div([
+            dl.Map(
+                id="detections-map",
+                center=[37.2387, -3.6712], zoom=12,
+                style={"width": "100%", "height": "560px", "borderRadius": "12px",
+                       "border": f'1px solid {AGRI_THEME["colors"]["border_light"]}'},
+                children=[
+                    dl.TileLayer(
+                        url="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+                        attribution="Tiles © Esri — Source: Esri, Maxar, Earthstar Geographics"
+                    ),
+                    dl.LayersControl(position="topright", children=[
+                        dl.Overlay(dl.LayerGroup(id="severity-1-group"), name="🟢 Severidad 1", checked=True),
+                        dl.Overlay(dl.LayerGroup(id="severity-2-group"), name="🟡 Severidad 2", checked=True),
+                        dl.Overlay(dl.LayerGroup(id="severity-3-group"), name="🟠 Severidad 3", checked=True),
+                        dl.Overlay(dl.LayerGroup(id="severity-4-group"), name="🔴 Severidad 4", checked=True),
+                        dl.Overlay(dl.LayerGroup(id="severity-5-group"), name="🟣 Severidad 5", checked=True),
+                        dl.Overlay(
+                            dl.GeoJSON(id="detections-kml", data=None,
+                                       options=dict(style=dict(weight=2, color="#FF5722", fillOpacity=0.3)),
+                                       zoomToBoundsOnClick=True),
+                            name="📊 Datos KML", checked=False
+                        )
+                    ]),
+                ]
+            ),
+            # Overlay de carga (lo alterna detecciones.py)
+            html.Div(
+                id="map-loading-overlay",
+                children=html.Div([dbc.Spinner(size="lg", color="success"),
+                                   html.Div("Actualizando mapa…", className="mt-2 text-muted")],
+                                  className="text-center p-3"),
+                style={'display': 'none', 'position': 'absolute', 'inset': 0,
+                       'background': 'rgba(255,255,255,0.7)', 'borderRadius': '12px'}
+            ),
+        ], style={'position': 'relative'})
+    ])
 
 
 def _timeline_block():
-    return dbc.Card(
-        dbc.CardBody([
-            html.Div([
-                html.H6(
-                    [html.I(className="fas fa-chart-area me-2"), "Evolución temporal"],
-                    className="mb-0",
-                    style={'color': AGRI_THEME['colors']['secondary']}
-                ),
-                create_help_button("modal-detecciones-timeline", button_color="outline-primary"),
-                create_info_modal(
-                    modal_id="modal-detecciones-timeline",
-                    title=MODAL_CONTENTS['timeline-detecciones']['title'],
-                    content_sections=MODAL_CONTENTS['timeline-detecciones']['sections'],
-                ),
-            ], className="d-flex justify-content-between align-items-center mb-3"),
-            dcc.Loading(
-                dcc.Graph(id="detections-timeline", style={'height': '450px'},
-                          config={'displayModeBar': True, 'displaylogo': False}),
-                type="circle", color=AGRI_THEME['colors']['secondary']
-            )
-        ]),
-        style=get_card_style('highlight')
-    )
+    return _agri_card([
+        html.Div([
+            html.H6(
+                [html.I(className="fas fa-chart-area me-2"), "Evolución temporal"],
+                className="mb-0",
+                style=intern_style({'color': AGRI_THEME['colors']['secondary']})
+            ),
+            create_help_button("modal-detecciones-timeline", button_color="outline-primary"),
+            create_info_modal(
+                modal_id="modal-detecciones-timeline",
+                title=MODAL_CONTENTS['timeline-detecciones']['title'],
+                content_sections=MODAL_CONTENTS['timeline-detecciones']['sections'],
+            ),
+        ], className=_HEADER_ROW),
+        dcc.Loading(
+            dcc.Graph(id="detections-timeline", style={'height': '450px'},
+                      config={'displayModeBar': True, 'displaylogo': False}),
+            type="circle", color=AGRI_THEME['colors']['secondary']
+        )
+    ], variant="highlight")
 
 
 
@@ -339,14 +352,7 @@ def build_layout_detecciones_enhanced():
             # Footer informativo
             html.Div([
                 html.Hr(className="my-4", style={'border': 'none', 'height': '1px', 'background': 'linear-gradient(90deg, transparent, rgba(46, 125, 50, 0.3), transparent)'}),
-                html.Div([
-                    html.I(className="fas fa-info-circle me-2", style={'color': AGRI_THEME['colors']['primary']}),
-                    html.Span([
-                        "Sistema de Detección de Repilo - ",
-                        html.Strong("Monitoreo en Tiempo Real"),
-                        " | Datos sincronizados con Bot de Telegram"
-                    ], className="text-muted small")
-                ], className="text-center")
+                dcc.Markdown(_SISTEMA_INFO_MD, dangerously_allow_html=True, className="text-center")
             ])
             
         ], style=custom_styles['detections-dashboard']),
@@ -361,7 +367,7 @@ def build_layout_detecciones_enhanced():
             dbc.ModalBody([
                 html.Div([
                     dbc.Spinner(size="lg", color="success"),
-                    html.H4("Procesando Detecciones", className="mt-3 mb-2", style={'color': AGRI_THEME['colors']['primary']}),
+                    html.H4("Procesando Detecciones", className="mt-3 mb-2", style=intern_style({'color': AGRI_THEME['colors']['primary']})),
                     html.P("Actualizando datos desde el sistema de monitoreo...", className="text-muted mb-0"),
                     html.Div([
                         html.I(className="fas fa-microscope me-2"),
@@ -370,4 +376,4 @@ def build_layout_detecciones_enhanced():
                 ], className="text-center p-3")
             ])
         ], id="global-loading-modal", backdrop="static", keyboard=False, centered=True, size="sm")
-    ], style={'fontFamily': AGRI_THEME['fonts']['primary']})
+    ], style=intern_style({'fontFamily': AGRI_THEME['fonts']['primary']}))
@@ -44,13 +44,18 @@ Versión: 2.1 Improved
 #                                 IMPORTS
 # ===============================================================================
 
+# Librerías estándar
+from functools import lru_cache
+
 # Framework Dash
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 import dash_leaflet as dl
 
 # Configuración de la aplicación
-from src.app.app_config import AGRI_THEME, get_card_style, get_button_style
+from src.app.app_config import (
+    AGRI_THEME, MAP_TILES, TILE_LAYER_OPTIONS, get_card_style, get_button_style
+)
 
 # Componentes UI especializados
 from src.components.ui_components_improved import (
@@ -66,10 +71,48 @@ from src.components.help_modals import (
     MODAL_CONTENTS,
 )
 
+# ===============================================================================
+#                        ESTILOS PRECALCULADOS DEL LAYOUT
+# ===============================================================================
+
+# Los estilos fijos (etiquetas, textos auxiliares, mapa, contenedor raíz)
+# viven en assets/fincas_enhanced_styles.css; aquí solo quedan los que
+# derivan de los helpers de tema compartidos.
+
+# Botones de acción y tarjetas
+_BTN_PRIMARY_STYLE = get_button_style('primary')
+_BTN_OUTLINE_STYLE = get_button_style('outline')
+_CARD_STYLE = get_card_style()
+_CARD_HEADER_STYLE = {'backgroundColor': AGRI_THEME['colors']['bg_light']}
+
+# Estilo de la capa de fincas: función JS en assets/fincas_map.js que lee
+# colores y finca resaltada desde `hideout` (restilar no reenvía el GeoJSON)
+_FINCAS_STYLE_FN = {"variable": "agriMap.fincas.style"}
+_FINCAS_HIDEOUT = {
+    "color": AGRI_THEME['colors']['success'],
+    "selectedColor": AGRI_THEME['colors']['primary'],
+    "weight": 3,
+    "fillOpacity": 0.2,
+    "selected": None,
+}
+
+# Estado vacío de la lista de fincas, compartido con refrescar_lista (fincas.py)
+EMPTY_FINCAS_MSG = dbc.Alert([
+    html.I(className="fas fa-info-circle me-2"),
+    "No hay fincas registradas. Cree su primera finca usando el mapa."
+], color="info", className="text-center mb-0")
+
+# Contenidos de ayuda (título, secciones) resueltos una vez al importar
+_HELP_MODALS = {
+    key: (MODAL_CONTENTS[key]['title'], MODAL_CONTENTS[key]['sections'])
+    for key in ('nueva-finca', 'mapa-fincas', 'estadisticas', 'gestion-fincas')
+}
+
 # ===============================================================================
 #                        FUNCIÓN PRINCIPAL DE CONSTRUCCIÓN
 # ===============================================================================
 
+@lru_cache(maxsize=1)
 def build_layout_fincas_improved():
     """
     Construye el layout completo para gestión avanzada de fincas agrícolas.
@@ -101,9 +144,12 @@ def build_layout_fincas_improved():
         
     Note:
         Diseñado para trabajar con callbacks en fincas.py para
-        funcionalidad completa de gestión.
+        funcionalidad completa de gestión. El layout es completamente
+        estático, por lo que se construye una sola vez y las llamadas
+        posteriores devuelven el mismo árbol cacheado (Dash solo lo
+        serializa, nunca lo muta).
     """
-    return html.Div([
+    return html.Div((
         # ===============================================================
         #                    HEADER Y CONTEXTO
         # ===============================================================
@@ -149,8 +195,9 @@ def build_layout_fincas_improved():
                             create_help_button("modal-nueva-finca", button_color="outline-primary"),
                             create_info_modal(
                                 modal_id="modal-nueva-finca",
-                                title=MODAL_CONTENTS['nueva-finca']['title'],
-                                content_sections=MODAL_CONTENTS['nueva-finca']['sections'],
+                                title=_HELP_MODALS['nueva-finca'][0],
+                                content_sections=_HELP_MODALS['nueva-finca'][1],
+                                lazy=True,
                             ),
                         ],
                     ),
@@ -159,30 +206,20 @@ def build_layout_fincas_improved():
                         html.Div([
                             html.Label(
                                 "Nombre de la Finca",
-                                style={
-                                    'fontSize': AGRI_THEME['fonts']['sizes']['md'],
-                                    'fontWeight': '600',
-                                    'color': AGRI_THEME['colors']['primary'],
-                                    'marginBottom': '0.5rem',
-                                    'fontFamily': AGRI_THEME['fonts']['primary']
-                                }
+                                className="agri-label"
                             ),
                             dcc.Input(
                                 id="input-nombre-finca",
                                 type="text",
                                 placeholder="Ej: Olivar Norte - Picual 2020",
-                                style={
-                                    'width': '100%',
-                                    'fontFamily': AGRI_THEME['fonts']['primary']
-                                },
-                                className="form-control-agri mb-3"
+                                # Un único envío por ráfaga de tecleo; numérico (no True)
+                                # para que el botón Guardar se habilite sin perder el foco
+                                debounce=0.3,
+                                className="form-control-agri w-100 mb-3"
                             ),
                             html.Small(
                                 "Incluya ubicación y características distintivas",
-                                style={
-                                    'color': AGRI_THEME['colors']['text_secondary'],
-                                    'fontSize': AGRI_THEME['fonts']['sizes']['xs']
-                                }
+                                className="agri-small"
                             )
                         ], className="mb-3"),
 
@@ -191,11 +228,7 @@ def build_layout_fincas_improved():
                         html.Small(
                             "La superficie se calculará automáticamente al dibujar en el mapa "
                             "(no es necesario introducirla).",
-                            style={
-                                'color': AGRI_THEME['colors']['text_secondary'],
-                                'fontSize': AGRI_THEME['fonts']['sizes']['xs'],
-                                'fontStyle': 'italic'
-                            }
+                            className="agri-small fst-italic"
                         ),
 
                         # ===== BOTONES DE ACCIÓN =====
@@ -203,19 +236,19 @@ def build_layout_fincas_improved():
                             html.Button(
                                 [html.I(className="fas fa-save me-2"), "Guardar Finca"],
                                 id="btn-guardar-finca",
-                                style=get_button_style('primary'),
+                                style=_BTN_PRIMARY_STYLE,
                                 className="me-3 mt-3",
                                 disabled=True  # Habilitado por callback cuando hay geometría
                             ),
                             html.Button(
                                 [html.I(className="fas fa-redo me-2"), "Limpiar Formulario"],
                                 id="btn-limpiar-finca",
-                                style=get_button_style('outline'),
+                                style=_BTN_OUTLINE_STYLE,
                                 className="mt-3"
                             )
-                        ], style={'textAlign': 'center'})
+                        ], className="text-center")
                     ])
-                ], style=get_card_style())
+                ], style=_CARD_STYLE)
             ], md=4),
 
             # ===== MAPA INTERACTIVO CON HERRAMIENTAS =====
@@ -228,8 +261,9 @@ def build_layout_fincas_improved():
                             create_help_button("modal-mapa-fincas", button_color="outline-primary"),
                             create_info_modal(
                                 modal_id="modal-mapa-fincas",
-                                title=MODAL_CONTENTS['mapa-fincas']['title'],
-                                content_sections=MODAL_CONTENTS['mapa-fincas']['sections'],
+                                title=_HELP_MODALS['mapa-fincas'][0],
+                                content_sections=_HELP_MODALS['mapa-fincas'][1],
+                                lazy=True,
                             ),
                         ],
                     ),
@@ -248,43 +282,36 @@ def build_layout_fincas_improved():
                                     [html.I(className="fas fa-map me-2"), "Calles"],
                                     id="btn-vista-calles",
                                     color="primary",
-                                    size="sm",
-                                    style={'fontSize': '12px'}
+                                    size="sm"
                                 ),
                                 dbc.Button(
                                     [html.I(className="fas fa-satellite me-2"), "Satélite"],
                                     id="btn-vista-satelite",
                                     color="outline-primary",
-                                    size="sm",
-                                    style={'fontSize': '12px'}
+                                    size="sm"
                                 )
-                            ], className="mb-3")
-                        ], style={'textAlign': 'center'}),
+                            ], className="finca-btn-group mb-3")
+                        ], className="text-center"),
 
                         # ===== MAPA INTERACTIVO CON HERRAMIENTAS DE DIBUJO =====
                         html.Div([
                             dl.Map(
                                 id="mapa-fincas",
                                 children=[
-                                    # Capa base cartográfica (OpenStreetMap)
+                                    # Capa base cartográfica (OpenStreetMap vía CDN de CARTO)
                                     dl.TileLayer(
                                         id="capa-base",
-                                        url="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png",
-                                        attribution="© OpenStreetMap contributors"
+                                        url=MAP_TILES['streets']['url'],
+                                        attribution=MAP_TILES['streets']['attribution'],
+                                        **TILE_LAYER_OPTIONS
                                     ),
                                     
                                     # Capa de fincas existentes (GeoJSON)
                                     dl.GeoJSON(
                                         id="fincas-existentes-layer",
                                         data={"type": "FeatureCollection", "features": []},
-                                        options={
-                                            "style": {
-                                                "color": AGRI_THEME['colors']['success'],
-                                                "weight": 3,
-                                                "fillOpacity": 0.2,
-                                                "fillColor": AGRI_THEME['colors']['success']
-                                            }
-                                        },
+                                        style=_FINCAS_STYLE_FN,
+                                        hideout=_FINCAS_HIDEOUT,
                                         hoverStyle={
                                             "weight": 4,
                                             "color": AGRI_THEME['colors']['primary'],
@@ -311,22 +338,19 @@ def build_layout_fincas_improved():
                                                     }
                                                 },
                                             },
-                                            edit={"remove": True, "edit": True},  # Permitir edición y eliminación
+                                            # Solo eliminación: sin manejadores de edición de vértices
+                                            # (un trazado erróneo se borra y se vuelve a dibujar)
+                                            edit={"remove": True, "edit": False},
                                         )
                                     ], id="draw-feature-group"),
                                 ],
-                                style={
-                                    "width": "100%",
-                                    "height": "500px",
-                                    "borderRadius": "8px",
-                                    "border": f"2px solid {AGRI_THEME['colors']['primary']}"
-                                },
+                                className="agri-map",
                                 center=[37.2387, -3.6712],  # Coordenadas Benalúa, Almería
                                 zoom=14
                             )
                         ], className="map-container")
                     ])
-                ], style=get_card_style())
+                ], style=_CARD_STYLE)
             ], md=8)
         ], className="mb-4"),
 
@@ -343,8 +367,9 @@ def build_layout_fincas_improved():
                     create_help_button("modal-estadisticas", button_color="outline-primary"),
                     create_info_modal(
                         modal_id="modal-estadisticas",
-                        title=MODAL_CONTENTS['estadisticas']['title'],
-                        content_sections=MODAL_CONTENTS['estadisticas']['sections'],
+                        title=_HELP_MODALS['estadisticas'][0],
+                        content_sections=_HELP_MODALS['estadisticas'][1],
+                        lazy=True,
                     ),
                 ],
             ),
@@ -361,29 +386,25 @@ def build_layout_fincas_improved():
                     dbc.CardHeader(
                         html.Div([
                             html.Div([
-                                html.I(className="fas fa-list-alt me-2", style={'color': AGRI_THEME['colors']['primary']}),
+                                html.I(className="fas fa-list-alt me-2 icon-primary"),
                                 html.H4("Fincas Registradas", className="mb-0 d-inline")
                             ], className="d-flex align-items-center"),
                             html.Div([
                                 create_help_button("modal-gestion-fincas", button_color="outline-primary"),
                                 create_info_modal(
                                     modal_id="modal-gestion-fincas",
-                                    title=MODAL_CONTENTS['gestion-fincas']['title'],
-                                    content_sections=MODAL_CONTENTS['gestion-fincas']['sections'],
+                                    title=_HELP_MODALS['gestion-fincas'][0],
+                                    content_sections=_HELP_MODALS['gestion-fincas'][1],
+                                    lazy=True,
                                 ),
                             ], className="ms-auto"),
                         ], className="d-flex justify-content-between align-items-center"),
-                        style={'backgroundColor': AGRI_THEME['colors']['bg_light']}
+                        style=_CARD_HEADER_STYLE
                     ),
                     dbc.CardBody([
-                        html.Div(id="lista-fincas-gestion", children=[
-                            dbc.Alert([
-                                html.I(className="fas fa-info-circle me-2"),
-                                "No hay fincas registradas. Cree su primera finca usando el mapa."
-                            ], color="info", className="text-center mb-0")
-                        ])
+                        html.Div(id="lista-fincas-gestion", children=[EMPTY_FINCAS_MSG])
                     ], className="p-3")
-                ], style=get_card_style('default'))
+                ], style=_CARD_STYLE)
             ], md=12)
         ], className="mb-4"),
 
@@ -391,33 +412,34 @@ def build_layout_fincas_improved():
         #                    STORES DE ESTADO
         # ===============================================================
         
-        html.Div([
-            # Almacén de datos de fincas
-            dcc.Store(id="store-fincas-data"),
-            
-            # Geometría actualmente dibujada
-            dcc.Store(id="store-geometria-actual"),
-            
-            # Finca seleccionada para operaciones
-            dcc.Store(id="store-finca-seleccionada"),
-            
-            # Modo actual del mapa (calles/satélite)
-            dcc.Store(id="store-modo-mapa"),
-            
-            # Target para operaciones de eliminación
-            dcc.Store(id="store-delete-target"),
+        # Arranque en frío: solo store-fincas-data dispara callbacks al montar
+        # (capa del mapa, métricas y lista). El resto de callbacks del módulo
+        # usan prevent_initial_call=True y esperan a una acción del usuario.
+        html.Div((
+            # Sello de versión de las fincas ({"ts", "version"}). Las features
+            # no viajan en el layout: los callbacks las leen de list_fincas()
+            # (caché en servidor). Solo memoria: al recargar se parte de cero
+            # y el arranque en frío vuelve a pintar la capa y la lista.
+            dcc.Store(id="store-fincas-data", storage_type="memory", data=None),
             
-            # Target para operaciones de edición
-            dcc.Store(id="store-edit-target"),
+            # Estado de UI agrupado en un único store, con claves:
+            #   geometria     -> geometría actualmente dibujada
+            #   edit_target   -> finca objetivo del modal de edición
+            #   delete_target -> finca objetivo del modal de eliminación
+            # Los callbacks escriben solo su clave mediante dash.Patch
+            dcc.Store(id="store-fincas-ui", storage_type="memory", data={}),
             
-            # Intervalo de actualización automática
+            # Intervalo de sondeo (desactivado por defecto; un callback
+            # clientside lo activa mientras la pestaña está visible). Cada
+            # tick solo compara la versión del archivo de fincas y no refresca
+            # nada si no hubo cambios (ver comprobar_cambios_fincas en fincas.py)
             dcc.Interval(
                 id="interval-fincas-update",
                 interval=30*1000,  # 30 segundos
                 n_intervals=0,
                 disabled=True
             )
-        ], style={'display': 'none'}),
+        ), className="d-none"),
 
         # ===============================================================
         #                    MODALES DE INTERACCIÓN
@@ -446,8 +468,8 @@ def build_layout_fincas_improved():
                         id="input-nuevo-nombre-finca",
                         type="text",
                         placeholder="Introduce el nuevo nombre...",
-                        style={'width': '100%'},
-                        className="form-control mb-3"
+                        debounce=0.3,
+                        className="form-control w-100 mb-3"
                     ),
                     html.Small("El nombre debe ser descriptivo para facilitar la identificación de la finca.",
                               className="text-muted")
@@ -460,21 +482,12 @@ def build_layout_fincas_improved():
         ], id="modal-editar-finca", is_open=False),
 
         
-    ], style={'fontFamily': AGRI_THEME['fonts']['primary'], 'padding': '1rem 0'})
+    ), className="fincas-root")
 
 # ===============================================================================
 #                           FUNCIÓN DE COMPATIBILIDAD
 # ===============================================================================
 
-def build_layout_fincas():
-    """
-    Función alias para mantener compatibilidad con código legacy.
-    
-    Proporciona acceso a la función principal bajo el nombre original
-    utilizado en versiones anteriores del sistema. Mantiene la
-    retrocompatibilidad sin duplicar código.
-    
-    Returns:
-        html.Div: Layout de gestión de fincas (idéntico a función principal)
-    """
-    return build_layout_fincas_improved()
+# Alias para mantener compatibilidad con código legacy: enlace directo al
+# nombre original, sin frame adicional y compartiendo la misma caché de layout.
+build_layout_fincas = build_layout_fincas_improved
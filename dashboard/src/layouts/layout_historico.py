@@ -10,14 +10,14 @@ Layout Histórico Mejorado - Diseño Profesional
 
 import dash_bootstrap_components as dbc
 from dash import html, dcc
-import pandas as pd
-from datetime import datetime, timedelta
 
-from src.app.app_config import AGRI_THEME, get_card_style, get_button_style
+import numpy as np
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
 from src.components.ui_components_improved import (
     create_section_header,
     create_metric_card,
-    create_alert_card,
     create_chart_container
 )
 from src.components.help_modals import (
@@ -26,6 +26,221 @@ from src.components.help_modals import (
     MODAL_CONTENTS,
 )
 
+# Los estilos de tarjetas, cabeceras, iconos y controles viven en
+# assets/historico_styles.css (clases hist-*); solo queda en línea la
+# visibilidad del rango personalizado, que alterna un callback clientside
+_HIDDEN_STYLE = {'display': 'none'}
+
+# Nivel de riesgo general por prioridad mínima de las alertas (1 = máxima)
+_RISK_LEVELS = ("critical", "high", "moderate", "low")
+
+class _Alert(NamedTuple):
+    """Alerta de repilo del centro histórico (inmutable, solo lectura)"""
+    level: str
+    type: str
+    icon: str
+    title: str
+    message: str
+    priority: int
+    actions: Tuple[str, ...]
+    scientific_note: Optional[str] = None
+
+# Alerta principal según el score de riesgo del período: (umbral, plantilla),
+# se elige la primera cuyo umbral supera el score (la última si ninguno).
+# "message" es una plantilla que se formatea con risk_score y critical_days
+_RISK_ALERT_TEMPLATES = (
+    # Riesgo extremo (>70)
+    (70, _Alert(
+        level="danger",
+        type="RIESGO EXTREMO",
+        icon="agri-icon agri-icon-exclamation-triangle",
+        title="🚨 ALERTA CRÍTICA: Condiciones Extremadamente Favorables para Repilo",
+        message="Score de riesgo: {risk_score:.1f}/100. Se detectaron {critical_days} días con condiciones críticas simultáneas. El ambiente es altamente propicio para el desarrollo y dispersión de esporas de Spilocaea oleagina.",
+        priority=1,
+        actions=(
+            "ACCIÓN INMEDIATA: Aplicar tratamiento fungicida preventivo",
+            "Inspeccionar físicamente el olivar en las próximas 24-48 horas",
+            "Documentar síntomas iniciales si los hay (manchas amarillentas)",
+            "Preparar aplicaciones adicionales según evolución"
+        ),
+        scientific_note="Las condiciones actuales superan los umbrales críticos para la infección primaria de repilo (temp. 15-20°C + humedad >95%)"
+    )),
+    # Riesgo alto (50-70)
+    (50, _Alert(
+        level="warning",
+        type="RIESGO ALTO",
+        icon="agri-icon agri-icon-exclamation-circle",
+        title="⚠️ ALERTA ALTA: Condiciones Favorables para Desarrollo de Repilo",
+        message="Score de riesgo: {risk_score:.1f}/100. Detectados {critical_days} días con condiciones propicias. El período presenta riesgo significativo para infecciones de repilo.",
+        priority=2,
+        actions=(
+            "Preparar estrategia de tratamiento preventivo",
+            "Monitorear diariamente las condiciones meteorológicas",
+            "Realizar inspección visual del cultivo 2 veces por semana",
+            "Mantener equipos de aplicación listos para uso inmediato"
+        ),
+        scientific_note="Período con condiciones intermitentemente favorables. Vigilancia intensiva recomendada"
+    )),
+    # Vigilancia (30-50)
+    (30, _Alert(
+        level="info",
+        type="VIGILANCIA",
+        icon="agri-icon agri-icon-eye",
+        title="👁️ VIGILANCIA: Condiciones Moderadas de Riesgo",
+        message="Score de riesgo: {risk_score:.1f}/100. Algunas condiciones favorables detectadas. Mantener vigilancia preventiva.",
+        priority=3,
+        actions=(
+            "Continuar monitoreo rutinario del cultivo",
+            "Revisar y ajustar calendario de tratamientos",
+            "Mantener registro de condiciones meteorológicas",
+            "Preparar estrategias según evolución del tiempo"
+        ),
+        scientific_note="Condiciones dentro del rango de vigilancia estándar para repilo"
+    )),
+    # Riesgo bajo (<=30)
+    (float("-inf"), _Alert(
+        level="success",
+        type="RIESGO BAJO",
+        icon="agri-icon agri-icon-check-shield",
+        title="✅ CONDICIONES FAVORABLES: Riesgo Bajo de Repilo",
+        message="Score de riesgo: {risk_score:.1f}/100. Las condiciones meteorológicas del período no favorecen significativamente el desarrollo de repilo.",
+        priority=4,
+        actions=(
+            "Mantener programa preventivo estacional estándar",
+            "Continuar inspecciones visuales mensuales",
+            "Aprovechar para labores de mantenimiento del olivar",
+            "Preparar estrategias para próximos períodos de riesgo"
+        ),
+        scientific_note="Período con condiciones desfavorables para el patógeno. Oportunidad para labores preventivas"
+    )),
+)
+
+# Acciones de la alerta adicional por humedad extrema prolongada
+_HUMIDITY_EXTREME_ACTIONS = (
+    "Evaluar ventilación del olivar mediante poda",
+    "Considerar tratamientos fungicidas específicos",
+    "Monitorear drenaje y encharcamientos"
+)
+
+# Colores del panel de alertas por nivel de riesgo general y estilos
+# derivados, construidos una sola vez (los componentes solo los leen)
+_RISK_PANEL_COLORS = {
+    "critical": {"color": "#dc3545", "bg": "#f8d7da", "border": "#dc3545"},
+    "high": {"color": "#fd7e14", "bg": "#fff3cd", "border": "#ffc107"},
+    "moderate": {"color": "#17a2b8", "bg": "#d1ecf1", "border": "#17a2b8"},
+    "low": {"color": "#28a745", "bg": "#d4edda", "border": "#28a745"}
+}
+_RISK_PANEL_STYLES = {
+    level: {
+        "icon": {'color': colors['color']},
+        "header": {'backgroundColor': colors['bg'], 'border': 'none'},
+        "card": {
+            'border': f"2px solid {colors['border']}",
+            'borderRadius': '12px',
+            'boxShadow': f"0 4px 15px {colors['color']}20",
+            'marginBottom': '1rem'
+        },
+        "stats_header": {'backgroundColor': colors['bg']},
+        "stats_card": {'border': f"1px solid {colors['border']}", 'borderRadius': '8px'}
+    }
+    for level, colors in _RISK_PANEL_COLORS.items()
+}
+
+# Opciones de los selectores de período y agrupación
+_PERIOD_OPTIONS = [
+    {"label": "🕐 Últimas 24 horas", "value": "24h"},
+    {"label": "📅 Última semana", "value": "7d"},
+    {"label": "📊 Último mes", "value": "30d"},
+    {"label": "🎯 Período personalizado", "value": "custom"}
+]
+_GROUPING_OPTIONS = [
+    {"label": "📍 Todos los registros", "value": "none"},
+    {"label": "📊 Agrupación diaria", "value": "D"},
+    {"label": "📈 Agrupación semanal", "value": "W"},
+    {"label": "📉 Agrupación mensual", "value": "M"},
+    {"label": "🗂️ Agrupación trimestral", "value": "Q"}
+]
+_GRAPH_CONFIG = {
+    'displayModeBar': True,
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d', 'autoScale2d'],
+    'plotGlPixelRatio': 2  # trazas WebGL nítidas en pantallas de alta densidad
+}
+
+# Modales de ayuda de esta vista: clave de MODAL_CONTENTS (-> modal-<clave>)
+# con su (título, secciones) extraídos una sola vez al importar
+_HELP_MODALS = {
+    key: (MODAL_CONTENTS[key]['title'], MODAL_CONTENTS[key]['sections'])
+    for key in ('weather', 'general', 'precipitacion', 'temperatura', 'alertas')
+}
+
+
+def _help_button(modal_key, color='outline-primary'):
+    """
+    Botón de ayuda enlazado a uno de los modales de _HELP_MODALS
+
+    Args:
+        modal_key: Clave del modal (sin el prefijo ``modal-``)
+        color: Variante de color del botón
+
+    Returns:
+        Botón que abre ``modal-<modal_key>``
+    """
+    if modal_key not in _HELP_MODALS:
+        raise KeyError(f"Modal de ayuda no registrado: {modal_key}")
+    return create_help_button(f"modal-{modal_key}", button_color=color)
+
+# Tarjetas de monitoreo del centro de alertas: (clase agri-alert-*, icono, título).
+# Compartida con el callback de alertas (historico.py), que las rellena con datos
+MONITOR_CARDS = (
+    ('temp', 'thermometer-half', 'Control Térmico'),
+    ('hum', 'tint', 'Control de Humedad'),
+    ('rain', 'cloud-rain', 'Control de Precipitaciones'),
+)
+# Contenido del placeholder de cada tarjeta antes de recibir datos
+_MONITOR_PLACEHOLDERS = {
+    'temp': dict(text='Monitoreo continuo de temperaturas extremas',
+                 badge='bg-success', status='🟢 Normal'),
+    'hum': dict(text='Detección de riesgo de enfermedades fúngicas',
+                badge='bg-warning', status='🟡 Vigilancia'),
+    'rain': dict(text='Optimización del programa de irrigación',
+                 badge='bg-success', status='🟢 Óptimo'),
+}
+# Placeholder del centro de alertas (panel principal + tres tarjetas de
+# monitoreo) pre-renderizado como HTML: es contenido fijo que se sustituye en
+# cuanto responde el callback de alertas, así que no merece ~60 componentes.
+# Los estilos viven en assets/historico_styles.css (clases agri-alert-*).
+# Sin sangría ni líneas en blanco para que Markdown lo trate como HTML literal.
+_MONITORING_TILE_HTML = (
+    '<div class="col-md-4"><div class="card agri-alert-tile agri-alert-{kind}"><div class="card-body p-3">'
+    '<div class="text-center">'
+    '<i class="agri-icon agri-icon-{icon} mb-2 agri-alert-tile-icon"></i>'
+    '<h6 class="fw-bold mb-2">{title}</h6>'
+    '<p class="small text-muted mb-2">{text}</p>'
+    '<div><span class="fw-bold">Estado: </span><span class="badge {badge}">{status}</span></div>'
+    '</div></div></div></div>'
+)
+_MONITORING_SHELL_HTML = (
+    '<div class="row"><div class="col-md-12 mb-4">'
+    '<div class="card agri-alert-main">'
+    '<div class="card-body p-3"><div class="d-flex align-items-start">'
+    '<div class="me-3"><i class="agri-icon agri-icon-shield-alt agri-alert-icon"></i></div>'
+    '<div class="flex-grow-1">'
+    '<h6 class="fw-bold mb-2">Sistema de Monitoreo Activo</h6>'
+    '<p class="mb-2 text-muted">Analizando condiciones meteorológicas en tiempo real para prevenir riesgos en el cultivo.</p>'
+    '<div><i class="agri-icon agri-icon-clock me-1 agri-alert-muted-icon"></i>'
+    '<small class="text-muted">Actualizado hace 5 minutos</small></div>'
+    '</div></div></div></div></div></div>'
+    '<div class="row">'
+    + ''.join(
+        _MONITORING_TILE_HTML.format(
+            kind=kind, icon=icon, title=title, **_MONITOR_PLACEHOLDERS[kind])
+        for kind, icon, title in MONITOR_CARDS
+    )
+    + '</div>'
+)
+
+@lru_cache(maxsize=1)
 def create_current_weather_section():
     """
     Sección mejorada de estado meteorológico actual
@@ -34,44 +249,27 @@ def create_current_weather_section():
         dbc.CardHeader([
             html.Div([
                 html.Div([
-                    html.I(className="fas fa-cloud-sun me-2",
-                          style={'color': AGRI_THEME['colors']['warning'], 'fontSize': '1.3rem'}),
+                    html.I(className="agri-icon agri-icon-cloud-sun me-2 hist-icon-warning hist-icon-xl"),
                     html.H4("Estado Meteorológico Actual", className="mb-0 d-inline fw-bold")
                 ], className="d-flex align-items-center"),
                 html.Div([
                     html.Small(
                         "Última actualización: hace 15 minutos",
-                        className="text-muted",
-                        style={'fontSize': '0.8rem'}
-                    ),
-                    create_help_button("modal-weather", button_color="outline-primary"),
-                    create_info_modal(
-                        modal_id="modal-weather",
-                        title=MODAL_CONTENTS['weather']['title'],
-                        content_sections=MODAL_CONTENTS['weather']['sections'],
+                        className="text-muted hist-badge"
                     ),
+                    _help_button("weather", "outline-primary"),
                 ], className="d-flex align-items-center"),
             ], className="d-flex justify-content-between align-items-center"),
-        ], style={
-            'backgroundColor': AGRI_THEME['colors']['bg_light'],
-            'border': 'none',
-            'borderBottom': f"3px solid {AGRI_THEME['colors']['primary']}"
-        }),
+        ], className="hist-header hist-header-primary"),
         dbc.CardBody([
-            html.Div(id="current-weather-metrics", children=[
-                # El contenido se genera dinámicamente via callback
-                create_alert_card(
-                    message="Cargando datos meteorológicos...",
-                    alert_type="info",
-                    title="Actualizando"
-                )
-            ])
+            # El contenido se genera dinámicamente via callback; hasta entonces
+            # basta un único nodo con las clases de alerta de Bootstrap
+            html.Div(
+                html.Div("Cargando datos meteorológicos...", className="alert alert-info mb-0"),
+                id="current-weather-metrics"
+            )
         ], className="p-4")
-    ], style={
-        **get_card_style('highlight'),
-        'border': f"1px solid {AGRI_THEME['colors']['border_light']}",
-        'boxShadow': '0 4px 8px rgba(0, 0, 0, 0.1)'
-    })
+    ], className="hist-card hist-card-highlight")
 
 def create_controls_section():
     """
@@ -80,44 +278,23 @@ def create_controls_section():
     return dbc.Card([
         dbc.CardHeader([
             html.Div([
-                    html.I(className="fas fa-cogs me-2",
-                          style={'color': AGRI_THEME['colors']['primary'], 'fontSize': '1.2rem'}),
+                    html.I(className="agri-icon agri-icon-cogs me-2 hist-icon-primary hist-icon-lg"),
                     html.H5("Configuración de Análisis", className="mb-0 d-inline fw-bold"),
                 ], className="d-flex align-items-center"),
-                create_help_button("modal-general", button_color="outline-primary"),
-                create_info_modal(
-                    modal_id="modal-general",
-                    title=MODAL_CONTENTS['general']['title'],
-                    content_sections=MODAL_CONTENTS['general']['sections'],
-                ),
-            ], className="d-flex justify-content-between align-items-center",
-            style={
-            'backgroundColor': AGRI_THEME['colors']['bg_light'],
-            'border': 'none',
-            'borderBottom': f"3px solid {AGRI_THEME['colors']['primary']}"
-        }),
+                _help_button("general", "outline-primary"),
+            ], className="hist-header hist-header-primary d-flex justify-content-between align-items-center"),
         dbc.CardBody([
             dbc.Row([
                 # Selector de período
                 dbc.Col([
                     html.Label("Período de Análisis", 
-                              className="form-label fw-bold mb-2",
-                              style={'color': AGRI_THEME['colors']['text_primary']}),
+                              className="form-label fw-bold mb-2 hist-label"),
                     dcc.Dropdown(
                         id="period-selector",
-                        options=[
-                            {"label": "🕐 Últimas 24 horas", "value": "24h"},
-                            {"label": "📅 Última semana", "value": "7d"},
-                            {"label": "📊 Último mes", "value": "30d"},
-                            {"label": "🎯 Período personalizado", "value": "custom"}
-                        ],
+                        options=_PERIOD_OPTIONS,
                         value="7d",
                         clearable=False,
-                        style={
-                            'fontSize': '0.9rem',
-                            'borderRadius': '8px'
-                        },
-                        className="mb-3"
+                        className="hist-dropdown mb-3"
                     )
                 ], md=3),
                 
@@ -126,98 +303,86 @@ def create_controls_section():
                     html.Div([
                         html.Label("Rango Personalizado", 
                                   id="custom-date-label",
-                                  className="form-label fw-bold mb-2",
-                                  style={
-                                      'color': AGRI_THEME['colors']['text_primary'],
-                                      'display': 'none'  # Inicialmente oculto
-                                  }),
+                                  className="form-label fw-bold mb-2 hist-label",
+                                  style=_HIDDEN_STYLE),  # Inicialmente oculto
                         html.Div([
                             dbc.Row([
                                 dbc.Col([
                                     html.Label("Fecha Inicio:", 
-                                              className="form-label small mb-1",
-                                              style={'color': AGRI_THEME['colors']['text_secondary']}),
+                                              className="form-label small mb-1 hist-small-label"),
                                     dcc.DatePickerSingle(
                                         id="start-date-picker",
-                                        date=datetime.now() - timedelta(days=7),
                                         display_format='DD/MM/YYYY',
-                                        style={'width': '100%'},
-                                        className="form-control-sm"
+                                        className="form-control-sm w-100"
                                     )
                                 ], md=6),
                                 dbc.Col([
                                     html.Label("Fecha Fin:", 
-                                              className="form-label small mb-1",
-                                              style={'color': AGRI_THEME['colors']['text_secondary']}),
+                                              className="form-label small mb-1 hist-small-label"),
                                     dcc.DatePickerSingle(
                                         id="end-date-picker",
-                                        date=datetime.now(),
                                         display_format='DD/MM/YYYY',
-                                        style={'width': '100%'},
-                                        className="form-control-sm"
+                                        className="form-control-sm w-100"
                                     )
                                 ], md=6)
                             ])
-                        ], id="custom-date-container", style={'display': 'none'})
+                        ], id="custom-date-container", style=_HIDDEN_STYLE)
                     ])
+                    # Sin fecha por defecto: se rellena en el navegador al
+                    # elegir "personalizado" (ver historico.py)
                 ], md=4),
                 
                 # Selector de agrupación
                 dbc.Col([
                     html.Label("Agrupación de Datos", 
-                              className="form-label fw-bold mb-2",
-                              style={'color': AGRI_THEME['colors']['text_primary']}),
+                              className="form-label fw-bold mb-2 hist-label"),
                     dcc.Dropdown(
                         id="grouping-selector",
-                        options=[
-                            {"label": "📍 Todos los registros", "value": "none"},
-                            {"label": "📊 Agrupación diaria", "value": "D"},
-                            {"label": "📈 Agrupación semanal", "value": "W"},
-                            {"label": "📉 Agrupación mensual", "value": "M"},
-                            {"label": "🗂️ Agrupación trimestral", "value": "Q"}
-                        ],
+                        options=_GROUPING_OPTIONS,
                         value="none",
                         clearable=False,
-                        style={
-                            'fontSize': '0.9rem',
-                            'borderRadius': '8px'
-                        },
-                        className="mb-3"
+                        className="hist-dropdown mb-3"
                     )
                 ], md=3),
                 
                 # Botón de actualización
                 dbc.Col([
                     html.Label("Acciones", 
-                              className="form-label fw-bold mb-2",
-                              style={'color': AGRI_THEME['colors']['text_primary']}),
+                              className="form-label fw-bold mb-2 hist-label"),
                     dbc.Button(
                         [
-                            html.I(className="fas fa-sync-alt me-2"),
+                            html.I(className="agri-icon agri-icon-sync-alt me-2"),
                             "Actualizar Datos"
                         ],
                         id="update-charts-btn",
                         color="primary",
                         size="md",
-                        className="w-100",
-                        style={
-                            **get_button_style('primary'),
-                            'borderRadius': '10px',
-                            'fontWeight': '600',
-                            'padding': '12px 20px',
-                            'boxShadow': '0 3px 6px rgba(0, 0, 0, 0.15)',
-                            'transition': 'all 0.2s ease'
-                        }
+                        className="w-100 hist-update-btn"
                     )
                 ], md=2)
             ], className="align-items-start")
         ], className="p-4")
-    ], style={
-        **get_card_style('default'),
-        'border': f"1px solid {AGRI_THEME['colors']['border_light']}",
-        'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.08)'
-    })
+    ], className="hist-card hist-card-controls")
+
+@lru_cache(maxsize=1)
+def create_help_modals():
+    """
+    Contenedor único con los modales de ayuda de la vista histórica
 
+    Los botones siguen en cada sección; los modales se montan una sola vez al
+    final del layout y con cuerpo diferido (se rellenan al abrirse).
+    """
+    return html.Div([
+        create_info_modal(
+            modal_id=f"modal-{key}",
+            title=title,
+            content_sections=sections,
+            lazy=True,
+        )
+        for key, (title, sections) in _HELP_MODALS.items()
+    ], id="historico-modals-root")
+
+@lru_cache(maxsize=1)
 def create_main_charts():
     """
     Gráficos principales con diseño profesional mejorado
@@ -230,41 +395,23 @@ def create_main_charts():
                     html.Div([
                         html.Div([
                             html.I(
-                                className="fas fa-cloud-rain me-2",
-                                style={'color': AGRI_THEME['colors']['info'], 'fontSize': '1.1rem'}
+                                className="agri-icon agri-icon-cloud-rain me-2 hist-icon-info hist-icon-md"
                             ),
                             html.H6("Precipitación y Humedad Relativa", className="mb-0 fw-bold"),
                         ], className="d-flex align-items-center"),
-                        create_help_button("modal-precipitacion", button_color="outline-info"),
-                        create_info_modal(
-                            modal_id="modal-precipitacion",
-                            title=MODAL_CONTENTS['precipitacion']['title'],
-                            content_sections=MODAL_CONTENTS['precipitacion']['sections'],
-                        ),
+                        _help_button("precipitacion", "outline-info"),
                     ], className="d-flex justify-content-between align-items-center"),
-                ], style={
-                    'backgroundColor': AGRI_THEME['colors']['bg_light'],
-                    'border': 'none',
-                    'borderBottom': f"2px solid {AGRI_THEME['colors']['info']}"
-                }),
+                ], className="hist-header hist-chart-header-info"),
                 dbc.CardBody([
-                    dcc.Loading([
-                        dcc.Graph(
-                            id="precipitation-humidity-chart",
-                            style={'height': '420px'},
-                            config={
-                                'displayModeBar': True,
-                                'displaylogo': False,
-                                'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d', 'autoScale2d']
-                            }
-                        )
-                    ], type="circle", color=AGRI_THEME['colors']['info'])
+                    # Sin dcc.Loading: el indicador de carga es CSS puro sobre el
+                    # atributo data-dash-is-loading (ver historico_styles.css)
+                    dcc.Graph(
+                        id="precipitation-humidity-chart",
+                        className="agri-chart agri-chart-info",
+                        config=_GRAPH_CONFIG
+                    )
                 ], className="p-3")
-            ], style={
-                'border': f"1px solid {AGRI_THEME['colors']['border_light']}",
-                'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.08)',
-                'borderRadius': '10px'
-            })
+            ], className="hist-chart-card")
         ], md=6, className="mb-4"),
         
         # Gráfico de Temperatura
@@ -274,256 +421,112 @@ def create_main_charts():
                     html.Div([
                         html.Div([
                             html.I(
-                                className="fas fa-thermometer-half me-2",
-                                style={'color': AGRI_THEME['colors']['warning'], 'fontSize': '1.1rem'}
+                                className="agri-icon agri-icon-thermometer-half me-2 hist-icon-warning hist-icon-md"
                             ),
                             html.H6("Análisis de Temperatura", className="mb-0 fw-bold"),
                         ], className="d-flex align-items-center"),
-                        create_help_button("modal-temperatura", button_color="outline-warning"),
-                        create_info_modal(
-                            modal_id="modal-temperatura",
-                            title=MODAL_CONTENTS['temperatura']['title'],
-                            content_sections=MODAL_CONTENTS['temperatura']['sections'],
-                        ),
+                        _help_button("temperatura", "outline-warning"),
                     ], className="d-flex justify-content-between align-items-center"),
-                ], style={
-                    'backgroundColor': AGRI_THEME['colors']['bg_light'],
-                    'border': 'none',
-                    'borderBottom': f"2px solid {AGRI_THEME['colors']['warning']}"
-                }),
+                ], className="hist-header hist-chart-header-warning"),
                 dbc.CardBody([
-                    dcc.Loading([
-                        dcc.Graph(
-                            id="temperature-chart",
-                            style={'height': '420px'},
-                            config={
-                                'displayModeBar': True,
-                                'displaylogo': False,
-                                'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d', 'autoScale2d']
-                            }
-                        )
-                    ], type="circle", color=AGRI_THEME['colors']['warning'])
+                    # Sin dcc.Loading: el indicador de carga es CSS puro sobre el
+                    # atributo data-dash-is-loading (ver historico_styles.css)
+                    dcc.Graph(
+                        id="temperature-chart",
+                        className="agri-chart agri-chart-warning",
+                        config=_GRAPH_CONFIG
+                    )
                 ], className="p-3")
-            ], style={
-                'border': f"1px solid {AGRI_THEME['colors']['border_light']}",
-                'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.08)',
-                'borderRadius': '10px'
-            })
-        ], md=6, className="mb-4")
+            ], className="hist-chart-card")
+        ], md=6, className="mb-4"),
+        
+        # Contenido actual de los gráficos; se monta junto a ellos para que
+        # update_charts nunca escriba en componentes aún inexistentes (con
+        # 'data' basta con parchear trazas)
+        dcc.Store(id="historico-chart-state", storage_type="memory",
+                  data={"chart_mode": None}),
     ])
 
+@lru_cache(maxsize=1)
 def create_alerts_section():
     """
     Sección mejorada de alertas de enfermedad
     """
-    return dbc.Row([
+    # Árbol inmutable: hijos como tuplas (la sección se memoiza y se comparte)
+    return dbc.Row((
         # Alertas de enfermedad con diseño mejorado
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-
-                    html.Div([
-                            html.I(
-                                className="fas fa-bell me-2",
-                                style={'color': AGRI_THEME['colors']['warning'], 'fontSize': '1.2rem'}
-                            ),
-                            html.H5("Centro de Alertas Agrícolas", className="mb-0 d-inline fw-bold"),
-                        ], className="d-flex align-items-center"),
-                        create_help_button("modal-alertas", button_color="outline-warning"),
-                        create_info_modal(
-                            modal_id="modal-alertas",
-                            title=MODAL_CONTENTS['alertas']['title'],
-                            content_sections=MODAL_CONTENTS['alertas']['sections'],
+        dbc.Col((
+            dbc.Card((
+                dbc.CardHeader((
+                    html.Div((
+                        html.I(
+                            className="agri-icon agri-icon-bell me-2 hist-icon-warning hist-icon-lg"
                         ),
-                    ], className="d-flex justify-content-between align-items-center", 
-                       style={
-                        'backgroundColor': AGRI_THEME['colors']['bg_light'],
-                        'border': 'none',
-                        'borderBottom': f"3px solid {AGRI_THEME['colors']['warning']}"
-                }),
-                dbc.CardBody([
-                    html.Div(id="disease-alerts", children=[
-                        # Panel de alertas principal
-                        dbc.Row([
-                            # Alerta principal
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardBody([
-                                        html.Div([
-                                            html.Div([
-                                                html.I(className="fas fa-shield-alt", 
-                                                      style={
-                                                          'fontSize': '2.5rem', 
-                                                          'color': '#17a2b8',
-                                                          'background': 'linear-gradient(135deg, #5bc0de 0%, #17a2b8 100%)',
-                                                          'WebkitBackgroundClip': 'text',
-                                                          'WebkitTextFillColor': 'transparent'
-                                                      }),
-                                            ], className="me-3"),
-                                            html.Div([
-                                                html.H6("Sistema de Monitoreo Activo", className="fw-bold mb-2"),
-                                                html.P("Analizando condiciones meteorológicas en tiempo real para prevenir riesgos en el cultivo.", 
-                                                      className="mb-2 text-muted"),
-                                                html.Div([
-                                                    html.I(className="fas fa-clock me-1", style={'color': '#6c757d'}),
-                                                    html.Small("Actualizado hace 5 minutos", className="text-muted")
-                                                ])
-                                            ], className="flex-grow-1")
-                                        ], className="d-flex align-items-start")
-                                    ], className="p-3")
-                                ], style={
-                                    'background': 'linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%)',
-                                    'border': '2px solid #17a2b8',
-                                    'borderRadius': '12px',
-                                    'boxShadow': '0 4px 15px rgba(23, 162, 184, 0.1)'
-                                })
-                            ], md=12, className="mb-4")
-                        ]),
-                        
-                        # Tarjetas de monitoreo específico
-                        dbc.Row([
-                            # Temperatura
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardBody([
-                                        html.Div([
-                                            html.I(className="fas fa-thermometer-half mb-2", 
-                                                  style={'fontSize': '1.8rem', 'color': '#dc3545'}),
-                                            html.H6("Control Térmico", className="fw-bold mb-2"),
-                                            html.P("Monitoreo continuo de temperaturas extremas", 
-                                                  className="small text-muted mb-2"),
-                                            html.Div([
-                                                html.Span("Estado: ", className="fw-bold"),
-                                                html.Span("🟢 Normal", className="badge bg-success")
-                                            ])
-                                        ], className="text-center")
-                                    ], className="p-3")
-                                ], style={
-                                    'background': 'linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%)',
-                                    'border': '1px solid #dc3545',
-                                    'borderRadius': '10px',
-                                    'boxShadow': '0 3px 10px rgba(220, 53, 69, 0.1)',
-                                    'transition': 'transform 0.2s ease'
-                                })
-                            ], md=4),
-                            
-                            # Humedad
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardBody([
-                                        html.Div([
-                                            html.I(className="fas fa-tint mb-2", 
-                                                  style={'fontSize': '1.8rem', 'color': '#007bff'}),
-                                            html.H6("Control de Humedad", className="fw-bold mb-2"),
-                                            html.P("Detección de riesgo de enfermedades fúngicas", 
-                                                  className="small text-muted mb-2"),
-                                            html.Div([
-                                                html.Span("Estado: ", className="fw-bold"),
-                                                html.Span("🟡 Vigilancia", className="badge bg-warning")
-                                            ])
-                                        ], className="text-center")
-                                    ], className="p-3")
-                                ], style={
-                                    'background': 'linear-gradient(135deg, #cce5ff 0%, #b8daff 100%)',
-                                    'border': '1px solid #007bff',
-                                    'borderRadius': '10px',
-                                    'boxShadow': '0 3px 10px rgba(0, 123, 255, 0.1)',
-                                    'transition': 'transform 0.2s ease'
-                                })
-                            ], md=4),
-                            
-                            # Precipitación
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardBody([
-                                        html.Div([
-                                            html.I(className="fas fa-cloud-rain mb-2", 
-                                                  style={'fontSize': '1.8rem', 'color': '#28a745'}),
-                                            html.H6("Control de Precipitaciones", className="fw-bold mb-2"),
-                                            html.P("Optimización del programa de irrigación", 
-                                                  className="small text-muted mb-2"),
-                                            html.Div([
-                                                html.Span("Estado: ", className="fw-bold"),
-                                                html.Span("🟢 Óptimo", className="badge bg-success")
-                                            ])
-                                        ], className="text-center")
-                                    ], className="p-3")
-                                ], style={
-                                    'background': 'linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%)',
-                                    'border': '1px solid #28a745',
-                                    'borderRadius': '10px',
-                                    'boxShadow': '0 3px 10px rgba(40, 167, 69, 0.1)',
-                                    'transition': 'transform 0.2s ease'
-                                })
-                            ], md=4)
-                        ])
-                    ])
-                ], className="p-4")
-            ], style={
-                **get_card_style('default'),
-                'border': f"1px solid {AGRI_THEME['colors']['border_light']}",
-                'boxShadow': '0 4px 6px rgba(0, 0, 0, 0.1)'
-            })
-        ], md=12, className="mb-4")
-    ])
+                        html.H5("Centro de Alertas Agrícolas", className="mb-0 d-inline fw-bold"),
+                    ), className="d-flex align-items-center"),
+                    _help_button("alertas", "outline-warning"),
+                ), className="hist-header hist-header-warning d-flex justify-content-between align-items-center"),
+                dbc.CardBody((
+                    html.Div(id="disease-alerts", children=(
+                        # Placeholder estático hasta que update_disease_alerts
+                        # responde: un único componente con HTML pre-renderizado
+                        dcc.Markdown(_MONITORING_SHELL_HTML, dangerously_allow_html=True),
+                    )),
+                ), className="p-4"),
+            ), className="hist-card hist-card-alerts"),
+        ), md=12, className="mb-4"),
+    ))
 
 def build_layout_historico_improved(df=None, kml_geojson=None):
     """
     Layout histórico con diseño profesional mejorado
+
+    El árbol es estático (df y kml_geojson no se usan: los datos llegan por
+    callbacks y las fechas por defecto se calculan en el navegador), así que
+    se construye una sola vez y se reutiliza.
     """
-    return html.Div([
+    return _build_layout_historico_cached()
+
+@lru_cache(maxsize=1)
+def _build_layout_historico_cached():
+    """Construye el layout histórico (memoizado)"""
+    return html.Div((
         # Header principal de sección
         create_section_header(
             title="Análisis Meteorológico Histórico",
             subtitle="Monitoreo de condiciones ambientales, análisis de riesgo de enfermedades y visualización geoespacial",
-            icon="fas fa-chart-line"
+            icon="agri-icon agri-icon-chart-line"
         ),
         
         # Estado meteorológico actual
-        html.Div([
-            create_current_weather_section()
-        ], className="mb-4"),
+        html.Div((create_current_weather_section(),), className="mb-4"),
         
         # Panel de controles
-        html.Div([
-            create_controls_section()
-        ], className="mb-4"),
+        html.Div((create_controls_section(),), className="mb-4"),
         
-        # Gráficos principales
-        create_main_charts(),
+        # Gráficos principales y alertas: se montan justo después del primer
+        # pintado (ver fill_deferred_sections en historico.py)
+        html.Div(id="historico-charts-slot"),
+        html.Div(id="historico-alerts-slot"),
+        dcc.Interval(id="historico-defer-load", interval=50, max_intervals=1),
         
-        # Alertas de enfermedad
-        create_alerts_section(),
+        # Modales de ayuda (montados una sola vez)
+        create_help_modals(),
         
-        # Stores para datos
-        dcc.Store(id="weather-data-store"),
-        dcc.Store(id="historical-alerts-store"),
-        dcc.Store(id="risk-analysis-store"),
-        dcc.Store(id="current-filters-store", data={
-            "period": "7d",
-            "grouping": "none",
-            "start_date": None,
-            "end_date": None
+        # Stores para datos (solo en memoria: nada se persiste en el navegador)
+        dcc.Store(id="weather-data-store", storage_type="memory"),
+        # Estado de la vista: filtros activos (se escribe con Patch). El
+        # contenido de los gráficos va en historico-chart-state, junto a ellos
+        dcc.Store(id="historico-state", storage_type="memory", data={
+            "filters": {
+                "period": "7d",
+                "grouping": "none",
+                "start_date": None,
+                "end_date": None
+            }
         }),
-        
-        # Nota: Se necesitará un callback para mostrar/ocultar el selector personalizado:
-        # @app.callback(
-        #     [Output('custom-date-container', 'style'),
-        #      Output('custom-date-label', 'style')],
-        #     Input('period-selector', 'value')
-        # )
-        # def toggle_custom_date_picker(period_value):
-        #     if period_value == 'custom':
-        #         return {'display': 'block'}, {'color': AGRI_THEME['colors']['text_primary'], 'display': 'block'}
-        #     return {'display': 'none'}, {'display': 'none'}
-        
-    ], 
-    style={
-        'fontFamily': AGRI_THEME['fonts']['primary'],
-        'backgroundColor': AGRI_THEME['colors']['bg_light'],
-        'minHeight': '100vh',
-        'padding': '1.5rem'
-    })
+    ),
+    className="hist-root")
 
 def create_smart_disease_alerts(weather_data, period_stats=None):
     """
@@ -546,15 +549,36 @@ def create_smart_disease_alerts(weather_data, period_stats=None):
     
     return _create_alerts_display(alerts, risk_level, risk_analysis)
 
-def _analyze_repilo_conditions(weather_data, period_stats):
-    """Análisis científico de condiciones favorables para repilo"""
-    import pandas as pd
-    import numpy as np
+def _weather_columns(weather_data, keys):
+    """
+    Extrae columnas numéricas (float32) de los datos meteorológicos
     
-    df = pd.DataFrame(weather_data)
-    if df.empty:
+    Acepta registros (lista de dicts, formato del Store) o columnas
+    (dict de listas) sin pasar por un DataFrame. Los valores ausentes se
+    convierten en NaN; las claves que no existen se omiten.
+    """
+    if isinstance(weather_data, dict):
+        return {
+            key: np.asarray(weather_data[key], dtype=np.float32)
+            for key in keys if key in weather_data
+        }
+    available = set().union(*(row.keys() for row in weather_data))
+    return {
+        key: np.asarray([row.get(key) for row in weather_data], dtype=np.float32)
+        for key in keys if key in available
+    }
+
+def _analyze_repilo_conditions(weather_data, period_stats):
+    """
+    Análisis científico de condiciones favorables para repilo
+    """
+    if not weather_data:
         return {"risk_score": 0, "conditions": {}}
-    
+    columns = _weather_columns(weather_data, ('temperature', 'humidity', 'precipitation'))
+    return _compute_repilo_analysis(columns, period_stats)
+
+def _compute_repilo_analysis(columns, period_stats):
+    """Cálculo del análisis de repilo sobre columnas NumPy ya extraídas"""
     analysis = {
         "risk_score": 0,
         "critical_days": 0,
@@ -565,18 +589,28 @@ def _analyze_repilo_conditions(weather_data, period_stats):
     }
     
     # Condiciones críticas para repilo (Spilocaea oleagina)
-    if 'temperature' in df.columns and 'humidity' in df.columns:
-        # Temperatura óptima: 15-20°C, crítica: 12-22°C
-        temp_optimal = ((df['temperature'] >= 15) & (df['temperature'] <= 20)).sum()
-        temp_critical = ((df['temperature'] >= 12) & (df['temperature'] <= 22)).sum()
+    if 'temperature' in columns and 'humidity' in columns:
+        t = columns['temperature']
+        h = columns['humidity']
         
+        # Cuatro máscaras base, calculadas una sola vez y combinadas después
+        # Temperatura óptima: 15-20°C, crítica: 12-22°C
+        t_optimal = (t >= 15) & (t <= 20)
+        t_critical = (t >= 12) & (t <= 22)
         # Humedad crítica: >85%, extrema: >95%
-        humidity_critical = (df['humidity'] >= 85).sum()
-        humidity_extreme = (df['humidity'] >= 95).sum()
+        h_critical = h >= 85
+        h_extreme = h >= 95
+        
+        # Conteos como int de Python (no np.int64), serializables por la
+        # vía rápida de JSON al construir la clave y la respuesta
+        temp_optimal = int(np.count_nonzero(t_optimal))
+        temp_critical = int(np.count_nonzero(t_critical))
+        humidity_critical = int(np.count_nonzero(h_critical))
+        humidity_extreme = int(np.count_nonzero(h_extreme))
         
         # Días con condiciones simultáneas críticas
-        critical_conditions = ((df['temperature'] >= 12) & (df['temperature'] <= 22) & (df['humidity'] >= 85)).sum()
-        extreme_conditions = ((df['temperature'] >= 15) & (df['temperature'] <= 20) & (df['humidity'] >= 95)).sum()
+        critical_conditions = int(np.count_nonzero(t_critical & h_critical))
+        extreme_conditions = int(np.count_nonzero(t_optimal & h_extreme))
         
         analysis["critical_days"] = critical_conditions
         analysis["conditions"] = {
@@ -589,7 +623,7 @@ def _analyze_repilo_conditions(weather_data, period_stats):
         }
         
         # Cálculo de score de riesgo (0-100)
-        total_days = len(df)
+        total_days = len(t)
         if total_days > 0:
             risk_score = 0
             risk_score += (critical_conditions / total_days) * 40  # 40% del peso
@@ -597,11 +631,11 @@ def _analyze_repilo_conditions(weather_data, period_stats):
             risk_score += (temp_optimal / total_days) * 20       # 20% del peso
             
             # Bonus por precipitación si está disponible
-            if 'precipitation' in df.columns:
-                rainy_days = (df['precipitation'] > 0).sum()
+            if 'precipitation' in columns:
+                rainy_days = int(np.count_nonzero(columns['precipitation'] > 0))
                 risk_score += (rainy_days / total_days) * 10     # 10% del peso
             
-            analysis["risk_score"] = min(100, risk_score)
+            analysis["risk_score"] = float(min(100, risk_score))
     
     return analysis
 
@@ -612,159 +646,94 @@ def _generate_contextual_alerts(risk_analysis, period_stats):
     conditions = risk_analysis.get("conditions", {})
     critical_days = risk_analysis.get("critical_days", 0)
     
-    # Alerta crítica - Riesgo extremo (>70)
-    if risk_score > 70:
-        alerts.append({
-            "level": "danger",
-            "type": "RIESGO EXTREMO",
-            "icon": "fas fa-exclamation-triangle",
-            "title": "🚨 ALERTA CRÍTICA: Condiciones Extremadamente Favorables para Repilo",
-            "message": f"Score de riesgo: {risk_score:.1f}/100. Se detectaron {critical_days} días con condiciones críticas simultáneas. El ambiente es altamente propicio para el desarrollo y dispersión de esporas de Spilocaea oleagina.",
-            "priority": 1,
-            "actions": [
-                "ACCIÓN INMEDIATA: Aplicar tratamiento fungicida preventivo",
-                "Inspeccionar físicamente el olivar en las próximas 24-48 horas",
-                "Documentar síntomas iniciales si los hay (manchas amarillentas)",
-                "Preparar aplicaciones adicionales según evolución"
-            ],
-            "scientific_note": "Las condiciones actuales superan los umbrales críticos para la infección primaria de repilo (temp. 15-20°C + humedad >95%)"
-        })
-    
-    # Alerta alta - Riesgo alto (50-70)
-    elif risk_score > 50:
-        alerts.append({
-            "level": "warning",
-            "type": "RIESGO ALTO",
-            "icon": "fas fa-exclamation-circle",
-            "title": "⚠️ ALERTA ALTA: Condiciones Favorables para Desarrollo de Repilo",
-            "message": f"Score de riesgo: {risk_score:.1f}/100. Detectados {critical_days} días con condiciones propicias. El período presenta riesgo significativo para infecciones de repilo.",
-            "priority": 2,
-            "actions": [
-                "Preparar estrategia de tratamiento preventivo",
-                "Monitorear diariamente las condiciones meteorológicas",
-                "Realizar inspección visual del cultivo 2 veces por semana",
-                "Mantener equipos de aplicación listos para uso inmediato"
-            ],
-            "scientific_note": "Período con condiciones intermitentemente favorables. Vigilancia intensiva recomendada"
-        })
-    
-    # Alerta moderada - Vigilancia (30-50)
-    elif risk_score > 30:
-        alerts.append({
-            "level": "info",
-            "type": "VIGILANCIA",
-            "icon": "fas fa-eye",
-            "title": "👁️ VIGILANCIA: Condiciones Moderadas de Riesgo",
-            "message": f"Score de riesgo: {risk_score:.1f}/100. Algunas condiciones favorables detectadas. Mantener vigilancia preventiva.",
-            "priority": 3,
-            "actions": [
-                "Continuar monitoreo rutinario del cultivo",
-                "Revisar y ajustar calendario de tratamientos",
-                "Mantener registro de condiciones meteorológicas",
-                "Preparar estrategias según evolución del tiempo"
-            ],
-            "scientific_note": "Condiciones dentro del rango de vigilancia estándar para repilo"
-        })
-    
-    # Condición favorable - Riesgo bajo (<30)
-    else:
-        alerts.append({
-            "level": "success",
-            "type": "RIESGO BAJO",
-            "icon": "fas fa-check-shield",
-            "title": "✅ CONDICIONES FAVORABLES: Riesgo Bajo de Repilo",
-            "message": f"Score de riesgo: {risk_score:.1f}/100. Las condiciones meteorológicas del período no favorecen significativamente el desarrollo de repilo.",
-            "priority": 4,
-            "actions": [
-                "Mantener programa preventivo estacional estándar",
-                "Continuar inspecciones visuales mensuales",
-                "Aprovechar para labores de mantenimiento del olivar",
-                "Preparar estrategias para próximos períodos de riesgo"
-            ],
-            "scientific_note": "Período con condiciones desfavorables para el patógeno. Oportunidad para labores preventivas"
-        })
+    # Alerta principal por tramos de score (ver _RISK_ALERT_TEMPLATES); la
+    # última plantilla es el caso por defecto
+    template = next(
+        (template for threshold, template in _RISK_ALERT_TEMPLATES if risk_score > threshold),
+        _RISK_ALERT_TEMPLATES[-1][1]
+    )
+    alerts.append(template._replace(
+        message=template.message.format(risk_score=risk_score, critical_days=critical_days)
+    ))
     
     # Alertas específicas adicionales basadas en condiciones
     if conditions.get("humidity_extreme_days", 0) > 5:
-        alerts.append({
-            "level": "warning", 
-            "type": "HUMEDAD EXTREMA",
-            "icon": "fas fa-tint",
-            "title": "💧 ATENCIÓN: Períodos Prolongados de Humedad Extrema",
-            "message": f"Se registraron {conditions['humidity_extreme_days']} días con humedad >95%. Condiciones ideales para germinación de esporas.",
-            "priority": 2,
-            "actions": [
-                "Evaluar ventilación del olivar mediante poda",
-                "Considerar tratamientos fungicidas específicos",
-                "Monitorear drenaje y encharcamientos"
-            ]
-        })
+        alerts.append(_Alert(
+            level="warning",
+            type="HUMEDAD EXTREMA",
+            icon="agri-icon agri-icon-tint",
+            title="💧 ATENCIÓN: Períodos Prolongados de Humedad Extrema",
+            message=f"Se registraron {conditions['humidity_extreme_days']} días con humedad >95%. Condiciones ideales para germinación de esporas.",
+            priority=2,
+            actions=_HUMIDITY_EXTREME_ACTIONS
+        ))
     
     return alerts
 
 def _determine_overall_risk(alerts):
     """Determina el nivel de riesgo general basado en las alertas"""
-    if not alerts:
-        return "low"
-    
-    priority_levels = [alert.get("priority", 4) for alert in alerts]
-    min_priority = min(priority_levels)
-    
-    if min_priority == 1:
-        return "critical"
-    elif min_priority == 2:
-        return "high"
-    elif min_priority == 3:
-        return "moderate"
-    else:
-        return "low"
+    min_priority = min((alert.priority for alert in alerts), default=4)
+    # Prioridades fuera de 1-3 se consideran riesgo bajo
+    return _RISK_LEVELS[min_priority - 1] if 1 <= min_priority <= 3 else "low"
+
+def _kpi_col(value, label, color, md=3):
+    """Columna KPI del resumen de alertas: valor destacado y etiqueta"""
+    return dbc.Col([
+        html.Div([
+            html.H4(value, className="mb-1 fw-bold", style={'color': color}),
+            html.Small(label, className="text-muted")
+        ], className="text-center")
+    ], md=md)
+
+@lru_cache(maxsize=None)
+def _alert_icon_class(icon):
+    """className del icono de cabecera de una alerta (uno por icono distinto)"""
+    return f"{icon} me-2"
+
+def _maybe_science_note(alert):
+    """Lista con la nota científica de la alerta, o vacía si no tiene"""
+    note = alert.scientific_note
+    if not note:
+        return []
+    return [dbc.Alert([
+        html.I(className="agri-icon agri-icon-flask me-2"),
+        html.Strong("Nota Científica: "),
+        note
+    ], color="info", className="py-2 mb-3")]
 
 def _create_alerts_display(alerts, risk_level, risk_analysis):
     """Crea la visualización de alertas con diseño profesional"""
     if not alerts:
         return _create_no_data_alert()
     
-    # Colores y estilos según nivel de riesgo
-    risk_colors = {
-        "critical": {"color": "#dc3545", "bg": "#f8d7da", "border": "#dc3545"},
-        "high": {"color": "#fd7e14", "bg": "#fff3cd", "border": "#ffc107"},
-        "moderate": {"color": "#17a2b8", "bg": "#d1ecf1", "border": "#17a2b8"},
-        "low": {"color": "#28a745", "bg": "#d4edda", "border": "#28a745"}
-    }
-    
-    colors = risk_colors.get(risk_level, risk_colors["low"])
+    # Colores y estilos según nivel de riesgo, compartidos entre renders
+    colors = _RISK_PANEL_COLORS.get(risk_level, _RISK_PANEL_COLORS["low"])
+    styles = _RISK_PANEL_STYLES.get(risk_level, _RISK_PANEL_STYLES["low"])
+    icon_style = styles["icon"]
     
-    alert_cards = []
-    for alert in alerts:
-        alert_card = dbc.Card([
+    alert_cards = [
+        dbc.Card([
             dbc.CardHeader([
                 html.H6([
-                    html.I(className=f"{alert['icon']} me-2", style={'color': colors['color']}),
-                    alert["title"]
-                ], className="mb-0 fw-bold", style={'color': colors['color']})
-            ], style={'backgroundColor': colors['bg'], 'border': 'none'}),
-            dbc.CardBody([
-                html.P(alert["message"], className="mb-3"),
-                
+                    html.I(className=_alert_icon_class(alert.icon), style=icon_style),
+                    alert.title
+                ], className="mb-0 fw-bold", style=icon_style)
+            ], style=styles["header"]),
+            dbc.CardBody(
+                [html.P(alert.message, className="mb-3")]
                 # Nota científica si está disponible
-                *([dbc.Alert([
-                    html.I(className="fas fa-flask me-2"),
-                    html.Strong("Nota Científica: "),
-                    alert["scientific_note"]
-                ], color="info", className="py-2 mb-3")] if alert.get("scientific_note") else []),
-                
-                html.H6("🔧 Acciones Recomendadas:", className="mb-2 fw-bold"),
-                html.Ul([
-                    html.Li(action, className="mb-1") for action in alert.get("actions", [])
-                ], className="mb-0")
-            ], className="p-3")
-        ], style={
-            'border': f"2px solid {colors['border']}",
-            'borderRadius': '12px',
-            'boxShadow': f"0 4px 15px {colors['color']}20",
-            'marginBottom': '1rem'
-        })
-        alert_cards.append(alert_card)
+                + _maybe_science_note(alert)
+                + [
+                    html.H6("🔧 Acciones Recomendadas:", className="mb-2 fw-bold"),
+                    html.Ul([
+                        html.Li(action, className="mb-1") for action in alert.actions
+                    ], className="mb-0")
+                ],
+                className="p-3"
+            )
+        ], style=styles["card"])
+        for alert in alerts
+    ]
     
     # Panel de resumen estadístico
     risk_score = risk_analysis.get("risk_score", 0)
@@ -773,56 +742,30 @@ def _create_alerts_display(alerts, risk_level, risk_analysis):
     stats_panel = dbc.Card([
         dbc.CardHeader([
             html.H6([
-                html.I(className="fas fa-chart-pie me-2", style={'color': colors['color']}),
+                html.I(className="agri-icon agri-icon-chart-pie me-2", style=icon_style),
                 f"Análisis Cuantitativo - Score de Riesgo: {risk_score:.1f}/100"
             ], className="mb-0 fw-bold")
-        ], style={'backgroundColor': colors['bg']}),
+        ], style=styles["stats_header"]),
         dbc.CardBody([
             dbc.Row([
-                dbc.Col([
-                    html.Div([
-                        html.H4(f"{conditions.get('simultaneous_critical', 0)}", 
-                               className="mb-1 fw-bold", style={'color': colors['color']}),
-                        html.Small("Días críticos", className="text-muted")
-                    ], className="text-center")
-                ], md=3),
-                dbc.Col([
-                    html.Div([
-                        html.H4(f"{conditions.get('humidity_extreme_days', 0)}", 
-                               className="mb-1 fw-bold", style={'color': colors['color']}),
-                        html.Small("Días humedad >95%", className="text-muted")
-                    ], className="text-center")
-                ], md=3),
-                dbc.Col([
-                    html.Div([
-                        html.H4(f"{conditions.get('temp_optimal_days', 0)}", 
-                               className="mb-1 fw-bold", style={'color': colors['color']}),
-                        html.Small("Días temp. óptima", className="text-muted")
-                    ], className="text-center")
-                ], md=3),
-                dbc.Col([
-                    html.Div([
-                        html.H4(f"{risk_level.upper()}", 
-                               className="mb-1 fw-bold", style={'color': colors['color']}),
-                        html.Small("Nivel de riesgo", className="text-muted")
-                    ], className="text-center")
-                ], md=3)
+                _kpi_col(f"{conditions.get('simultaneous_critical', 0)}", "Días críticos", colors['color']),
+                _kpi_col(f"{conditions.get('humidity_extreme_days', 0)}", "Días humedad >95%", colors['color']),
+                _kpi_col(f"{conditions.get('temp_optimal_days', 0)}", "Días temp. óptima", colors['color']),
+                _kpi_col(f"{risk_level.upper()}", "Nivel de riesgo", colors['color'])
             ])
         ], className="py-3")
-    ], className="mb-3", style={
-        'border': f"1px solid {colors['border']}",
-        'borderRadius': '8px'
-    })
+    ], className="mb-3", style=styles["stats_card"])
     
     return html.Div([
         stats_panel,
         html.Div(alert_cards)
     ])
 
+@lru_cache(maxsize=1)
 def _create_no_data_alert():
-    """Alerta cuando no hay datos disponibles"""
+    """Alerta cuando no hay datos disponibles (estática: se crea una vez)"""
     return dbc.Alert([
-        html.I(className="fas fa-info-circle me-2"),
+        html.I(className="agri-icon agri-icon-info-circle me-2"),
         "📊 No hay datos suficientes para generar alertas. Seleccione un período con datos meteorológicos disponibles."
     ], color="info", className="mb-4")
 
@@ -3,10 +3,55 @@ Funciones adicionales para el sistema de alertas histórico de repilo
 Complemento del layout_historico.py con funcionalidades específicas
 """
 
+import dash_bootstrap_components as dbc
+from dash import html
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime, timedelta
 
+# Zonas de riesgo (bandas de color) y líneas de referencia del gráfico de
+# evolución: (inicio, fin, color) y (umbral, color, texto)
+_RISK_ZONE_SHAPES = [
+    dict(type='rect', xref='x domain', yref='y', x0=0, x1=1, y0=y0, y1=y1,
+         fillcolor=color, layer='below', line=dict(width=0))
+    for y0, y1, color in (
+        (0, 30, "rgba(40, 167, 69, 0.1)"),
+        (30, 50, "rgba(23, 162, 184, 0.1)"),
+        (50, 70, "rgba(255, 193, 7, 0.1)"),
+        (70, 100, "rgba(220, 53, 69, 0.1)"),
+    )
+]
+_RISK_LINES = (
+    (30, "#28a745", "Umbral Vigilancia"),
+    (50, "#ffc107", "Umbral Alto"),
+    (70, "#dc3545", "Umbral Crítico"),
+)
+_RISK_LINE_SHAPES = [
+    dict(type='line', xref='x domain', yref='y', x0=0, x1=1, y0=y, y1=y,
+         line=dict(color=color, dash='dash'))
+    for y, color, _ in _RISK_LINES
+]
+_RISK_LINE_ANNOTATIONS = [
+    dict(text=text, xref='x domain', yref='y', x=1, y=y,
+         xanchor='left', yanchor='middle', showarrow=False)
+    for y, _, text in _RISK_LINES
+]
+
+# Columnas que usa el gráfico de evolución del riesgo
+_RISK_COLUMNS = ('timestamp', 'temperature', 'humidity', 'precipitation')
+
+# Escalas del score de riesgo diario: umbrales para np.digitize y puntos de
+# cada tramo (uno más que umbrales)
+_TEMP_LOW_BINS = np.array([10, 12, 15])              # t >= umbral
+_TEMP_LOW_POINTS = np.array([0, 10, 20, 30])
+_TEMP_HIGH_BINS = np.array([20, 22, 25])             # t <= umbral
+_TEMP_HIGH_POINTS = np.array([30, 20, 10, 0])
+_HUMIDITY_BINS = np.array([65, 75, 85, 95])          # h >= umbral
+_HUMIDITY_POINTS = np.array([0, 5, 15, 30, 40])
+_PRECIPITATION_BINS = np.array([0, 1, 5, 10])        # p > umbral
+_PRECIPITATION_POINTS = np.array([0, 10, 15, 20, 30])
+
 def create_risk_evolution_chart(weather_data, period_type="7d"):
     """
     Crea gráfico de evolución del riesgo de repilo a lo largo del tiempo
@@ -14,31 +59,71 @@ def create_risk_evolution_chart(weather_data, period_type="7d"):
     if not weather_data or len(weather_data) == 0:
         return _create_empty_risk_chart()
     
-    df = pd.DataFrame(weather_data)
-    if df.empty or 'timestamp' not in df.columns:
+    n_rows, columns = _weather_arrays(weather_data, _RISK_COLUMNS)
+    if n_rows == 0 or 'timestamp' not in columns:
         return _create_empty_risk_chart()
+    return _build_risk_evolution_chart(columns, n_rows)
+
+def _weather_arrays(weather_data, keys):
+    """
+    Extrae columnas de los datos meteorológicos como arrays NumPy
+    
+    Acepta una lista de registros (dicts) o un dict de columnas, sin pasar
+    por un DataFrame. Una columna existe si aparece en algún registro; los
+    huecos quedan como NaN (NaT en 'timestamp').
     
-    # Convertir timestamp si es necesario
-    if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+    Args:
+        weather_data: Lista de registros o dict {columna: valores}
+        keys: Columnas a extraer
     
-    df = df.sort_values('timestamp')
+    Returns:
+        tuple: (nº de filas, {columna: array}) con float en las numéricas y
+        datetime64 en 'timestamp'
+    """
+    if isinstance(weather_data, dict):
+        raw = {k: list(weather_data[k]) for k in keys if k in weather_data}
+        n_rows = len(next(iter(raw.values()))) if raw else 0
+    else:
+        present = set().union(*(record.keys() for record in weather_data))
+        raw = {k: [record.get(k) for record in weather_data] for k in keys if k in present}
+        n_rows = len(weather_data)
     
-    # Calcular score de riesgo diario
-    daily_risk_scores = []
-    for _, row in df.iterrows():
-        risk_score = _calculate_daily_risk_score(row)
-        daily_risk_scores.append(risk_score)
+    columns = {}
+    for key, values in raw.items():
+        if key == 'timestamp':
+            columns[key] = pd.to_datetime(values).to_numpy()
+            continue
+        try:
+            columns[key] = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            # Valores no numéricos -> NaN, como pd.to_numeric(errors='coerce')
+            columns[key] = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+    return n_rows, columns
+
+def _is_chronological(timestamps):
+    """True si las fechas (datetime64, sin NaT) ya están en orden no decreciente"""
+    if timestamps.dtype.kind != 'M' or np.isnat(timestamps).any():
+        return False
+    return bool((np.diff(timestamps.view('i8')) >= 0).all())
+
+def _build_risk_evolution_chart(columns, n_rows):
+    """Construcción del gráfico de evolución (ver create_risk_evolution_chart)"""
+    # Ordenar cronológicamente todas las columnas con una sola permutación,
+    # salvo que ya lleguen ordenadas (caso habitual): comprobarlo es O(N)
+    if not _is_chronological(columns['timestamp']):
+        order = np.argsort(columns['timestamp'], kind='stable')
+        columns = {name: values[order] for name, values in columns.items()}
     
-    df['risk_score'] = daily_risk_scores
+    # Calcular score de riesgo diario (vectorizado sobre todo el período)
+    risk_score = _calculate_risk_scores(columns, n_rows)
     
     # Crear el gráfico
     fig = go.Figure()
     
     # Línea principal de riesgo
     fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['risk_score'],
+        x=columns['timestamp'],
+        y=risk_score,
         mode='lines+markers',
         name='Score de Riesgo',
         line=dict(color='#e74c3c', width=3),
@@ -46,26 +131,11 @@ def create_risk_evolution_chart(weather_data, period_type="7d"):
         hovertemplate='<b>%{x}</b><br>Score de Riesgo: %{y:.1f}/100<extra></extra>'
     ))
     
-    # Zonas de riesgo como bandas de color
-    fig.add_hrect(y0=0, y1=30, fillcolor="rgba(40, 167, 69, 0.1)", 
-                  layer="below", line_width=0)
-    fig.add_hrect(y0=30, y1=50, fillcolor="rgba(23, 162, 184, 0.1)", 
-                  layer="below", line_width=0)
-    fig.add_hrect(y0=50, y1=70, fillcolor="rgba(255, 193, 7, 0.1)", 
-                  layer="below", line_width=0)
-    fig.add_hrect(y0=70, y1=100, fillcolor="rgba(220, 53, 69, 0.1)", 
-                  layer="below", line_width=0)
-    
-    # Líneas de referencia
-    fig.add_hline(y=30, line_dash="dash", line_color="#28a745", 
-                  annotation_text="Umbral Vigilancia", annotation_position="right")
-    fig.add_hline(y=50, line_dash="dash", line_color="#ffc107", 
-                  annotation_text="Umbral Alto", annotation_position="right")
-    fig.add_hline(y=70, line_dash="dash", line_color="#dc3545", 
-                  annotation_text="Umbral Crítico", annotation_position="right")
-    
-    # Configuración del layout
+    # Configuración del layout, con las zonas de riesgo y las líneas de
+    # referencia fijas en la misma llamada
     fig.update_layout(
+        shapes=_RISK_ZONE_SHAPES + _RISK_LINE_SHAPES,
+        annotations=_RISK_LINE_ANNOTATIONS,
         title={
             'text': '📈 Evolución del Riesgo de Repilo - Análisis Histórico',
             'x': 0.5,
@@ -92,6 +162,57 @@ def create_risk_evolution_chart(weather_data, period_type="7d"):
     
     return fig
 
+def _column_or_default(columns, column, default, n_rows):
+    """Columna como array float; si no existe, array constante con el default"""
+    if column in columns:
+        return columns[column]
+    return np.full(n_rows, default, dtype=float)
+
+def _ladder_score(values, bins, lut, right=False):
+    """Puntos de una escala por umbrales: una búsqueda binaria por valor; NaN = 0"""
+    score = lut[np.digitize(values, bins, right=right)]
+    return np.where(np.isnan(values), 0, score)
+
+def _calculate_risk_scores(columns, n_rows):
+    """
+    Calcula el score de riesgo de cada día del período de una sola vez
+    
+    Mismas reglas que _calculate_daily_risk_score, evaluadas con NumPy sobre
+    las columnas completas en lugar de fila a fila: cada escala de umbrales
+    es un np.digitize más una tabla de puntos. Los valores ausentes (NaN) no
+    suman puntos.
+    
+    Args:
+        columns: Arrays float de 'temperature', 'humidity' y 'precipitation'
+            (ver _weather_arrays; las que falten toman los valores por
+            defecto 15, 70 y 0)
+        n_rows: Número de filas del período
+    
+    Returns:
+        np.ndarray: Score 0-100 por fila
+    """
+    temp = _column_or_default(columns, 'temperature', 15, n_rows)
+    humidity = _column_or_default(columns, 'humidity', 70, n_rows)
+    precipitation = _column_or_default(columns, 'precipitation', 0, n_rows)
+    
+    # Temperatura (peso: 30%): los rangos óptimo [15, 20], crítico [12, 22] y
+    # moderado [10, 25] están anidados, así que el score es el menor entre
+    # el que marca el límite inferior y el que marca el superior
+    temp_score = np.minimum(
+        _ladder_score(temp, _TEMP_LOW_BINS, _TEMP_LOW_POINTS),
+        _ladder_score(temp, _TEMP_HIGH_BINS, _TEMP_HIGH_POINTS, right=True)
+    )
+    
+    # Humedad (peso: 40%): baja (>=65), moderada, crítica y extrema (>=95)
+    humidity_score = _ladder_score(humidity, _HUMIDITY_BINS, _HUMIDITY_POINTS)
+    
+    # Precipitación (peso: 30%): rocío (>0), ligera, moderada e intensa (>10)
+    precipitation_score = _ladder_score(
+        precipitation, _PRECIPITATION_BINS, _PRECIPITATION_POINTS, right=True
+    )
+    
+    return np.minimum(100, temp_score + humidity_score + precipitation_score)  # Máximo 100
+
 def _calculate_daily_risk_score(row):
     """
     Calcula el score de riesgo para un día específico
@@ -163,56 +284,47 @@ def _create_empty_risk_chart():
     
     return fig
 
+def _nan_mean(values):
+    """Media ignorando NaN, como pandas; NaN si no hay ningún valor válido"""
+    valid = values[~np.isnan(values)]
+    return valid.mean() if valid.size else float('nan')
+
+def _stat_col(value, label, text_class, md):
+    """Columna del panel de estadísticas: valor destacado y etiqueta"""
+    return dbc.Col([
+        html.Div([
+            html.H5(value, className=f"mb-1 fw-bold {text_class}"),
+            html.Small(label, className="text-muted")
+        ], className="text-center")
+    ], md=md)
+
 def create_period_statistics_panel(weather_data, period_info):
     """
     Crea panel de estadísticas del período analizado
     """
-    import dash_bootstrap_components as dbc
-    from dash import html
-    
     if not weather_data or len(weather_data) == 0:
         return dbc.Alert("No hay datos disponibles para el período seleccionado", color="warning")
     
-    df = pd.DataFrame(weather_data)
+    # Columnas como arrays NumPy (None si faltan): una reducción por array,
+    # sin DataFrame ni Series intermedias
+    n_rows, columns = _weather_arrays(weather_data, ('temperature', 'humidity', 'precipitation'))
+    temp = columns.get('temperature')
+    humidity = columns.get('humidity')
+    precipitation = columns.get('precipitation')
     
     # Calcular estadísticas
     stats = {
-        'total_days': len(df),
-        'avg_temp': df['temperature'].mean() if 'temperature' in df.columns else 0,
-        'avg_humidity': df['humidity'].mean() if 'humidity' in df.columns else 0,
-        'total_precipitation': df['precipitation'].sum() if 'precipitation' in df.columns else 0,
-        'rainy_days': (df['precipitation'] > 0).sum() if 'precipitation' in df.columns else 0
+        'total_days': n_rows,
+        'avg_temp': float(_nan_mean(temp)) if temp is not None else 0,
+        'avg_humidity': float(_nan_mean(humidity)) if humidity is not None else 0,
+        'total_precipitation': float(np.nansum(precipitation)) if precipitation is not None else 0,
+        'rainy_days': int(np.count_nonzero(precipitation > 0)) if precipitation is not None else 0
     }
     
     return dbc.Row([
-        dbc.Col([
-            html.Div([
-                html.H5(f"{stats['total_days']}", className="mb-1 fw-bold text-primary"),
-                html.Small("Días analizados", className="text-muted")
-            ], className="text-center")
-        ], md=2),
-        dbc.Col([
-            html.Div([
-                html.H5(f"{stats['avg_temp']:.1f}°C", className="mb-1 fw-bold text-warning"),
-                html.Small("Temp. promedio", className="text-muted")
-            ], className="text-center")
-        ], md=2),
-        dbc.Col([
-            html.Div([
-                html.H5(f"{stats['avg_humidity']:.1f}%", className="mb-1 fw-bold text-info"),
-                html.Small("Humedad promedio", className="text-muted")
-            ], className="text-center")
-        ], md=2),
-        dbc.Col([
-            html.Div([
-                html.H5(f"{stats['total_precipitation']:.1f}mm", className="mb-1 fw-bold text-success"),
-                html.Small("Precipitación total", className="text-muted")
-            ], className="text-center")
-        ], md=3),
-        dbc.Col([
-            html.Div([
-                html.H5(f"{stats['rainy_days']}", className="mb-1 fw-bold text-secondary"),
-                html.Small("Días con lluvia", className="text-muted")
-            ], className="text-center")
-        ], md=3)
+        _stat_col(f"{stats['total_days']}", "Días analizados", "text-primary", md=2),
+        _stat_col(f"{stats['avg_temp']:.1f}°C", "Temp. promedio", "text-warning", md=2),
+        _stat_col(f"{stats['avg_humidity']:.1f}%", "Humedad promedio", "text-info", md=2),
+        _stat_col(f"{stats['total_precipitation']:.1f}mm", "Precipitación total", "text-success", md=3),
+        _stat_col(f"{stats['rainy_days']}", "Días con lluvia", "text-secondary", md=3)
     ])
\ No newline at end of file
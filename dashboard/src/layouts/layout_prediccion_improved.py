@@ -8,9 +8,9 @@ Layout mejorado para Predicción Meteorológica
 
 import dash_bootstrap_components as dbc
 from dash import dcc, html
-import unicodedata
+from functools import lru_cache
 
-from src.utils.weather_utils import get_lista_municipios
+from src.utils.weather_utils import get_lista_municipios, normalizar
 from src.app.app_config import AGRI_THEME, get_card_style, get_button_style
 from src.components.ui_components_improved import (
     create_section_header,
@@ -25,35 +25,46 @@ from src.components.help_modals import (
     MODAL_CONTENTS,
 )
 
-def normalizar(texto):
-    """Normaliza texto para comparación sin acentos"""
-    if not isinstance(texto, str):
-        return ""
-    return unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii').lower()
+# Estilos repetidos en el layout, definidos una vez y compartidos por los
+# componentes (solo se leen al serializar)
+_ROOT_STYLE = {
+    'fontFamily': AGRI_THEME['fonts']['primary'],
+    'backgroundColor': AGRI_THEME['colors']['bg_light'],
+    'minHeight': '100vh',
+    'padding': '1.5rem'
+}
+_HEADER_STYLE = {'backgroundColor': AGRI_THEME['colors']['bg_light']}
+_PRIMARY_ICON_STYLE = {'color': AGRI_THEME['colors']['primary']}
+_SUCCESS_ICON_STYLE = {'color': '#28a745'}
+_WEEKLY_ACCENT_STYLE = {'color': '#6f42c1'}
+_ACTIVE_TAB_STYLE = {"backgroundColor": "#007bff", "color": "white"}
+
+# Opciones del selector de municipio, calculadas una sola vez al importar:
+# la lista sale del diccionario Excel y no cambia durante la ejecución
+try:
+    _MUNI_OPTIONS = [{"label": str(m), "value": str(m)} for m in get_lista_municipios()]
+except Exception:
+    _MUNI_OPTIONS = [{"label": "Benalua", "value": "Benalua"}]
+# Nombre normalizado (sin acentos, minúsculas) -> valor de la opción; se
+# recorre al revés para que, ante duplicados, gane la primera como antes
+_MUNI_NORM_INDEX = {normalizar(o["value"]): o["value"] for o in reversed(_MUNI_OPTIONS)}
 
 def create_municipality_selector(default_municipio="Benalua"):
     """Crea el selector de municipio profesional"""
     
-    # Obtener lista de municipios
-    try:
-        municipios = get_lista_municipios()
-        options = [{"label": str(m), "value": str(m)} for m in municipios]
-        
-        # Buscar municipio por defecto
-        try:
-            default_value = next(o["value"] for o in options if normalizar(o["value"]) == normalizar(default_municipio))
-        except StopIteration:
-            default_value = options[0]["value"] if options else None
-    except Exception:
-        options = [{"label": "Benalua", "value": "Benalua"}]
-        default_value = "Benalua"
+    # Buscar municipio por defecto
+    options = _MUNI_OPTIONS
+    default_value = _MUNI_NORM_INDEX.get(
+        normalizar(default_municipio),
+        options[0]["value"] if options else None
+    )
     
     return dbc.Card([
         dbc.CardHeader([
 
             html.Div([
                     html.I(className="fas fa-map-marker-alt me-2",
-                          style={'color': AGRI_THEME['colors']['primary']}),
+                          style=_PRIMARY_ICON_STYLE),
                     html.H5("Selección de Municipio", className="mb-0 d-inline"),
                 ], className="d-flex align-items-center"),
                 create_help_button("modal-selector", button_color="outline-primary"),
@@ -63,7 +74,7 @@ def create_municipality_selector(default_municipio="Benalua"):
                     content_sections=MODAL_CONTENTS['municipio']['sections'],
                 ),
             ], className="d-flex justify-content-between align-items-center", 
-                style={'backgroundColor': AGRI_THEME['colors']['bg_light']}),
+                style=_HEADER_STYLE),
         dbc.CardBody([
             dcc.Dropdown(
                 id="input-municipio",
@@ -85,6 +96,10 @@ def create_municipality_selector(default_municipio="Benalua"):
         ])
     ], style=get_card_style('default'))
 
+# Las secciones siguientes son árboles estáticos (solo IDs y textos fijos):
+# se construyen una vez y se reutilizan en cada render de la pestaña
+
+@lru_cache(maxsize=1)
 def create_current_kpis_section():
     """KPIs de temperaturas y condiciones meteorológicas actuales/hoy"""
     return dbc.Card([
@@ -92,7 +107,7 @@ def create_current_kpis_section():
             html.Div([
                 html.Div([
                     html.I(className="fas fa-thermometer-half me-2",
-                          style={'color': AGRI_THEME['colors']['primary']}),
+                          style=_PRIMARY_ICON_STYLE),
                     html.H4("📍 Condiciones Meteorológicas Actuales", className="mb-0 d-inline"),
                     html.Small(" • Datos en tiempo real", className="text-muted ms-2"),
                 ], className="d-flex align-items-center"),
@@ -103,7 +118,7 @@ def create_current_kpis_section():
                     content_sections=MODAL_CONTENTS['weather']['sections'],
                 ),
             ], className="d-flex justify-content-between align-items-center")
-        ], style={'backgroundColor': AGRI_THEME['colors']['bg_light']}),
+        ], style=_HEADER_STYLE),
         dbc.CardBody([
             html.Div(id="current-weather-kpis", children=[
                 dbc.Row([
@@ -119,6 +134,7 @@ def create_current_kpis_section():
         ], className="p-3")
     ], style=get_card_style('highlight'))
 
+@lru_cache(maxsize=1)
 def create_weekly_forecast_section():
     """Tarjetas de predicción semanal (weather cards) con riesgo de enfermedad"""
     return create_chart_container(
@@ -150,6 +166,7 @@ def create_weekly_forecast_section():
         
     )
 
+@lru_cache(maxsize=1)
 def create_unified_alerts_section():
     """Alertas unificadas: condiciones actuales, 48h y 7 días (estilo alineado con KPIs actuales)."""
     return dbc.Card([
@@ -158,7 +175,7 @@ def create_unified_alerts_section():
             html.Div([
                 html.Div([
                     html.I(className="fas fa-shield-alt me-2",
-                           style={'color': AGRI_THEME['colors']['primary']}),
+                           style=_PRIMARY_ICON_STYLE),
                     html.H4("🛡️ Alertas", className="mb-0 d-inline"),
                     html.Small(" • Análisis actual, 48h y 7 días", className="text-muted ms-2"),
                 ], className="d-flex align-items-center"),
@@ -170,7 +187,7 @@ def create_unified_alerts_section():
                     content_sections=MODAL_CONTENTS['alertas']['sections'],
                 ),
             ], className="d-flex justify-content-between align-items-center")
-        ], style={'backgroundColor': AGRI_THEME['colors']['bg_light']}),
+        ], style=_HEADER_STYLE),
 
         # Body
         dbc.CardBody([
@@ -210,8 +227,8 @@ def create_unified_alerts_section():
                     dbc.Card(dbc.CardBody([
                         html.Div([
                             html.I(className="fas fa-calendar-week me-2",
-                                   style={'color': '#6f42c1'}),
-                            html.H6("Próximos 7 días", className="mb-0 fw-bold", style={'color': '#6f42c1'}),
+                                   style=_WEEKLY_ACCENT_STYLE),
+                            html.H6("Próximos 7 días", className="mb-0 fw-bold", style=_WEEKLY_ACCENT_STYLE),
                         ], className="d-flex align-items-center mb-2"),
                         html.Div(
                             id="weekly-risk-status",
@@ -239,6 +256,7 @@ def create_unified_alerts_section():
         
         
 
+@lru_cache(maxsize=1)
 def create_48h_forecast_section():
     """Gráfico predicción 48h con temperatura, humedad y precipitaciones con indicadores de riesgo"""
     return create_chart_container(
@@ -259,7 +277,11 @@ def create_48h_forecast_section():
                         'scale': 1
                     }
                 }
-            )
+            ),
+            # Contenido actual del gráfico; se monta y reinicia junto a él para
+            # que, con 'data', las actualizaciones solo parcheen las trazas
+            dcc.Store(id="forecast-48h-state", storage_type="memory",
+                      data={"chart_mode": None}),
         ], type="default"),
         actions=[
             create_help_button("modal-pred-horaria", button_color="outline-primary"),
@@ -275,6 +297,36 @@ def create_48h_forecast_section():
 #                        FUNCIÓN PRINCIPAL DE CONSTRUCCIÓN
 # ===============================================================================
 
+# Piezas fijas del layout, creadas una sola vez al importar: panel de estado
+# del sistema, cabecera del análisis temporal y sus tabs
+_SYSTEM_STATUS_CARD = dbc.Card([
+    dbc.CardBody([
+        html.Div([
+            html.I(className="fas fa-satellite me-2", style=_SUCCESS_ICON_STYLE),
+            html.Strong("Sistema Activo", className="text-success")
+        ], className="d-flex align-items-center justify-content-center")
+    ], className="py-2")
+], color="light", outline=True, className="h-100")
+
+_FORECAST_HEADER = html.H4([
+    html.I(className="fas fa-chart-line me-2", style={'color': '#007bff'}),
+    "Análisis Temporal Detallado"
+], className="text-primary mb-3")
+
+_FORECAST_TABS = dbc.Tabs([
+    dbc.Tab(
+        label="📅 Predicción 7 Días", 
+        tab_id="weekly-tab",
+        active_tab_style=_ACTIVE_TAB_STYLE
+    ),
+    dbc.Tab(
+        label="⏰ Evolución 48 Horas", 
+        tab_id="hourly-tab",
+        active_tab_style=_ACTIVE_TAB_STYLE
+    )
+], id="forecast-tabs", active_tab="weekly-tab", className="mb-3")
+
+@lru_cache(maxsize=8)
 def build_layout_prediccion_improved(default_municipio="Benalua"):
     """
     Construye layout completo para predicción meteorológica avanzada con análisis de riesgo.
@@ -313,6 +365,11 @@ def build_layout_prediccion_improved(default_municipio="Benalua"):
     Note:
         Diseñado para trabajar estrechamente con callbacks en
         prediccion.py para funcionalidad completa de predicción.
+        
+        El árbol es estático salvo el municipio por defecto, así que se
+        memoiza por ese parámetro: al volver a la pestaña se reutiliza el
+        mismo árbol en lugar de reconstruirlo (Dash solo lo lee al
+        serializar).
     """
     
     return html.Div([
@@ -339,14 +396,7 @@ def build_layout_prediccion_improved(default_municipio="Benalua"):
             ], md=6),
             dbc.Col([
                 # Panel de estado del sistema
-                dbc.Card([
-                    dbc.CardBody([
-                        html.Div([
-                            html.I(className="fas fa-satellite me-2", style={'color': '#28a745'}),
-                            html.Strong("Sistema Activo", className="text-success")
-                        ], className="d-flex align-items-center justify-content-center")
-                    ], className="py-2")
-                ], color="light", outline=True, className="h-100")
+                _SYSTEM_STATUS_CARD
             ], md=6)
         ], className="mb-4"),
         
@@ -364,33 +414,14 @@ def build_layout_prediccion_improved(default_municipio="Benalua"):
         dbc.Row([
             dbc.Col([
                 html.Div([
-                    html.H4([
-                        html.I(className="fas fa-chart-line me-2", style={'color': '#007bff'}),
-                        "Análisis Temporal Detallado"
-                    ], className="text-primary mb-3"),
+                    _FORECAST_HEADER,
                     
                     # Tabs para navegar entre vistas (sin contenido interno)
-                    dbc.Tabs([
-                        dbc.Tab(
-                            label="📅 Predicción 7 Días", 
-                            tab_id="weekly-tab",
-                            active_tab_style={"backgroundColor": "#007bff", "color": "white"}
-                        ),
-                        dbc.Tab(
-                            label="⏰ Evolución 48 Horas", 
-                            tab_id="hourly-tab",
-                            active_tab_style={"backgroundColor": "#007bff", "color": "white"}
-                        )
-                    ], id="forecast-tabs", active_tab="weekly-tab", className="mb-3"),
-                    
-                    # Contenedores persistentes que se muestran/ocultan según tab activa
-                    html.Div([
-                        create_weekly_forecast_section()
-                    ], id="weekly-content", style={'display': 'block'}),
+                    _FORECAST_TABS,
                     
-                    html.Div([
-                        create_48h_forecast_section()
-                    ], id="hourly-content", style={'display': 'none'})
+                    # Contenido de la tab activa: solo se envía una sección;
+                    # render_forecast_tab la sustituye al cambiar de tab
+                    html.Div(create_weekly_forecast_section(), id="forecast-tab-content")
                 ])
             ], md=12)
         ], className="mb-4"),
@@ -408,154 +439,31 @@ def build_layout_prediccion_improved(default_municipio="Benalua"):
         html.Div(id="forecast-notifications"),
         
     ], 
-    style={
-        'fontFamily': AGRI_THEME['fonts']['primary'],
-        'backgroundColor': AGRI_THEME['colors']['bg_light'],
-        'minHeight': '100vh',
-        'padding': '1.5rem'
-    })
+    style=_ROOT_STYLE)
 
+@lru_cache(maxsize=1)
 def create_risk_guide_modal():
-    """Modal con guía práctica de manejo de repilo para agricultores"""
+    """
+    Modal con guía práctica de manejo de repilo para agricultores
+    
+    Las pestañas van vacías: el contenido de la activa se renderiza en
+    "risk-guide-tab-body" al abrir el modal o cambiar de pestaña (ver
+    create_risk_guide_tab_body), en lugar de enviar las cuatro con el layout.
+    """
     return dbc.Modal([
         dbc.ModalHeader(dbc.ModalTitle([
-            html.I(className="fas fa-leaf me-2", style={'color': '#28a745'}),
+            html.I(className="fas fa-leaf me-2", style=_SUCCESS_ICON_STYLE),
             "Guía de Manejo del Repilo - Para Agricultores"
         ])),
         dbc.ModalBody([
             # Tabs para organizar la información
             dbc.Tabs([
-                # Tab 1: Identificación
-                dbc.Tab(label="🔍 Identificar", tab_id="identify-tab", children=[
-                    html.Div([
-                        html.H5("¿Cómo reconocer el repilo?", className="text-primary mb-3"),
-                        dbc.Row([
-                            dbc.Col([
-                                html.H6("Síntomas iniciales:", className="fw-bold mb-2"),
-                                html.Ul([
-                                    html.Li("Manchas circulares amarillentas en hojas"),
-                                    html.Li("Manchas de 2-10mm de diámetro"),
-                                    html.Li("Color que pasa de amarillo a marrón"),
-                                    html.Li("Hojas que se vuelven amarillas y caen")
-                                ])
-                            ], md=6),
-                            dbc.Col([
-                                html.H6("Síntomas avanzados:", className="fw-bold mb-2"),
-                                html.Ul([
-                                    html.Li("Defoliación intensa"),
-                                    html.Li("Pérdida de hasta 70% de las hojas"),
-                                    html.Li("Debilitamiento del árbol"),
-                                    html.Li("Reducción de la cosecha")
-                                ])
-                            ], md=6)
-                        ])
-                    ], className="mt-3")
-                ]),
-                
-                # Tab 2: Condiciones de riesgo
-                dbc.Tab(label="⚠️ Cuándo Actuar", tab_id="risk-tab", children=[
-                    html.Div([
-                        html.H5("Condiciones que favorecen el repilo", className="text-danger mb-3"),
-                        
-                        # Alertas por nivel de riesgo
-                        dbc.Alert([
-                            html.H6([html.I(className="fas fa-thermometer-three-quarters me-2"), "RIESGO EXTREMO"], className="alert-heading text-white mb-2"),
-                            html.P("• Temperatura entre 15-20°C", className="mb-1"),
-                            html.P("• Humedad superior al 95%", className="mb-1"),
-                            html.P("• Presencia de lluvia o rocío", className="mb-1"),
-                            html.Strong("🚨 ACCIÓN INMEDIATA: Aplicar tratamiento preventivo")
-                        ], color="danger", className="mb-3"),
-                        
-                        dbc.Alert([
-                            html.H6([html.I(className="fas fa-thermometer-half me-2"), "RIESGO ALTO"], className="alert-heading mb-2"),
-                            html.P("• Temperatura entre 12-15°C o 20-22°C", className="mb-1"),
-                            html.P("• Humedad entre 85-95%", className="mb-1"),
-                            html.P("• Varios días consecutivos húmedos", className="mb-1"),
-                            html.Strong("⚠️ VIGILANCIA: Preparar tratamiento si persisten condiciones")
-                        ], color="warning", className="mb-3")
-                    ], className="mt-3")
-                ]),
-                
-                # Tab 3: Tratamientos
-                dbc.Tab(label="💊 Tratamientos", tab_id="treatment-tab", children=[
-                    html.Div([
-                        html.H5("Estrategias de control", className="text-success mb-3"),
-                        
-                        html.H6("🛡️ Tratamientos Preventivos:", className="fw-bold mb-2"),
-                        html.Ul([
-                            html.Li([html.Strong("Cobre (oxicloruro/sulfato): "), "2-3 g/L - aplicar antes de períodos lluviosos"]),
-                            html.Li([html.Strong("Mezclas cúpricas: "), "Alternar formulaciones para evitar resistencias"]),
-                            html.Li([html.Strong("Momento clave: "), "Otoño (octubre-noviembre) e invierno"]),
-                            html.Li([html.Strong("Frecuencia: "), "Cada 15-20 días en períodos de riesgo"])
-                        ], className="mb-3"),
-                        
-                        html.H6("🎯 Tratamientos Curativos:", className="fw-bold mb-2"),
-                        html.Ul([
-                            html.Li([html.Strong("Triazoles: "), "En primeras fases de infección"]),
-                            html.Li([html.Strong("Strobirulinas: "), "Sistémicos para casos establecidos"]),
-                            html.Li([html.Strong("Importante: "), "Alternar materias activas"])
-                        ], className="mb-3"),
-                        
-                        html.H6("🌿 Medidas Culturales:", className="fw-bold mb-2"),
-                        html.Ul([
-                            html.Li("Poda para mejorar ventilación"),
-                            html.Li("Evitar riego por aspersión"),
-                            html.Li("Eliminación de hojas infectadas"),
-                            html.Li("Control de malas hierbas")
-                        ])
-                    ], className="mt-3")
-                ]),
-                
-                # Tab 4: Calendario
-                dbc.Tab(label="📅 Calendario", tab_id="calendar-tab", children=[
-                    html.Div([
-                        html.H5("Calendario de actuaciones", className="text-info mb-3"),
-                        
-                        dbc.Row([
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardHeader([html.H6("🍂 OTOÑO", className="mb-0 text-warning")]),
-                                    dbc.CardBody([
-                                        html.P("• Tratamiento preventivo principal", className="mb-1"),
-                                        html.P("• 2-3 aplicaciones con cobre", className="mb-1"),
-                                        html.P("• Poda de aireación", className="mb-1")
-                                    ])
-                                ])
-                            ], md=3),
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardHeader([html.H6("❄️ INVIERNO", className="mb-0 text-primary")]),
-                                    dbc.CardBody([
-                                        html.P("• Mantener protección cúprica", className="mb-1"),
-                                        html.P("• Limpieza de hojas caídas", className="mb-1"),
-                                        html.P("• Evaluación de daños", className="mb-1")
-                                    ])
-                                ])
-                            ], md=3),
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardHeader([html.H6("🌸 PRIMAVERA", className="mb-0 text-success")]),
-                                    dbc.CardBody([
-                                        html.P("• Evaluación de brotación", className="mb-1"),
-                                        html.P("• Tratamientos según síntomas", className="mb-1"),
-                                        html.P("• Vigilancia intensiva", className="mb-1")
-                                    ])
-                                ])
-                            ], md=3),
-                            dbc.Col([
-                                dbc.Card([
-                                    dbc.CardHeader([html.H6("☀️ VERANO", className="mb-0 text-info")]),
-                                    dbc.CardBody([
-                                        html.P("• Riesgo menor por calor", className="mb-1"),
-                                        html.P("• Preparación campaña", className="mb-1"),
-                                        html.P("• Mantenimiento general", className="mb-1")
-                                    ])
-                                ])
-                            ], md=3)
-                        ])
-                    ], className="mt-3")
-                ])
-            ], id="risk-guide-tabs", active_tab="identify-tab")
+                dbc.Tab(label="🔍 Identificar", tab_id="identify-tab"),
+                dbc.Tab(label="⚠️ Cuándo Actuar", tab_id="risk-tab"),
+                dbc.Tab(label="💊 Tratamientos", tab_id="treatment-tab"),
+                dbc.Tab(label="📅 Calendario", tab_id="calendar-tab")
+            ], id="risk-guide-tabs", active_tab="identify-tab"),
+            html.Div(id="risk-guide-tab-body")
         ], style={'maxHeight': '70vh', 'overflowY': 'auto'}),
         dbc.ModalFooter([
             html.Small("Consulte siempre con su técnico de confianza antes de aplicar tratamientos", 
@@ -564,6 +472,146 @@ def create_risk_guide_modal():
         ])
     ], id="risk-guide-modal", size="xl", is_open=False)
 
+@lru_cache(maxsize=None)
+def create_risk_guide_tab_body(tab_id):
+    """
+    Contenido de una pestaña de la guía de repilo (construido una vez por pestaña)
+    
+    Args:
+        tab_id (str): tab_id de la pestaña activa en "risk-guide-tabs"
+        
+    Returns:
+        html.Div: Contenido de la pestaña (Identificar si el id no existe)
+    """
+    builder = _RISK_GUIDE_TAB_BUILDERS.get(tab_id, _risk_guide_identify_body)
+    return builder()
+
+# Listas estáticas de la guía: un único nodo Markdown por lista en lugar de
+# un subárbol html.Ul/html.Li/html.Strong
+_EARLY_SYMPTOMS_MD = """
+- Manchas circulares amarillentas en hojas
+- Manchas de 2-10mm de diámetro
+- Color que pasa de amarillo a marrón
+- Hojas que se vuelven amarillas y caen
+"""
+
+_ADVANCED_SYMPTOMS_MD = """
+- Defoliación intensa
+- Pérdida de hasta 70% de las hojas
+- Debilitamiento del árbol
+- Reducción de la cosecha
+"""
+
+_PREVENTIVE_TREATMENTS_MD = """
+- **Cobre (oxicloruro/sulfato):** 2-3 g/L - aplicar antes de períodos lluviosos
+- **Mezclas cúpricas:** Alternar formulaciones para evitar resistencias
+- **Momento clave:** Otoño (octubre-noviembre) e invierno
+- **Frecuencia:** Cada 15-20 días en períodos de riesgo
+"""
+
+_CURATIVE_TREATMENTS_MD = """
+- **Triazoles:** En primeras fases de infección
+- **Strobirulinas:** Sistémicos para casos establecidos
+- **Importante:** Alternar materias activas
+"""
+
+_CULTURAL_MEASURES_MD = """
+- Poda para mejorar ventilación
+- Evitar riego por aspersión
+- Eliminación de hojas infectadas
+- Control de malas hierbas
+"""
+
+def _risk_guide_identify_body():
+    """Pestaña Identificar: síntomas iniciales y avanzados"""
+    return html.Div([
+        html.H5("¿Cómo reconocer el repilo?", className="text-primary mb-3"),
+        dbc.Row([
+            dbc.Col([
+                html.H6("Síntomas iniciales:", className="fw-bold mb-2"),
+                dcc.Markdown(_EARLY_SYMPTOMS_MD)
+            ], md=6),
+            dbc.Col([
+                html.H6("Síntomas avanzados:", className="fw-bold mb-2"),
+                dcc.Markdown(_ADVANCED_SYMPTOMS_MD)
+            ], md=6)
+        ])
+    ], className="mt-3")
+
+def _risk_guide_risk_body():
+    """Pestaña Cuándo Actuar: condiciones de riesgo extremo y alto"""
+    return html.Div([
+        html.H5("Condiciones que favorecen el repilo", className="text-danger mb-3"),
+        
+        # Alertas por nivel de riesgo
+        dbc.Alert([
+            html.H6([html.I(className="fas fa-thermometer-three-quarters me-2"), "RIESGO EXTREMO"], className="alert-heading text-white mb-2"),
+            html.P("• Temperatura entre 15-20°C", className="mb-1"),
+            html.P("• Humedad superior al 95%", className="mb-1"),
+            html.P("• Presencia de lluvia o rocío", className="mb-1"),
+            html.Strong("🚨 ACCIÓN INMEDIATA: Aplicar tratamiento preventivo")
+        ], color="danger", className="mb-3"),
+        
+        dbc.Alert([
+            html.H6([html.I(className="fas fa-thermometer-half me-2"), "RIESGO ALTO"], className="alert-heading mb-2"),
+            html.P("• Temperatura entre 12-15°C o 20-22°C", className="mb-1"),
+            html.P("• Humedad entre 85-95%", className="mb-1"),
+            html.P("• Varios días consecutivos húmedos", className="mb-1"),
+            html.Strong("⚠️ VIGILANCIA: Preparar tratamiento si persisten condiciones")
+        ], color="warning", className="mb-3")
+    ], className="mt-3")
+
+def _risk_guide_treatment_body():
+    """Pestaña Tratamientos: preventivos, curativos y medidas culturales"""
+    return html.Div([
+        html.H5("Estrategias de control", className="text-success mb-3"),
+        
+        html.H6("🛡️ Tratamientos Preventivos:", className="fw-bold mb-2"),
+        dcc.Markdown(_PREVENTIVE_TREATMENTS_MD, className="mb-3"),
+        
+        html.H6("🎯 Tratamientos Curativos:", className="fw-bold mb-2"),
+        dcc.Markdown(_CURATIVE_TREATMENTS_MD, className="mb-3"),
+        
+        html.H6("🌿 Medidas Culturales:", className="fw-bold mb-2"),
+        dcc.Markdown(_CULTURAL_MEASURES_MD)
+    ], className="mt-3")
+
+# Actuaciones por estación: (emoji, nombre, clase de color, tareas)
+_SEASONS = (
+    ("🍂", "OTOÑO", "text-warning",
+     ("Tratamiento preventivo principal", "2-3 aplicaciones con cobre", "Poda de aireación")),
+    ("❄️", "INVIERNO", "text-primary",
+     ("Mantener protección cúprica", "Limpieza de hojas caídas", "Evaluación de daños")),
+    ("🌸", "PRIMAVERA", "text-success",
+     ("Evaluación de brotación", "Tratamientos según síntomas", "Vigilancia intensiva")),
+    ("☀️", "VERANO", "text-info",
+     ("Riesgo menor por calor", "Preparación campaña", "Mantenimiento general")),
+)
+
+def _season_card(emoji, name, color_class, tasks):
+    """Columna con la tarjeta de actuaciones de una estación del calendario"""
+    return dbc.Col([
+        dbc.Card([
+            dbc.CardHeader([html.H6(f"{emoji} {name}", className=f"mb-0 {color_class}")]),
+            dbc.CardBody([html.P(f"• {task}", className="mb-1") for task in tasks])
+        ])
+    ], md=3)
+
+def _risk_guide_calendar_body():
+    """Pestaña Calendario: actuaciones por estación"""
+    return html.Div([
+        html.H5("Calendario de actuaciones", className="text-info mb-3"),
+        dbc.Row([_season_card(*season) for season in _SEASONS])
+    ], className="mt-3")
+
+_RISK_GUIDE_TAB_BUILDERS = {
+    "identify-tab": _risk_guide_identify_body,
+    "risk-tab": _risk_guide_risk_body,
+    "treatment-tab": _risk_guide_treatment_body,
+    "calendar-tab": _risk_guide_calendar_body,
+}
+
+@lru_cache(maxsize=1)
 def create_cache_status_modal():
     """Modal con información del estado del caché"""
     return dbc.Modal([
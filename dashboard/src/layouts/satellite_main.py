@@ -1,18 +1,20 @@
 """
 Archivo principal mejorado para el layout de datos satelitales
 Integra layout mejorado con callbacks optimizados
-"""
 
-from src.layouts.layout_datos_satelitales_mejorado import build_scientific_satellite_layout
-from src.callbacks_refactored.datos_satelitales_integrated import register_integrated_callbacks
+Los módulos satelitales se importan al llamar a cada función, no al cargar
+este archivo: quien no abre la vista satelital no paga su importación.
+"""
 
 # Exportar funciones principales
 def create_satellite_layout(*args, **kwargs):
     """Crea el layout mejorado de datos satelitales"""
+    from src.layouts.layout_datos_satelitales_mejorado import build_scientific_satellite_layout
     return build_scientific_satellite_layout(*args, **kwargs)
 
 def register_callbacks(app):
     """Registra todos los callbacks integrados"""
+    from src.callbacks_refactored.datos_satelitales_integrated import register_integrated_callbacks
     return register_integrated_callbacks(app)
 
 # Alias para compatibilidad
@@ -52,6 +52,9 @@ except ImportError:
 STORE_FILE = Path("data/fincas.json")
 STORE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
+# Caché de list_fincas(): (firma del archivo, fincas cargadas)
+_FINCAS_CACHE = (None, [])
+
 # Constantes para cálculos geográficos
 METERS_PER_DEGREE_LAT = 111000  # Metros por grado de latitud (constante)
 SQUARE_METERS_TO_HECTARES = 10000  # Conversión de m² a hectáreas
@@ -247,6 +250,29 @@ def load_fincas() -> List[Dict]:
         print(f"Error inesperado cargando fincas: {type(e).__name__}: {e}")
         return []
 
+def get_store_version() -> str:
+    """
+    Devuelve una firma barata del estado del almacenamiento de fincas.
+    
+    Se basa en la fecha de modificación y el tamaño del archivo, sin leer
+    ni parsear el JSON, por lo que permite detectar cambios en cada tick
+    de refresco con coste despreciable.
+    
+    Returns:
+        str: Firma "mtime_ns-size", o "empty" si el archivo no existe
+        
+    Example:
+        >>> antes = get_store_version()
+        >>> add_finca(name="Olivar Sur", geometry=geom)
+        >>> get_store_version() != antes
+        True
+    """
+    try:
+        stat = STORE_FILE.stat()
+    except OSError:
+        return "empty"
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
 def save_fincas(fincas: List[Dict]) -> None:
     """
     Guarda todas las fincas usando escritura atómica para máxima seguridad.
@@ -555,12 +581,26 @@ def list_fincas() -> List[Dict]:
     """
     Lista todas las fincas almacenadas.
     
-    Wrapper de conveniencia para load_fincas().
+    Wrapper de conveniencia para load_fincas() con caché en memoria
+    compartida por todas las sesiones: el archivo solo se vuelve a leer
+    cuando cambia su firma (get_store_version), de modo que los refrescos
+    de varias pestañas/clientes cuestan un stat() en lugar de un json.load.
     
     Returns:
         List[Dict]: Lista de todas las fincas como features GeoJSON
-    """
-    return load_fincas()
+        
+    Note:
+        Las features devueltas son compartidas y deben tratarse como de
+        solo lectura; para modificar una finca usar get_finca() +
+        update_finca(), que trabajan sobre una copia recién cargada.
+    """
+    global _FINCAS_CACHE
+    version = get_store_version()
+    cached_version, cached_fincas = _FINCAS_CACHE
+    if cached_version != version:
+        cached_fincas = load_fincas()
+        _FINCAS_CACHE = (version, cached_fincas)
+    return list(cached_fincas)
 
 def get_fincas_by_crop_type(crop_type: str) -> List[Dict]:
     """
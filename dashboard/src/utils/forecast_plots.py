@@ -26,6 +26,8 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from src.utils.simplified_plots import MAX_POINTS_PER_TRACE, _lttb_indices, _minmax_indices
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -378,6 +380,31 @@ def create_weekly_forecast_chart(forecast_data: pd.DataFrame) -> go.Figure:
     
     return fig
 
+def _thin_hourly(hourly_data: pd.DataFrame, column: str, line: bool = True) -> pd.DataFrame:
+    """
+    Filas de la predicción horaria necesarias para dibujar `column` con a lo
+    sumo ~MAX_POINTS_PER_TRACE puntos.
+    
+    Las predicciones horarias no llegan a ese límite, pero con series más
+    densas (sub-horarias o de más días) el navegador solo recibe una versión
+    reducida: LTTB para las líneas y mínimo/máximo por tramo para las barras.
+    
+    Args:
+        hourly_data (pd.DataFrame): Predicción con columna 'datetime' ordenada
+        column (str): Columna a dibujar
+        line (bool): True si la serie se dibuja como línea
+        
+    Returns:
+        pd.DataFrame: Subconjunto de filas a dibujar
+    """
+    if len(hourly_data) <= MAX_POINTS_PER_TRACE:
+        return hourly_data
+    values = hourly_data[column].to_numpy()
+    if line:
+        x = hourly_data['datetime'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        return hourly_data.iloc[_lttb_indices(x, values, MAX_POINTS_PER_TRACE)]
+    return hourly_data.iloc[_minmax_indices(values, MAX_POINTS_PER_TRACE)]
+
 def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     """
     Crea gráfico avanzado de predicción meteorológica 48 horas con análisis de repilo.
@@ -426,6 +453,11 @@ def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     if hourly_data.empty:
         return create_empty_forecast_chart("No hay datos de predicción horaria disponibles")
     
+    # Series a dibujar, reducidas en servidor si superan MAX_POINTS_PER_TRACE
+    temp_data = _thin_hourly(hourly_data, 'temperature')
+    humidity_data = _thin_hourly(hourly_data, 'humidity')
+    rain_data = _thin_hourly(hourly_data, 'rain', line=False)
+    
     # Crear subplot con múltiples ejes - Estilo visual mejorado
     fig = make_subplots(
         rows=2, cols=1,
@@ -508,8 +540,8 @@ def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     # Línea de temperatura - Diseño elegante y moderno
     fig.add_trace(
         go.Scatter(
-            x=hourly_data['datetime'],
-            y=hourly_data['temperature'],
+            x=temp_data['datetime'],
+            y=temp_data['temperature'],
             mode='lines+markers',
             name='🌡️ Temperatura',
             line=dict(
@@ -534,7 +566,7 @@ def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     )
     
     # Resaltar períodos críticos con marcadores MÁS DESTACADOS
-    critical_temp = hourly_data[(hourly_data['temperature'] >= 15) & (hourly_data['temperature'] <= 20)]
+    critical_temp = temp_data[(temp_data['temperature'] >= 15) & (temp_data['temperature'] <= 20)]
     if not critical_temp.empty:
         fig.add_trace(
             go.Scatter(
@@ -585,11 +617,11 @@ def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     # Precipitación como barras elegantes - EJE SECUNDARIO  
     fig.add_trace(
         go.Bar(
-            x=hourly_data['datetime'],
-            y=hourly_data['rain'],
+            x=rain_data['datetime'],
+            y=rain_data['rain'],
             name="☔ Precipitación",
             marker=dict(
-                color=hourly_data['rain'],
+                color=rain_data['rain'],
                 colorscale=[
                     [0, 'rgba(59, 130, 246, 0.3)'],
                     [0.5, 'rgba(59, 130, 246, 0.6)'],
@@ -611,8 +643,8 @@ def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     # Humedad como línea suave - EJE PRINCIPAL
     fig.add_trace(
         go.Scatter(
-            x=hourly_data['datetime'],
-            y=hourly_data['humidity'],
+            x=humidity_data['datetime'],
+            y=humidity_data['humidity'],
             mode='lines+markers',
             name='💧 Humedad Relativa',
             line=dict(
@@ -637,7 +669,7 @@ def create_48h_forecast_chart(hourly_data: pd.DataFrame) -> go.Figure:
     )
     
     # Resaltar períodos críticos de humedad con marcadores MÁS DESTACADOS
-    critical_humidity = hourly_data[hourly_data['humidity'] > 95]
+    critical_humidity = humidity_data[humidity_data['humidity'] > 95]
     if not critical_humidity.empty:
         fig.add_trace(
             go.Scatter(
@@ -8,6 +8,9 @@ Funcionalidades:
 - Precipitación (histograma) + Humedad (líneas) con zonas de riesgo
 - Temperatura (min, media, máx) con zonas de riesgo
 
+Las series de datos usan trazas WebGL (Scattergl), que escalan a decenas de
+miles de puntos; las bandas de riesgo (relleno "toself") siguen en SVG.
+
 Autor: Sistema de Monitoreo Agrícola
 Fecha: 2024
 """
@@ -21,6 +24,113 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Máximo de puntos por traza enviados al navegador; por encima se reduce la
+# serie en el servidor: las líneas con LTTB (conserva la forma visual) y las
+# barras/marcadores conservando el mínimo y el máximo de cada tramo
+MAX_POINTS_PER_TRACE = 2000
+
+def _minmax_indices(values, n_out: int) -> np.ndarray:
+    """
+    Índices de una serie reducida a ~n_out puntos conservando sus extremos.
+    
+    Divide la serie en n_out/2 tramos consecutivos y se queda con la posición
+    del mínimo y del máximo de cada uno, de modo que los picos (humedad > 95%,
+    lluvias intensas, temperaturas críticas) nunca desaparecen del gráfico.
+    
+    Args:
+        values: Valores de la serie (array-like numérico)
+        n_out: Número máximo aproximado de puntos a conservar
+        
+    Returns:
+        Índices posicionales ordenados de los puntos a conservar
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    
+    edges = np.linspace(0, n, n_out // 2 + 1, dtype=int)
+    lo = np.where(np.isnan(y), np.inf, y)
+    hi = np.where(np.isnan(y), -np.inf, y)
+    keep = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            keep.append(start + np.argmin(lo[start:end]))
+            keep.append(start + np.argmax(hi[start:end]))
+    return np.unique(keep)
+
+def _lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Índices de una serie reducida a n_out puntos con Largest-Triangle-Three-Buckets.
+    
+    Conserva el primer y el último punto y, de cada tramo intermedio, el que
+    forma el triángulo de mayor área con el punto elegido en el tramo anterior
+    y la media del siguiente: la línea resultante mantiene la forma visual de
+    la original con una fracción de los puntos.
+    
+    Args:
+        x: Eje X numérico (p. ej. fechas en ns) ordenado ascendentemente
+        y: Valores de la serie
+        n_out: Número de puntos a conservar (>= 3)
+        
+    Returns:
+        Índices posicionales ordenados de los puntos a conservar
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # n_out - 2 tramos entre el primer y el último punto
+    edges = np.linspace(1, n - 1, n_out - 1, dtype=int)
+    nan_y = np.isnan(y)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        
+        # Vértice "C": media del tramo siguiente (ignorando huecos)
+        next_valid = ~nan_y[end:next_end]
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end][next_valid].mean() if next_valid.any() else y[a]
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        keep[i + 1] = a
+    return keep
+
+def _thin(df: pd.DataFrame, column: str, n_out: int = MAX_POINTS_PER_TRACE) -> pd.DataFrame:
+    """Filas de df necesarias para dibujar `column` con a lo sumo ~n_out puntos"""
+    if len(df) <= n_out:
+        return df
+    return df.iloc[_minmax_indices(df[column].to_numpy(), n_out)]
+
+def _thin_line(df: pd.DataFrame, column: str, n_out: int = MAX_POINTS_PER_TRACE) -> pd.DataFrame:
+    """Como _thin, pero con LTTB: para series dibujadas como líneas"""
+    if len(df) <= n_out:
+        return df
+    x = df['Dates'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    return df.iloc[_lttb_indices(x, df[column].to_numpy(), n_out)]
+
+def _dates(df: pd.DataFrame) -> np.ndarray:
+    """
+    Eje temporal como array datetime64[ns] para pasar a `x=`.
+    
+    Plotly serializa un array NumPy tipado directamente, sin recorrer los
+    Timestamp de una Serie. Las fechas con zona horaria se pasan a hora local
+    sin tz, que es lo que Plotly.js muestra en cualquier caso.
+    """
+    dates = df['Dates']
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.to_numpy(dtype='datetime64[ns]')
+
 def create_precipitation_humidity_chart(df: pd.DataFrame) -> go.Figure:
     """
     Crea gráfico combinado de precipitación y humedad con zonas de riesgo - Estilo Premium.
@@ -63,14 +173,18 @@ def create_precipitation_humidity_chart(df: pd.DataFrame) -> go.Figure:
             secondary_y=True
         )
     
+    # Series reducidas en servidor si superan MAX_POINTS_PER_TRACE
+    rain_df = _thin(df, 'Rain')
+    humidity_df = _thin_line(df, 'Air_Relat_Hum')
+    
     # Precipitación como barras elegantes
     fig.add_trace(
         go.Bar(
-            x=df['Dates'],
-            y=df['Rain'],
+            x=_dates(rain_df),
+            y=rain_df['Rain'],
             name="☔ Precipitación",
             marker=dict(
-                color=df['Rain'],
+                color=rain_df['Rain'],
                 colorscale=[
                     [0, 'rgba(59, 130, 246, 0.3)'],
                     [0.5, 'rgba(59, 130, 246, 0.6)'],
@@ -89,16 +203,14 @@ def create_precipitation_humidity_chart(df: pd.DataFrame) -> go.Figure:
     
     # Humedad como línea suave
     fig.add_trace(
-        go.Scatter(
-            x=df['Dates'],
-            y=df['Air_Relat_Hum'],
+        go.Scattergl(
+            x=_dates(humidity_df),
+            y=humidity_df['Air_Relat_Hum'],
             mode='lines+markers',
             name='💧 Humedad Relativa',
             line=dict(
                 color='#0ea5e9',
-                width=3,
-                shape='spline',
-                smoothing=0.8
+                width=3
             ),
             marker=dict(
                 size=4,
@@ -115,11 +227,11 @@ def create_precipitation_humidity_chart(df: pd.DataFrame) -> go.Figure:
     )
     
     # Resaltar períodos críticos de humedad con marcadores destacados
-    critical_humidity = df[df['Air_Relat_Hum'] > 95]
+    critical_humidity = _thin(df[df['Air_Relat_Hum'] > 95], 'Air_Relat_Hum')
     if not critical_humidity.empty:
         fig.add_trace(
-            go.Scatter(
-                x=critical_humidity['Dates'],
+            go.Scattergl(
+                x=_dates(critical_humidity),
                 y=critical_humidity['Air_Relat_Hum'],
                 mode='markers',
                 name='💧 Humedad Crítica',
@@ -174,6 +286,7 @@ def create_precipitation_humidity_chart(df: pd.DataFrame) -> go.Figure:
     # Layout premium
     fig.update_layout(
         template="plotly_white",
+        uirevision="historico",  # conserva zoom/pan y el contexto WebGL entre actualizaciones
         hovermode='x unified',
         height=400,
         showlegend=True,
@@ -261,39 +374,43 @@ def create_temperature_chart(df: pd.DataFrame, is_aggregated: bool = False) -> g
         )
     
     if is_aggregated and 'Air_Temp_min' in df.columns:
+        min_df = _thin_line(df, 'Air_Temp_min')
+        mean_df = _thin_line(df, 'Air_Temp_mean')
+        max_df = _thin_line(df, 'Air_Temp_max')
         fig.add_trace(
-            go.Scatter(
-                x=df['Dates'], y=df['Air_Temp_min'],
+            go.Scattergl(
+                x=_dates(min_df), y=min_df['Air_Temp_min'],
                 mode='lines+markers', name='🌡️ Temp. Mínima',
-                line=dict(color='#3b82f6', width=2, dash='dash', shape='spline', smoothing=0.8),
+                line=dict(color='#3b82f6', width=2, dash='dash'),
                 marker=dict(size=4, color='#3b82f6', line=dict(color='white', width=1), symbol='circle'),
                 hovertemplate="<b>🌡️ Temperatura Mínima</b><br>%{x|%d/%m/%Y}<br><b>%{y:.1f}°C</b><br><extra></extra>"
             )
         )
         fig.add_trace(
-            go.Scatter(
-                x=df['Dates'], y=df['Air_Temp_mean'],
+            go.Scattergl(
+                x=_dates(mean_df), y=mean_df['Air_Temp_mean'],
                 mode='lines+markers', name='🌡️ Temp. Media',
-                line=dict(color='#dc2626', width=3, shape='spline', smoothing=0.8),
+                line=dict(color='#dc2626', width=3),
                 marker=dict(size=6, color='#dc2626', line=dict(color='white', width=1), symbol='circle'),
                 hovertemplate="<b>🌡️ Temperatura Media</b><br>%{x|%d/%m/%Y}<br><b>%{y:.1f}°C</b><br><extra></extra>"
             )
         )
         fig.add_trace(
-            go.Scatter(
-                x=df['Dates'], y=df['Air_Temp_max'],
+            go.Scattergl(
+                x=_dates(max_df), y=max_df['Air_Temp_max'],
                 mode='lines+markers', name='🌡️ Temp. Máxima',
-                line=dict(color='#f59e0b', width=2, dash='dash', shape='spline', smoothing=0.8),
+                line=dict(color='#f59e0b', width=2, dash='dash'),
                 marker=dict(size=4, color='#f59e0b', line=dict(color='white', width=1), symbol='circle'),
                 hovertemplate="<b>🌡️ Temperatura Máxima</b><br>%{x|%d/%m/%Y}<br><b>%{y:.1f}°C</b><br><extra></extra>"
             )
         )
     else:
+        temp_df = _thin_line(df, 'Air_Temp')
         fig.add_trace(
-            go.Scatter(
-                x=df['Dates'], y=df['Air_Temp'],
+            go.Scattergl(
+                x=_dates(temp_df), y=temp_df['Air_Temp'],
                 mode='lines+markers', name='🌡️ Temperatura',
-                line=dict(color='#dc2626', width=3, shape='spline', smoothing=0.8),
+                line=dict(color='#dc2626', width=3),
                 marker=dict(size=5, color='#dc2626', line=dict(color='white', width=1), symbol='circle'),
                 hovertemplate="<b>🌡️ Temperatura</b><br>%{x|%d/%m/%Y %H:%M}<br><b>%{y:.1f}°C</b><br><extra></extra>"
             )
@@ -302,11 +419,11 @@ def create_temperature_chart(df: pd.DataFrame, is_aggregated: bool = False) -> g
     # Marcadores críticos
     temp_col = 'Air_Temp_mean' if is_aggregated else 'Air_Temp'
     if temp_col in df.columns:
-        critical_temp = df[(df[temp_col] >= 15) & (df[temp_col] <= 20)]
+        critical_temp = _thin(df[(df[temp_col] >= 15) & (df[temp_col] <= 20)], temp_col)
         if not critical_temp.empty:
             fig.add_trace(
-                go.Scatter(
-                    x=critical_temp['Dates'], y=critical_temp[temp_col],
+                go.Scattergl(
+                    x=_dates(critical_temp), y=critical_temp[temp_col],
                     mode='markers', name='🔥 Temperatura Crítica',
                     marker=dict(color='#dc2626', size=12, symbol='diamond-wide',
                                 line=dict(color='white', width=3), opacity=1),
@@ -317,6 +434,7 @@ def create_temperature_chart(df: pd.DataFrame, is_aggregated: bool = False) -> g
     # Layout premium
     fig.update_layout(
         template="plotly_white",
+        uirevision="historico",  # conserva zoom/pan y el contexto WebGL entre actualizaciones
         hovermode='x unified',
         height=400,
         showlegend=True,
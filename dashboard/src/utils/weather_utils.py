@@ -43,6 +43,7 @@ import logging
 import os
 import time
 import unicodedata
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 # Librerías de terceros
@@ -180,12 +181,15 @@ if not AEMET_API_KEY:
     except FileNotFoundError:
         AEMET_API_KEY = None
 
+@lru_cache(maxsize=8192)
 def normalizar(texto: str) -> str:
     """
     Normaliza texto removiendo acentos y convirtiéndolo a minúsculas.
     
     Utilizada para comparaciones de nombres de municipios que deben ser
-    insensibles a acentos y mayúsculas/minúsculas.
+    insensibles a acentos y mayúsculas/minúsculas. Memoizada: el diccionario
+    de municipios se normaliza entero en cada búsqueda de código INE y los
+    nombres se repiten entre llamadas (caben todos en la caché).
     
     Args:
         texto: Texto a normalizar